@@ -249,8 +249,8 @@ CREATE TABLE IF NOT EXISTS narrative_events (
 );
 
 CREATE INDEX IF NOT EXISTS idx_posts_timestamp ON posts(timestamp);
-CREATE INDEX IF NOT EXISTS idx_posts_subreddit ON posts(subreddit);
-CREATE INDEX IF NOT EXISTS idx_comments_post_id ON comments(post_id);
+CREATE INDEX IF NOT EXISTS idx_posts_sub_ts_id ON posts(subreddit, timestamp DESC, id);
+CREATE INDEX IF NOT EXISTS idx_comments_post_ts_id ON comments(post_id, timestamp DESC, id);
 CREATE INDEX IF NOT EXISTS idx_comments_timestamp ON comments(timestamp);
 CREATE INDEX IF NOT EXISTS idx_preprocessed_filtered ON preprocessed(is_filtered);
 CREATE INDEX IF NOT EXISTS idx_sentiment_label ON sentiment_predictions(label);
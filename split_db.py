@@ -153,6 +153,13 @@ conn.execute("VACUUM")
 conn.commit()
 print("  VACUUM complete.\n")
 
+# VACUUM can renumber posts rowids, which the keyword search index is keyed on
+if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'posts_fts'").fetchone():
+    conn.execute("DELETE FROM posts_fts")
+    conn.execute("INSERT INTO posts_fts (rowid, title, content) SELECT rowid, title, content FROM posts")
+    conn.commit()
+    print("  Keyword search index rebuilt.\n")
+
 # ── Step 6: Final verification ───────────────────────────────────────────────
 cur = conn.cursor()
 
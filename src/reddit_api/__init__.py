@@ -30,13 +30,15 @@ Usage:
     storage.store_posts(posts)
 """
 
-from .client import RateLimitedRedditClient, CircuitBreakerState
+from .client import RateLimitedRedditClient, CircuitBreakerState, create_reddit_client
 from .collector import RedditDataCollector
 from .models import (
     RedditConfig, 
     RedditPost, 
     RedditComment, 
     ContentType, 
+    CONTENT_TYPE_POST,
+    CONTENT_TYPE_COMMENT,
     APIUsageMetrics
 )
 from .storage import RedditDataStorage
@@ -61,6 +63,8 @@ __all__ = [
     "RedditPost", 
     "RedditComment",
     "ContentType",
+    "CONTENT_TYPE_POST",
+    "CONTENT_TYPE_COMMENT",
     "APIUsageMetrics",
     
     # Client classes
@@ -71,6 +75,7 @@ __all__ = [
     
     # Utility functions
     "create_config_from_env",
+    "create_reddit_client",
     "test_reddit_connection", 
     "collect_reddit_data",
     "quick_test",
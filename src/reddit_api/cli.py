@@ -9,13 +9,17 @@ import argparse
 import sys
 from pathlib import Path
 
-from .main import create_config_from_env, test_reddit_connection, collect_reddit_data, quick_test
+from .main import (
+    _configure_logging, create_config_from_env, test_reddit_connection, collect_reddit_data, quick_test
+)
 from .storage import RedditDataStorage
 from .historical import TimeFrame, collect_historical_data
 
 
 def main():
     """Main CLI entry point"""
+    _configure_logging()
+    
     parser = argparse.ArgumentParser(
         description="Reddit API Data Collection Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
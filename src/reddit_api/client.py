@@ -9,15 +9,74 @@ import time
 from collections import deque
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-import praw
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .exceptions import RedditAPIError
 from .models import RedditConfig
 
+if TYPE_CHECKING:
+    import praw
+
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _orjson_response_hook(response, *args, **kwargs):
+    """Decode Reddit's JSON listings with orjson when prawcore calls response.json()."""
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+
+def _build_requests_session() -> requests.Session:
+    """Build the pooled, keep-alive HTTP session PRAW uses for API requests."""
+    session = requests.Session()
+    # Only connection failures are retried here; HTTP status retries and rate
+    # limiting stay with prawcore and RateLimitedRedditClient.make_request
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=Retry(total=5, read=0, status=0, backoff_factor=0.5)
+    )
+    session.mount('https://', adapter)
+    if orjson is not None:
+        session.hooks['response'].append(_orjson_response_hook)
+    return session
+
+
+def create_reddit_client(config: RedditConfig) -> 'praw.Reddit':
+    """
+    Create a read-only PRAW instance backed by a pooled HTTP session.
+    
+    Build one per process and pass it to the collectors so every request
+    reuses the same connections instead of repeating TCP/TLS handshakes.
+    
+    Args:
+        config: Reddit configuration containing API credentials
+        
+    Returns:
+        praw.Reddit instance
+    """
+    # praw (with prawcore and websocket-client) is only imported once a client
+    # is actually needed, keeping it out of plain library imports
+    import praw
+    
+    # Intentionally NOT including username/password for read-only access;
+    # this avoids invalid_grant errors by using client credentials only
+    return praw.Reddit(
+        client_id=config.client_id,
+        client_secret=config.client_secret,
+        user_agent=config.user_agent,
+        requestor_kwargs={'session': _build_requests_session()}
+    )
+
 
 class CircuitBreakerState(Enum):
     """Circuit breaker state enumeration"""
@@ -37,12 +96,13 @@ class RateLimitedRedditClient:
     - Request timing and metrics tracking
     """
     
-    def __init__(self, config: RedditConfig):
+    def __init__(self, config: RedditConfig, reddit: Optional['praw.Reddit'] = None):
         """
         Initialize the rate-limited Reddit client.
         
         Args:
             config: Reddit configuration containing API credentials and limits
+            reddit: Optional shared PRAW instance (see create_reddit_client)
         """
         self.config = config
         self.circuit_state = CircuitBreakerState.CLOSED
@@ -53,13 +113,7 @@ class RateLimitedRedditClient:
         self.requests_failed = 0
         
         # Initialize Reddit client in read-only mode
-        # This avoids invalid_grant errors by using client credentials only
-        self.reddit = praw.Reddit(
-            client_id=config.client_id,
-            client_secret=config.client_secret,
-            user_agent=config.user_agent
-            # Note: Intentionally NOT including username/password for read-only access
-        )
+        self.reddit = reddit if reddit is not None else create_reddit_client(config)
         
         logger.info("Reddit client initialized in read-only mode")
     
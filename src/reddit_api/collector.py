@@ -7,10 +7,10 @@ Handles collection of posts and comments from Reddit with filtering and processi
 import logging
 import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from .client import RateLimitedRedditClient
-from .models import RedditConfig, RedditPost, RedditComment
+from .models import RedditConfig, RedditPost, RedditComment, CONTENT_TYPE_POST, CONTENT_TYPE_COMMENT
 
 logger = logging.getLogger(__name__)
 
@@ -26,17 +26,23 @@ class RedditDataCollector:
     - Handles API errors gracefully
     """
 
-    def __init__(self, config: RedditConfig, storage=None):
+    def __init__(self, config: RedditConfig, storage=None, reddit=None,
+                 seen_ids: Optional[Set[str]] = None):
         """
         Initialize the data collector.
 
         Args:
             config: Reddit configuration
             storage: Optional RedditDataStorage instance for pre-filtering
+            reddit: Optional shared praw.Reddit instance to reuse its HTTP session
+            seen_ids: Optional preloaded post IDs to skip (see
+                RedditDataStorage.load_recent_post_ids); replaces the
+                per-subreddit pre-filtering query and grows as posts are collected
         """
         self.config = config
-        self.client = RateLimitedRedditClient(config)
+        self.client = RateLimitedRedditClient(config, reddit=reddit)
         self.storage = storage
+        self.seen_ids = seen_ids
         self.collected_posts = []
         self.collected_comments = []
 
@@ -138,7 +144,9 @@ class RedditDataCollector:
         """
         # Get existing post IDs for pre-filtering efficiency
         existing_post_ids = set()
-        if use_pre_filtering and self.storage:
+        if use_pre_filtering and self.seen_ids is not None:
+            existing_post_ids = self.seen_ids
+        elif use_pre_filtering and self.storage:
             existing_post_ids = self.storage.get_existing_post_ids(subreddit_name, days_back=7)
             logger.info(f"Pre-filtering enabled: {len(existing_post_ids)} existing posts in last 7 days")
 
@@ -191,6 +199,8 @@ class RedditDataCollector:
                         break
 
             self.collected_posts.extend(posts)
+            if self.seen_ids is not None:
+                self.seen_ids.update(post.id for post in posts)
 
             efficiency_msg = f"Successfully collected {len(posts)} posts from r/{subreddit_name}"
             if use_pre_filtering:
@@ -203,6 +213,67 @@ class RedditDataCollector:
             logger.error(f"Failed to collect posts from r/{subreddit_name}: {e}")
             return []
 
+    def iter_subreddit_posts(self, subreddit_name: str, sort: str = 'new',
+                             time_filter: str = 'day', page_size: int = 100,
+                             max_posts: int = 1000,
+                             skip_ids: Optional[Set[str]] = None) -> Iterator[RedditPost]:
+        """
+        Lazily yield posts from a subreddit one listing page at a time.
+
+        Each page is a single rate-limited request, so a consumer that stops
+        iterating early never triggers requests for later pages. No keyword
+        filtering is applied here; callers filter as they consume.
+
+        Args:
+            subreddit_name: Name of the subreddit (without r/)
+            sort: Sorting method ('hot', 'new', 'top', 'rising')
+            time_filter: Time filter for top posts ('day', 'week', 'month', 'year', 'all')
+            page_size: Number of submissions requested per page (Reddit caps this at 100)
+            max_posts: Maximum number of submissions to page through
+            skip_ids: Post IDs to skip without extracting
+
+        Yields:
+            RedditPost objects in listing order
+        """
+        skip_ids = skip_ids or set()
+        seen_ids = self.seen_ids if self.seen_ids is not None else set()
+        after = None
+        fetched = 0
+
+        def _get_page(page_limit: int, after_fullname: Optional[str]):
+            subreddit = self.client.reddit.subreddit(subreddit_name)
+            params = {'after': after_fullname} if after_fullname else {}
+
+            if sort == 'new':
+                listing = subreddit.new(limit=page_limit, params=params)
+            elif sort == 'top':
+                listing = subreddit.top(time_filter=time_filter, limit=page_limit, params=params)
+            elif sort == 'rising':
+                listing = subreddit.rising(limit=page_limit, params=params)
+            else:
+                listing = subreddit.hot(limit=page_limit, params=params)
+            return list(listing)
+
+        while fetched < max_posts:
+            page_limit = min(page_size, max_posts - fetched)
+            submissions = self.client.make_request(_get_page, page_limit, after)
+            if not submissions:
+                return
+
+            fetched += len(submissions)
+            after = submissions[-1].fullname
+
+            for submission in submissions:
+                if submission.id in skip_ids or submission.id in seen_ids:
+                    continue
+                post_data = self._extract_post_data(submission)
+                if post_data:
+                    yield post_data
+
+            # A short page means the listing is exhausted
+            if len(submissions) < page_limit:
+                return
+
     def collect_post_comments(self, post_id: str, limit: int = 20,
                               use_pre_filtering: bool = True) -> List[RedditComment]:
         """
@@ -271,33 +342,35 @@ class RedditDataCollector:
             logger.error(f"Failed to collect comments from post {post_id}: {e}")
             return []
 
-    def collect_all_data(self, posts_per_subreddit: int = 5, comments_per_post: int = 10) -> Dict:
+    def iter_all_data(self, posts_per_subreddit: int = 5,
+                      comments_per_post: int = 10) -> Iterator[Tuple[str, object]]:
         """
-        Collect data from all target subreddits.
+        Lazily collect data from all target subreddits.
+
+        Yields each item as soon as it is collected, so callers can write to
+        storage in fixed-size batches instead of holding the whole run in memory.
 
         Args:
             posts_per_subreddit: Number of posts to collect per subreddit
             comments_per_post: Number of comments to collect per post
 
-        Returns:
-            Dictionary containing collected data and metrics
+        Yields:
+            ('post', RedditPost) and ('comment', RedditComment) tuples
         """
         logger.info(f"Starting data collection from {len(self.config.target_subreddits)} subreddits")
 
-        all_posts = []
-        all_comments = []
-
         for subreddit in self.config.target_subreddits:
             try:
                 # Collect posts
                 posts = self.collect_subreddit_posts(subreddit, limit=posts_per_subreddit)
-                all_posts.extend(posts)
+                for post in posts:
+                    yield CONTENT_TYPE_POST, post
 
                 # Collect comments for each post if requested
                 if comments_per_post > 0:
                     for post in posts:
-                        comments = self.collect_post_comments(post.id, limit=comments_per_post)
-                        all_comments.extend(comments)
+                        for comment in self.collect_post_comments(post.id, limit=comments_per_post):
+                            yield CONTENT_TYPE_COMMENT, comment
 
                         # Small delay between post comment collections
                         time.sleep(self.config.base_delay * 0.5)
@@ -309,6 +382,23 @@ class RedditDataCollector:
                 logger.error(f"Error collecting data from r/{subreddit}: {e}")
                 continue
 
+    def collect_all_data(self, posts_per_subreddit: int = 5, comments_per_post: int = 10) -> Dict:
+        """
+        Collect data from all target subreddits.
+
+        Args:
+            posts_per_subreddit: Number of posts to collect per subreddit
+            comments_per_post: Number of comments to collect per post
+
+        Returns:
+            Dictionary containing collected data and metrics
+        """
+        all_posts = []
+        all_comments = []
+
+        for kind, item in self.iter_all_data(posts_per_subreddit, comments_per_post):
+            (all_posts if kind == CONTENT_TYPE_POST else all_comments).append(item)
+
         results = {
             'posts': all_posts,
             'comments': all_comments,
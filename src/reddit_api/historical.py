@@ -7,8 +7,10 @@ with user-specified time frames, enhanced rate limiting, and progress tracking.
 
 import logging
 import time
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 
 from .client import RateLimitedRedditClient
@@ -19,6 +21,12 @@ from .storage import RedditDataStorage
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 date string (Python 3.11+ accepts a trailing 'Z' directly)."""
+    return datetime.fromisoformat(value)
+
+
 @dataclass
 class TimeFrame:
     """Represents a time frame for historical data collection."""
@@ -26,7 +34,14 @@ class TimeFrame:
     end_date: datetime
     
     def __post_init__(self):
-        """Validate time frame."""
+        """Normalize and validate time frame."""
+        # Collected post timestamps and stored rows are naive local time, so
+        # aware bounds (e.g. 'Z'-suffixed strings) are converted to match
+        if self.start_date.tzinfo is not None:
+            self.start_date = self.start_date.astimezone().replace(tzinfo=None)
+        if self.end_date.tzinfo is not None:
+            self.end_date = self.end_date.astimezone().replace(tzinfo=None)
+        
         if self.start_date >= self.end_date:
             raise ValueError("Start date must be before end date")
         
@@ -37,8 +52,8 @@ class TimeFrame:
     def from_strings(cls, start_str: str, end_str: str) -> 'TimeFrame':
         """Create TimeFrame from string dates."""
         try:
-            start_date = datetime.fromisoformat(start_str.replace('Z', '+00:00'))
-            end_date = datetime.fromisoformat(end_str.replace('Z', '+00:00'))
+            start_date = _parse_iso(start_str)
+            end_date = _parse_iso(end_str)
             return cls(start_date, end_date)
         except ValueError as e:
             raise ValueError(f"Invalid date format. Use ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS): {e}")
@@ -80,16 +95,19 @@ class HistoricalCollectionProgress:
     errors_encountered: int = 0
     start_time: datetime = field(default_factory=datetime.now)
     last_update: datetime = field(default_factory=datetime.now)
+    # Elapsed time comes from the monotonic clock; the datetimes above are for display
+    _start_monotonic: float = field(default_factory=time.monotonic, init=False, repr=False)
     
-    def update_progress(self, chunk_complete: bool = False, posts: int = 0, comments: int = 0, errors: int = 0):
-        """Update collection progress."""
+    def update_progress(self, chunk_complete: bool = False, posts: int = 0, comments: int = 0, errors: int = 0,
+                        now: Optional[datetime] = None):
+        """Update collection progress, optionally with a wall-clock time the caller already has."""
         if chunk_complete:
             self.completed_chunks += 1
         
         self.posts_collected += posts
         self.comments_collected += comments
         self.errors_encountered += errors
-        self.last_update = datetime.now()
+        self.last_update = now or datetime.now()
     
     def get_completion_percentage(self) -> float:
         """Get completion percentage."""
@@ -102,8 +120,8 @@ class HistoricalCollectionProgress:
         if self.completed_chunks == 0:
             return None
         
-        elapsed = datetime.now() - self.start_time
-        avg_time_per_chunk = elapsed.total_seconds() / self.completed_chunks
+        elapsed_s = time.monotonic() - self._start_monotonic
+        avg_time_per_chunk = elapsed_s / self.completed_chunks
         remaining_chunks = self.total_chunks - self.completed_chunks
         
         if remaining_chunks <= 0:
@@ -112,6 +130,53 @@ class HistoricalCollectionProgress:
         return (remaining_chunks * avg_time_per_chunk) / 60
 
 
+@dataclass(slots=True)
+class ChunkResult:
+    """Counts and errors from collecting a single time chunk."""
+    posts_collected: int = 0
+    comments_collected: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class HistoricalResult:
+    """Accumulated results of a historical collection run."""
+    time_frame: TimeFrame
+    success: bool = True
+    chunks_processed: int = 0
+    chunks_skipped: int = 0
+    posts_collected: int = 0
+    comments_collected: int = 0
+    errors: List[str] = field(default_factory=list)
+    start_time: datetime = field(default_factory=datetime.now)
+    end_time: Optional[datetime] = None
+    error: Optional[str] = None
+    deduplication_stats: Optional[Dict[str, int]] = None
+    deduplication_error: Optional[str] = None
+    
+    def to_dict(self) -> Dict:
+        """Convert to the results dictionary returned to callers."""
+        results = {
+            'success': self.success,
+            'time_frame': self.time_frame,
+            'chunks_processed': self.chunks_processed,
+            'chunks_skipped': self.chunks_skipped,
+            'posts_collected': self.posts_collected,
+            'comments_collected': self.comments_collected,
+            'errors': self.errors,
+            'start_time': self.start_time,
+            'end_time': self.end_time
+        }
+        # Optional keys are only present when set; callers test for them with .get()
+        if self.error is not None:
+            results['error'] = self.error
+        if self.deduplication_stats is not None:
+            results['deduplication_stats'] = self.deduplication_stats
+        if self.deduplication_error is not None:
+            results['deduplication_error'] = self.deduplication_error
+        return results
+
+
 class HistoricalRedditCollector:
     """
     Historical Reddit data collector with time frame support and enhanced rate limiting.
@@ -142,6 +207,13 @@ class HistoricalRedditCollector:
         self.max_delay = 300.0  # Maximum delay (5 minutes)
         self.backoff_multiplier = 2.0
         self.current_delay = self.base_delay
+        self._just_backed_off = False
+        
+        # Sparse-subreddit skipping: after this many consecutive empty chunks a
+        # subreddit is skipped for windows older than the recent cutoff
+        self.empty_streak_limit = 2
+        self.empty_skip_recent_days = 14
+        self._empty_streak: Dict[str, int] = defaultdict(int)
         
         logger.info("Historical Reddit collector initialized")
     
@@ -170,9 +242,11 @@ class HistoricalRedditCollector:
         Returns:
             Dictionary with collection results and statistics
         """
-        # Use config defaults if not specified
-        subreddits = subreddits or self.config.target_subreddits
+        # Use config defaults if not specified; repeated subreddits are collected once
+        subreddits = tuple(dict.fromkeys(subreddits or self.config.target_subreddits))
         keywords = keywords or self.config.target_keywords
+        # Casefolded once per run so chunks pass them around already folded
+        folded_keywords = tuple(keyword.casefold() for keyword in keywords)
         
         logger.info(f"Starting historical collection for {time_frame.duration_days()} days")
         logger.info(f"Time frame: {time_frame.start_date} to {time_frame.end_date}")
@@ -183,41 +257,56 @@ class HistoricalRedditCollector:
         chunks = time_frame.split_into_chunks(chunk_days)
         self.progress.total_chunks = len(chunks)
         
+        # (subreddit, chunk_start, chunk_end) triples finished by earlier runs
+        completed = set()
+        if resume_from_checkpoint:
+            try:
+                completed = self.storage.completed_chunks()
+            except Exception as e:
+                logger.warning(f"Could not load historical checkpoints: {e}")
+        
         logger.info(f"Processing {len(chunks)} time chunks of ~{chunk_days} days each")
         
-        results = {
-            'success': True,
-            'time_frame': time_frame,
-            'chunks_processed': 0,
-            'posts_collected': 0,
-            'comments_collected': 0,
-            'errors': [],
-            'start_time': datetime.now(),
-            'end_time': None
-        }
+        self._empty_streak.clear()
+        
+        results = HistoricalResult(time_frame=time_frame)
         
         try:
             for i, chunk in enumerate(chunks):
+                # One wall-clock read per chunk, shared by progress bookkeeping
+                now = datetime.now()
                 self.progress.current_chunk_start = chunk.start_date
                 self.progress.current_chunk_end = chunk.end_date
                 
+                pending_subreddits = [
+                    subreddit for subreddit in subreddits
+                    if (subreddit, chunk.start_date, chunk.end_date) not in completed
+                ]
+                if not pending_subreddits:
+                    logger.info(f"Skipping chunk {i+1}/{len(chunks)}: already completed in a previous run")
+                    results.chunks_skipped += 1
+                    self.progress.update_progress(chunk_complete=True, now=now)
+                    continue
+                
                 logger.info(f"Processing chunk {i+1}/{len(chunks)}: {chunk.start_date.date()} to {chunk.end_date.date()}")
                 
                 chunk_results = self._collect_chunk(
-                    chunk, subreddits, keywords, posts_per_subreddit, comments_per_post
+                    chunk, pending_subreddits, folded_keywords, posts_per_subreddit, comments_per_post,
+                    now=now
                 )
                 
                 # Update results and progress
-                results['chunks_processed'] += 1
-                results['posts_collected'] += chunk_results['posts_collected']
-                results['comments_collected'] += chunk_results['comments_collected']
-                results['errors'].extend(chunk_results['errors'])
+                results.chunks_processed += 1
+                results.posts_collected += chunk_results.posts_collected
+                results.comments_collected += chunk_results.comments_collected
+                results.errors.extend(chunk_results.errors)
                 
                 self.progress.update_progress(
                     chunk_complete=True,
-                    posts=chunk_results['posts_collected'],
-                    comments=chunk_results['comments_collected'],
-                    errors=len(chunk_results['errors'])
+                    posts=chunk_results.posts_collected,
+                    comments=chunk_results.comments_collected,
+                    errors=len(chunk_results.errors),
+                    now=now
                 )
                 
                 # Log progress
@@ -225,8 +314,8 @@ class HistoricalRedditCollector:
                 eta = self.progress.get_eta_minutes()
                 eta_str = f"{eta:.1f} min" if eta else "unknown"
                 
-                logger.info(f"Chunk {i+1} complete: {chunk_results['posts_collected']} posts, "
-                          f"{chunk_results['comments_collected']} comments")
+                logger.info(f"Chunk {i+1} complete: {chunk_results.posts_collected} posts, "
+                          f"{chunk_results.comments_collected} comments")
                 logger.info(f"Overall progress: {completion:.1f}% complete, ETA: {eta_str}")
                 
                 # Rate limiting between chunks
@@ -235,94 +324,159 @@ class HistoricalRedditCollector:
         
         except Exception as e:
             logger.error(f"Historical collection failed: {e}")
-            results['success'] = False
-            results['error'] = str(e)
+            results.success = False
+            results.error = str(e)
         
         finally:
-            results['end_time'] = datetime.now()
-            duration = results['end_time'] - results['start_time']
+            results.end_time = datetime.now()
+            duration = results.end_time - results.start_time
             logger.info(f"Historical collection completed in {duration.total_seconds():.1f} seconds")
-            logger.info(f"Total collected: {results['posts_collected']} posts, {results['comments_collected']} comments")
+            logger.info(f"Total collected: {results.posts_collected} posts, {results.comments_collected} comments")
             
             # Run post-collection deduplication if collection was successful
-            if results['success']:
+            if results.success:
                 logger.info("Running post-collection database deduplication...")
                 try:
                     dedup_stats = self.storage.deduplicate_database()
-                    results['deduplication_stats'] = dedup_stats
+                    results.deduplication_stats = dedup_stats
                     logger.info(f"Deduplication completed: {dedup_stats['posts_removed_total']} posts, {dedup_stats['comments_removed_total']} comments removed")
                 except Exception as e:
                     logger.warning(f"Deduplication failed: {e}")
-                    results['deduplication_error'] = str(e)
+                    results.deduplication_error = str(e)
         
-        return results
+        return results.to_dict()
     
     def _collect_chunk(
         self,
         chunk: TimeFrame,
-        subreddits: List[str],
-        keywords: List[str],
+        subreddits: Sequence[str],
+        keywords: Sequence[str],
         posts_per_subreddit: int,
-        comments_per_post: int
-    ) -> Dict:
+        comments_per_post: int,
+        now: Optional[datetime] = None
+    ) -> ChunkResult:
         """Collect data for a single time chunk."""
-        chunk_results = {
-            'posts_collected': 0,
-            'comments_collected': 0,
-            'errors': []
-        }
+        chunk_results = ChunkResult()
+        recent_cutoff = (now or datetime.now()) - timedelta(days=self.empty_skip_recent_days)
+        
+        # Accumulate across subreddits and write once per chunk so storage sees
+        # one transaction per chunk instead of one per post
+        chunk_posts: List[RedditPost] = []
+        chunk_comments: List[RedditComment] = []
+        # Per-subreddit (posts, comments) counts recorded with each checkpoint
+        completed_subreddits: Dict[str, Tuple[int, int]] = {}
         
         for subreddit in subreddits:
+            # Old windows of a subreddit that keeps coming back empty are not
+            # worth the API calls; recent windows are always collected
+            if (self._empty_streak[subreddit] >= self.empty_streak_limit
+                    and chunk.end_date < recent_cutoff):
+                logger.info(f"Skipping r/{subreddit} for {chunk.start_date.date()} to {chunk.end_date.date()}: "
+                            f"{self._empty_streak[subreddit]} consecutive empty chunks")
+                continue
+            
             try:
-                # Collect posts with time filtering
-                posts = self._collect_time_filtered_posts(
-                    subreddit, chunk, posts_per_subreddit, keywords
+                posts, comments, errors = self._collect_subreddit_window(
+                    subreddit, chunk, keywords, posts_per_subreddit, comments_per_post
                 )
                 
-                if posts:
-                    stored_posts = self.storage.store_posts(posts)
-                    chunk_results['posts_collected'] += stored_posts
-                    
-                    logger.debug(f"Stored {stored_posts} posts from r/{subreddit}")
-                    
-                    # Collect comments for posts
-                    for post in posts[:min(len(posts), 10)]:  # Limit comment collection
-                        try:
-                            comments = self.collector.collect_post_comments(post.id, limit=comments_per_post)
-                            if comments:
-                                stored_comments = self.storage.store_comments(comments)
-                                chunk_results['comments_collected'] += stored_comments
-                                
-                                logger.debug(f"Stored {stored_comments} comments for post {post.id}")
-                            
-                            # Rate limit between comment collections
-                            self._apply_request_delay()
-                            
-                        except Exception as e:
-                            error_msg = f"Failed to collect comments for post {post.id}: {e}"
-                            logger.warning(error_msg)
-                            chunk_results['errors'].append(error_msg)
-                            self._handle_request_error()
+                if not posts:
+                    self._empty_streak[subreddit] += 1
+                else:
+                    self._empty_streak[subreddit] = 0
+                chunk_posts.extend(posts)
+                chunk_comments.extend(comments)
+                chunk_results.errors.extend(errors)
                 
                 # Rate limit between subreddits
                 self._apply_request_delay()
+                completed_subreddits[subreddit] = (len(posts), len(comments))
                 
             except Exception as e:
                 error_msg = f"Failed to collect from r/{subreddit}: {e}"
                 logger.warning(error_msg)
-                chunk_results['errors'].append(error_msg)
-                self._handle_request_error()
+                chunk_results.errors.append(error_msg)
+                self._handle_request_error(e)
+        
+        # Data and checkpoint commit together; subreddits that failed stay pending
+        try:
+            stored = self.storage.store_historical_chunk(
+                chunk_posts, chunk_comments, completed_subreddits,
+                chunk.start_date, chunk.end_date
+            )
+            chunk_results.posts_collected = stored['posts_stored']
+            chunk_results.comments_collected = stored['comments_stored']
+        except Exception as e:
+            error_msg = f"Failed to store chunk {chunk.start_date.date()} to {chunk.end_date.date()}: {e}"
+            logger.warning(error_msg)
+            chunk_results.errors.append(error_msg)
         
         return chunk_results
     
+    def _collect_subreddit_window(
+        self,
+        subreddit: str,
+        chunk: TimeFrame,
+        keywords: Sequence[str],
+        posts_per_subreddit: int,
+        comments_per_post: int
+    ) -> Tuple[List[RedditPost], List[RedditComment], List[str]]:
+        """
+        Collect posts and their comments for one subreddit in one time chunk.
+        
+        Subreddits are collected one after another: every request goes through
+        the shared rate-limited PRAW client, which is neither thread-safe nor
+        picklable, and the API rate limit rather than the filtering CPU bounds
+        throughput. A failure to fetch posts propagates; comment failures are
+        returned as error messages.
+        
+        Returns:
+            Tuple of (posts, comments, errors)
+        """
+        comments: List[RedditComment] = []
+        errors: List[str] = []
+        
+        # Collect posts with time filtering
+        self._mark_request()
+        posts = self._collect_time_filtered_posts(
+            subreddit, chunk, posts_per_subreddit, keywords
+        )
+        if posts:
+            logger.debug(f"Collected {len(posts)} posts from r/{subreddit}")
+        
+        # Collect comments for posts
+        for post in posts[:min(len(posts), 10)]:  # Limit comment collection
+            try:
+                self._mark_request()
+                post_comments = self.collector.collect_post_comments(post.id, limit=comments_per_post)
+                if post_comments:
+                    comments.extend(post_comments)
+                    logger.debug(f"Collected {len(post_comments)} comments for post {post.id}")
+                
+                # Rate limit between comment collections
+                self._apply_request_delay()
+                
+            except Exception as e:
+                error_msg = f"Failed to collect comments for post {post.id}: {e}"
+                logger.warning(error_msg)
+                errors.append(error_msg)
+                self._handle_request_error(e)
+        
+        return posts, comments, errors
+    
     def _collect_time_filtered_posts(
         self,
         subreddit: str,
         time_frame: TimeFrame,
         limit: int,
-        keywords: List[str]
+        keywords: Sequence[str]
     ) -> List[RedditPost]:
-        """Collect posts filtered by time frame with pre-filtering for efficiency."""
+        """
+        Collect posts filtered by time frame with pre-filtering for efficiency.
+        
+        keywords must already be casefolded (collect_historical_data folds
+        them once per run).
+        """
         # Get existing post IDs for this timeframe to avoid duplicates
         existing_ids = self.storage.get_existing_post_ids_in_timeframe(
             subreddit, time_frame.start_date, time_frame.end_date
@@ -330,55 +484,74 @@ class HistoricalRedditCollector:
         
         logger.info(f"Historical pre-filtering: {len(existing_ids)} existing posts in timeframe")
         
-        # Reddit's search is limited for historical data, so we collect recent posts
-        # and filter by timestamp. For true historical data, you'd need Reddit's
-        # historical data API or pushshift.io (now discontinued)
+        # Reddit's search is limited for historical data, so we page through the
+        # newest posts and filter by timestamp. For true historical data, you'd
+        # need Reddit's historical data API or pushshift.io (now discontinued)
         
-        posts = self.collector.collect_subreddit_posts(
-            subreddit_name=subreddit,
-            limit=limit * 3,  # Collect more to account for timeframe and duplicate filtering
-            sort='new',  # Get newest first for better time filtering
-            use_pre_filtering=True  # Enable the new pre-filtering
-        )
-        
-        # Filter posts by time frame and keywords
         filtered_posts = []
-        for post in posts:
-            # Check time frame
-            if time_frame.start_date <= post.timestamp <= time_frame.end_date:
-                # Check keywords if specified
-                if keywords:
-                    combined_text = f"{post.title} {post.content}"
-                    if self._contains_keywords(combined_text, keywords):
-                        filtered_posts.append(post)
-                else:
-                    filtered_posts.append(post)
-                
-                if len(filtered_posts) >= limit:
-                    break
+        scanned = 0
+        
+        # Listing pages are only requested as they are consumed; under sort='new'
+        # posts arrive newest first, so the first one older than the window ends it
+        for post in self.collector.iter_subreddit_posts(
+            subreddit,
+            sort='new',
+            max_posts=limit * 3,  # Cap paging to account for timeframe and keyword filtering
+            skip_ids=existing_ids
+        ):
+            scanned += 1
+            if post.timestamp > time_frame.end_date:
+                continue
+            if post.timestamp < time_frame.start_date:
+                break
+            
+            # Check keywords if specified
+            if keywords:
+                combined_text = f"{post.title} {post.content}"
+                if not self._contains_folded_keywords(combined_text, keywords):
+                    continue
+            filtered_posts.append(post)
+            
+            if len(filtered_posts) >= limit:
+                break
         
-        logger.debug(f"Filtered {len(posts)} posts to {len(filtered_posts)} within time frame and keywords")
+        logger.debug(f"Filtered {scanned} posts to {len(filtered_posts)} within time frame and keywords")
         return filtered_posts
     
-    def _contains_keywords(self, text: str, keywords: List[str]) -> bool:
+    def _contains_keywords(self, text: str, keywords: Sequence[str]) -> bool:
         """
         Check if text contains any target keywords (case-insensitive).
         
         Args:
             text: Text to search in
-            keywords: List of keywords to search for
+            keywords: Keywords to search for
             
         Returns:
             True if any keyword is found, False otherwise
         """
-        if not keywords:
+        return self._contains_folded_keywords(text, tuple(keyword.casefold() for keyword in keywords or ()))
+    
+    @staticmethod
+    def _contains_folded_keywords(text: str, folded_keywords: Sequence[str]) -> bool:
+        """_contains_keywords for keywords the caller has already casefolded."""
+        if not folded_keywords:
             return True
             
-        text_lower = text.lower()
-        return any(keyword.lower() in text_lower for keyword in keywords)
+        text_folded = text.casefold()
+        return any(keyword in text_folded for keyword in folded_keywords)
+    
+    def _mark_request(self):
+        """Note that a request is going out, so the delay after it is applied."""
+        self._just_backed_off = False
     
     def _apply_request_delay(self):
         """Apply delay between API requests."""
+        # An error backoff has slept and no request has gone out since; don't
+        # stack the regular delay on top
+        if self._just_backed_off:
+            self._just_backed_off = False
+            return
+        
         time.sleep(self.current_delay)
         
         # Gradually reduce delay on successful requests
@@ -391,11 +564,38 @@ class HistoricalRedditCollector:
         logger.debug(f"Applying inter-chunk delay: {chunk_delay:.1f}s")
         time.sleep(chunk_delay)
     
-    def _handle_request_error(self):
-        """Handle API request errors with exponential backoff."""
-        self.current_delay = min(self.max_delay, self.current_delay * self.backoff_multiplier)
-        logger.warning(f"Request failed, increasing delay to {self.current_delay:.1f}s")
-        time.sleep(self.current_delay)
+    def _handle_request_error(self, error: Optional[Exception] = None):
+        """
+        Handle API request errors with exponential backoff.
+        
+        When the failed response carries a Retry-After header, that wait is
+        used instead of growing the delay blindly.
+        """
+        retry_after = self._get_retry_after(error)
+        if retry_after is not None:
+            backoff = min(self.max_delay, retry_after)
+            self.current_delay = max(self.current_delay, backoff)
+            logger.warning(f"Request failed, server asked to retry after {backoff:.1f}s")
+        else:
+            self.current_delay = min(self.max_delay, self.current_delay * self.backoff_multiplier)
+            backoff = self.current_delay
+            logger.warning(f"Request failed, increasing delay to {self.current_delay:.1f}s")
+        
+        time.sleep(backoff)
+        self._just_backed_off = True
+    
+    @staticmethod
+    def _get_retry_after(error: Optional[Exception]) -> Optional[float]:
+        """Get the Retry-After delay in seconds from a failed HTTP response, if any."""
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if not headers:
+            return None
+        
+        try:
+            return max(0.0, float(headers.get('Retry-After')))
+        except (TypeError, ValueError):
+            return None
     
     def get_progress_summary(self) -> str:
         """Get formatted progress summary."""
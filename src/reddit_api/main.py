@@ -5,32 +5,126 @@ Provides high-level interface for Reddit data collection with configuration
 management and orchestration of collection, storage, and analysis.
 """
 
+import atexit
 import logging
 import os
-from typing import Dict, List, Optional
+import queue
+import re
+import sys
+from collections import Counter
+from dataclasses import replace
+from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-import praw
 from dotenv import load_dotenv
 
+from .client import create_reddit_client
 from .collector import RedditDataCollector
-from .models import RedditConfig
+from .models import RedditConfig, CONTENT_TYPE_POST
 from .storage import RedditDataStorage
 
-# Load environment variables
-load_dotenv()
+if TYPE_CHECKING:
+    import praw
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('reddit_api.log'),
+
+@lru_cache(maxsize=1)
+def _ensure_dotenv() -> None:
+    """
+    Load the .env file on first use rather than at import time, once per process.
+    
+    Importing the package as a library no longer reads a .env file; building
+    a config or starting a collection does.
+    """
+    load_dotenv()
+
+
+def _configure_logging() -> None:
+    """
+    Route root logging through a queue so file and console writes happen on a
+    background listener thread instead of in the collection loops.
+    """
+    # Like basicConfig, leave logging alone if the host application set it up
+    if logging.getLogger().handlers:
+        return
+    
+    log_queue = queue.Queue(-1)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[QueueHandler(log_queue)]
+    )
+    # Records arrive already formatted by the queue handler; the log file is
+    # only opened on the first write
+    listener = QueueListener(
+        log_queue,
+        logging.FileHandler('reddit_api.log', delay=True),
         logging.StreamHandler()
-    ]
-)
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
 
 logger = logging.getLogger(__name__)
 
+# Whether console output goes to an interactive terminal (see _emit)
+_IS_TTY = sys.stdout is not None and sys.stdout.isatty()
+
+# Emoji (and the variation selector that follows some of them) plus one
+# trailing space, dropped from console output that is not going to a terminal
+_EMOJI_RE = re.compile('[\u2600-\u27bf\U0001f000-\U0001faff]\ufe0f? ?')
+
+# Database summary keys holding sizes in MB, printed with two decimals
+SIZE_KEYS = frozenset({'database_size_mb'})
+
+# Placeholder credentials used when the environment does not provide them,
+# keyed by RedditConfig field, with the label shown in the credential check
+_CREDENTIAL_DEFAULTS = {
+    'client_id': ('Client ID', 'your_client_id'),
+    'client_secret': ('Client Secret', 'your_client_secret'),
+}
+
+# Authentication error markers, in priority order, and the hints printed for each
+_AUTH_ERROR_RE = re.compile(r'invalid_grant|401|403')
+_AUTH_ERROR_HINTS = {
+    'invalid_grant': [
+        "\n🔍 invalid_grant Error Analysis:",
+        "  - This usually occurs with username/password auth issues",
+        "  - For data collection, we use read-only mode (no username/password needed)",
+        "  - Your app type should be 'script', not 'web app'",
+    ],
+    '401': [
+        "\n🔍 401 Error Analysis:",
+        "  - Invalid client_id or client_secret",
+        "  - App might be deleted or suspended",
+        "  - Check https://reddit.com/prefs/apps for your app status",
+    ],
+    '403': [
+        "\n🔍 403 Error Analysis:",
+        "  - Account might be suspended",
+        "  - Rate limiting (wait and try again)",
+    ],
+}
+_AUTH_ERROR_PRIORITY = list(_AUTH_ERROR_HINTS)
+
+
+def _split_env_list(value: Optional[str]) -> Optional[List[str]]:
+    """Split a comma-separated environment value into stripped items."""
+    if not value:
+        return None
+    return [item.strip() for item in value.split(',')]
+
+
+# Numeric rate limiting settings: (RedditConfig field, env variable, parser, default)
+_NUMERIC_ENV = (
+    ('max_requests_per_window', 'MAX_REQUESTS_PER_WINDOW', int, 600),
+    ('base_delay', 'BASE_DELAY', float, 1.0),
+    ('max_delay', 'MAX_DELAY', float, 60.0),
+    ('max_retries', 'MAX_RETRIES', int, 5),
+    ('circuit_breaker_threshold', 'CIRCUIT_BREAKER_THRESHOLD', int, 5),
+)
+
 
 def create_config_from_env() -> RedditConfig:
     """
@@ -39,123 +133,145 @@ def create_config_from_env() -> RedditConfig:
     Returns:
         RedditConfig object with values from environment
     """
-    # Parse subreddits from environment variable
-    target_subreddits = None
-    if os.getenv('TARGET_SUBREDDITS'):
-        target_subreddits = [sub.strip() for sub in os.getenv('TARGET_SUBREDDITS').split(',')]
-    
-    # Parse keywords from environment variable
-    target_keywords = None
-    if os.getenv('TARGET_KEYWORDS'):
-        target_keywords = [kw.strip() for kw in os.getenv('TARGET_KEYWORDS').split(',')]
-    
-    return RedditConfig(
-        client_id=os.getenv('REDDIT_CLIENT_ID', 'your_client_id'),
-        client_secret=os.getenv('REDDIT_CLIENT_SECRET', 'your_client_secret'),
-        user_agent=os.getenv('REDDIT_USER_AGENT', 'SentimentAnalyzer:v1.0 (by /u/your_username)'),
-        username=os.getenv('REDDIT_USERNAME'),
-        password=os.getenv('REDDIT_PASSWORD'),
+    _ensure_dotenv()
+    env = os.environ.get
+    values = {
+        'client_id': env('REDDIT_CLIENT_ID', _CREDENTIAL_DEFAULTS['client_id'][1]),
+        'client_secret': env('REDDIT_CLIENT_SECRET', _CREDENTIAL_DEFAULTS['client_secret'][1]),
+        'user_agent': env('REDDIT_USER_AGENT', 'SentimentAnalyzer:v1.0 (by /u/your_username)'),
+        'username': env('REDDIT_USERNAME'),
+        'password': env('REDDIT_PASSWORD'),
         
         # Target configuration from environment
-        target_subreddits=target_subreddits,
-        target_keywords=target_keywords,
-        
-        # Rate limiting configuration from environment
-        max_requests_per_window=int(os.getenv('MAX_REQUESTS_PER_WINDOW', '600')),
-        base_delay=float(os.getenv('BASE_DELAY', '1.0')),
-        max_delay=float(os.getenv('MAX_DELAY', '60.0')),
-        max_retries=int(os.getenv('MAX_RETRIES', '5')),
-        circuit_breaker_threshold=int(os.getenv('CIRCUIT_BREAKER_THRESHOLD', '5'))
-    )
+        'target_subreddits': _split_env_list(env('TARGET_SUBREDDITS')),
+        'target_keywords': _split_env_list(env('TARGET_KEYWORDS')),
+    }
+    
+    # Rate limiting configuration from environment; defaults are used as-is
+    for field, name, parse, default in _NUMERIC_ENV:
+        raw = env(name)
+        values[field] = parse(raw) if raw is not None else default
+    
+    return RedditConfig(**values)
+
+
+def _emit(lines: List[str]) -> None:
+    """
+    Write buffered console lines to stdout in a single call and clear the buffer.
+    
+    When stdout is not a terminal (cron, CI, redirected output) the emoji
+    decorations are stripped so the output is plain text.
+    """
+    if lines:
+        text = "\n".join(lines) + "\n"
+        if not _IS_TTY:
+            text = _EMOJI_RE.sub('', text)
+        sys.stdout.write(text)
+        lines.clear()
 
 
-def test_reddit_connection(config: RedditConfig) -> bool:
+def test_reddit_connection(config: RedditConfig, reddit: Optional['praw.Reddit'] = None) -> bool:
     """
     Test Reddit API connection with detailed debugging.
     
     Args:
         config: Reddit configuration to test
+        reddit: Optional shared PRAW instance (see create_reddit_client)
         
     Returns:
         True if connection successful, False otherwise
     """
-    print("🔍 Testing Reddit API authentication...")
+    success, _ = _check_reddit_connection(config, reddit)
+    return success
+
+
+def _check_reddit_connection(config: RedditConfig,
+                             reddit: Optional['praw.Reddit'] = None) -> Tuple[bool, list]:
+    """
+    Run the connection check and also return any sample posts it fetched.
+    
+    Returns:
+        Tuple of (success, sample_posts); sample_posts is empty unless a post
+        was actually retrieved
+    """
+    # Console output is buffered and written at each checkpoint
+    out = ["🔍 Testing Reddit API authentication..."]
     
     # Check credentials first
-    print("\\n📋 Credential Check:")
-    print(f"  Client ID: {'✅ Present' if config.client_id and config.client_id != 'your_client_id' else '❌ Missing/Default'}")
-    print(f"  Client Secret: {'✅ Present' if config.client_secret and config.client_secret != 'your_client_secret' else '❌ Missing/Default'}")
-    print(f"  User Agent: {'✅ Present' if config.user_agent and 'your_username' not in config.user_agent else '⚠️ Default (should be customized)'}")
+    out.append("\n📋 Credential Check:")
+    missing = []
+    for field, (label, default) in _CREDENTIAL_DEFAULTS.items():
+        if getattr(config, field, None) in (None, '', default):
+            missing.append(field)
+            out.append(f"  {label}: ❌ Missing/Default")
+        else:
+            out.append(f"  {label}: ✅ Present")
+    out.append(f"  User Agent: {'✅ Present' if config.user_agent and 'your_username' not in config.user_agent else '⚠️ Default (should be customized)'}")
     
-    if config.client_id == 'your_client_id' or config.client_secret == 'your_client_secret':
-        print("\\n❌ CRITICAL: Default credentials detected!")
-        print("\\n📝 To get Reddit API credentials:")
-        print("1. Go to https://www.reddit.com/prefs/apps")
-        print("2. Click 'Create App' or 'Create Another App'")
-        print("3. Choose 'script' for personal use")
-        print("4. Copy the client ID (under the app name)")
-        print("5. Copy the client secret")
-        print("6. Add them to your .env file:")
-        print("   REDDIT_CLIENT_ID=your_actual_client_id")
-        print("   REDDIT_CLIENT_SECRET=your_actual_client_secret")
-        return False
+    if missing:
+        out.extend([
+            "\n❌ CRITICAL: Default credentials detected!",
+            "\n📝 To get Reddit API credentials:",
+            "1. Go to https://www.reddit.com/prefs/apps",
+            "2. Click 'Create App' or 'Create Another App'",
+            "3. Choose 'script' for personal use",
+            "4. Copy the client ID (under the app name)",
+            "5. Copy the client secret",
+            "6. Add them to your .env file:",
+            "   REDDIT_CLIENT_ID=your_actual_client_id",
+            "   REDDIT_CLIENT_SECRET=your_actual_client_secret",
+        ])
+        _emit(out)
+        return False, []
     
     try:
         # Test read-only access
-        print("\\n🔗 Testing read-only API access...")
-        test_reddit = praw.Reddit(
-            client_id=config.client_id,
-            client_secret=config.client_secret,
-            user_agent=config.user_agent
-        )
+        out.append("\n🔗 Testing read-only API access...")
+        _emit(out)
+        test_reddit = reddit if reddit is not None else create_reddit_client(config)
         
         # Simple test - get subreddit info
         test_subreddit = test_reddit.subreddit('test')
         subreddit_name = test_subreddit.display_name
         
-        print(f"✅ Authentication successful!")
-        print(f"   Connected to r/{subreddit_name}")
+        out.append("✅ Authentication successful!")
+        out.append(f"   Connected to r/{subreddit_name}")
         
         # Try to get one post to verify read access
+        posts = []
         try:
             posts = list(test_subreddit.hot(limit=1))
             if posts:
-                print(f"   Sample post: {posts[0].title[:50]}...")
-                print("✅ Read access confirmed!")
-                return True
+                out.append(f"   Sample post: {posts[0].title[:50]}...")
+                out.append("✅ Read access confirmed!")
             else:
-                print("✅ Authentication works (no posts in test subreddit)")
-                return True
+                out.append("✅ Authentication works (no posts in test subreddit)")
         except Exception as post_error:
-            print(f"⚠️ Auth works but post retrieval failed: {post_error}")
-            return True  # Auth still works
+            out.append(f"⚠️ Auth works but post retrieval failed: {post_error}")
+        
+        # Auth works even if post retrieval failed
+        _emit(out)
+        return True, posts
             
     except Exception as e:
-        print(f"❌ Authentication failed: {e}")
-        print("\\n💡 Common fixes:")
-        print("1. Verify your REDDIT_CLIENT_ID is correct")
-        print("2. Verify your REDDIT_CLIENT_SECRET is correct") 
-        print("3. Ensure your Reddit app type is 'script' at https://reddit.com/prefs/apps")
-        print("4. Make sure your user agent is unique and descriptive")
-        print("5. Check if your Reddit account email is verified")
+        out.extend([
+            f"❌ Authentication failed: {e}",
+            "\n💡 Common fixes:",
+            "1. Verify your REDDIT_CLIENT_ID is correct",
+            "2. Verify your REDDIT_CLIENT_SECRET is correct",
+            "3. Ensure your Reddit app type is 'script' at https://reddit.com/prefs/apps",
+            "4. Make sure your user agent is unique and descriptive",
+            "5. Check if your Reddit account email is verified",
+        ])
         
-        # Additional debugging for specific errors
-        if "invalid_grant" in str(e):
-            print("\\n🔍 invalid_grant Error Analysis:")
-            print("  - This usually occurs with username/password auth issues")
-            print("  - For data collection, we use read-only mode (no username/password needed)")
-            print("  - Your app type should be 'script', not 'web app'")
-        elif "401" in str(e):
-            print("\\n🔍 401 Error Analysis:")
-            print("  - Invalid client_id or client_secret")
-            print("  - App might be deleted or suspended")
-            print("  - Check https://reddit.com/prefs/apps for your app status")
-        elif "403" in str(e):
-            print("\\n🔍 403 Error Analysis:")
-            print("  - Account might be suspended")
-            print("  - Rate limiting (wait and try again)")
+        # Additional debugging for specific errors; scan the message once and
+        # report the highest-priority marker found
+        markers = _AUTH_ERROR_RE.findall(str(e))
+        if markers:
+            out.extend(_AUTH_ERROR_HINTS[min(markers, key=_AUTH_ERROR_PRIORITY.index)])
         
-        return False
+        _emit(out)
+        return False, []
 
 
 def collect_reddit_data(config: RedditConfig, 
@@ -163,7 +279,8 @@ def collect_reddit_data(config: RedditConfig,
                        comments_per_post: int = 10,
                        db_path: str = 'reddit_data.db',
                        enable_batching: bool = True,
-                       enable_resume: bool = False) -> Dict:
+                       enable_resume: bool = False,
+                       reddit: Optional['praw.Reddit'] = None) -> Dict:
     """
     Collect Reddit data and store in database with optional mini-batch processing.
     
@@ -174,13 +291,26 @@ def collect_reddit_data(config: RedditConfig,
         db_path: Path to SQLite database
         enable_batching: If True, store data after each subreddit (recommended for fault tolerance)
         enable_resume: If True, skip subreddits that were recently collected successfully
+        reddit: Optional shared PRAW instance (see create_reddit_client)
         
     Returns:
         Dictionary with collection results and statistics
     """
     collection_mode = "batched" if enable_batching else "traditional"
-    logger.info(f"Starting Reddit data collection in {collection_mode} mode...")
+    if not config.target_subreddits:
+        logger.error("Data collection skipped: no target subreddits configured")
+        return {
+            'success': False,
+            'error': 'no target subreddits configured',
+            'posts_collected': 0,
+            'comments_collected': 0,
+            'collection_mode': collection_mode
+        }
 
+    logger.info("Starting Reddit data collection in %s mode...", collection_mode)
+
+    # Storage may pick up DATABASE_URL from the .env file
+    _ensure_dotenv()
     storage = RedditDataStorage(db_path)
 
     # Apply resume filtering before creating the collector so the collector
@@ -189,24 +319,14 @@ def collect_reddit_data(config: RedditConfig,
     if enable_resume and enable_batching:
         resume_state = storage.get_collection_resume_state(config.target_subreddits, hours_back=24)
         if resume_state['resume_available']:
-            working_config = RedditConfig(
-                client_id=config.client_id,
-                client_secret=config.client_secret,
-                user_agent=config.user_agent,
-                username=getattr(config, 'username', None),
-                password=getattr(config, 'password', None),
-                target_subreddits=resume_state['pending_subreddits'],
-                target_keywords=config.target_keywords,
-                max_requests_per_window=config.max_requests_per_window,
-                base_delay=config.base_delay,
-                max_delay=config.max_delay,
-                max_retries=config.max_retries,
-                circuit_breaker_threshold=config.circuit_breaker_threshold,
-            )
-            logger.info(f"Resume mode: processing {len(resume_state['pending_subreddits'])} pending subreddits, "
-                        f"skipping {len(resume_state['completed_subreddits'])} recently completed")
-
-    collector = RedditDataCollector(working_config, storage)
+            working_config = replace(config, target_subreddits=resume_state['pending_subreddits'])
+            logger.info("Resume mode: processing %d pending subreddits, skipping %d recently completed",
+                        len(resume_state['pending_subreddits']), len(resume_state['completed_subreddits']))
+
+    # Load recently stored post IDs once so duplicates are skipped at fetch
+    # time rather than inserted and removed again by deduplicate_database()
+    seen_ids = storage.load_recent_post_ids(limit=100_000)
+    collector = RedditDataCollector(working_config, storage, reddit=reddit, seen_ids=seen_ids)
 
     try:
         if enable_batching:
@@ -217,7 +337,7 @@ def collect_reddit_data(config: RedditConfig,
                                           posts_per_subreddit, comments_per_post)
                 
     except Exception as e:
-        logger.error(f"Data collection failed: {e}")
+        logger.error("Data collection failed: %s", e, exc_info=True)
         return {
             'success': False,
             'error': str(e),
@@ -227,19 +347,34 @@ def collect_reddit_data(config: RedditConfig,
         }
 
 
+def _run_summary_queries(storage, include_batch_history: bool = False):
+    """
+    Run the post-deduplication summary queries over a single storage connection.
+    
+    Returns:
+        Tuple of (summary, efficiency_stats, batch_history); batch_history is
+        None unless requested
+    """
+    report = storage.get_post_collection_report(
+        days_back=7, batch_limit=5, include_batch_history=include_batch_history
+    )
+    return report['summary'], report['efficiency_stats'], report['batch_history']
+
+
 def _collect_with_batching(collector, storage, config, posts_per_subreddit, comments_per_post, enable_resume):
     """
     Handle batched collection with immediate storage and fault tolerance.
     Resume filtering is already applied by collect_reddit_data before this is called.
     """
-    from datetime import datetime
-
     # Progress tracking callback
     def progress_callback(progress_info):
-        pct = progress_info['completed'] / progress_info['total'] * 100
-        logger.info(f"🔄 Progress: {progress_info['completed']}/{progress_info['total']} "
-                   f"({pct:.1f}%) - r/{progress_info['current_subreddit']} completed "
-                   f"({progress_info['posts_in_batch']}P, {progress_info['comments_in_batch']}C)")
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info("🔄 Progress: %d/%d (%.1f%%) - r/%s completed (%dP, %dC)",
+                    progress_info['completed'], progress_info['total'],
+                    progress_info['completed'] / progress_info['total'] * 100,
+                    progress_info['current_subreddit'],
+                    progress_info['posts_in_batch'], progress_info['comments_in_batch'])
 
     # Storage callback for immediate batch storage
     def storage_callback(batch_result):
@@ -253,17 +388,16 @@ def _collect_with_batching(collector, storage, config, posts_per_subreddit, comm
         progress_callback=progress_callback
     )
 
-    # Store client metrics
-    storage.store_metrics(collector.client.get_metrics())
+    # Store client metrics; the same snapshot is returned below
+    metrics = collector.client.get_metrics()
+    storage.store_metrics(metrics)
 
     # Run deduplication cleanup after batched collection
     logger.info("🧹 Running post-collection database deduplication...")
     dedup_stats = storage.deduplicate_database()
 
     # Get updated summary and efficiency stats after deduplication
-    summary = storage.get_data_summary()
-    efficiency_stats = storage.get_collection_efficiency_stats(days_back=7)
-    batch_history = storage.get_batch_collection_history(limit=5)
+    summary, efficiency_stats, batch_history = _run_summary_queries(storage, include_batch_history=True)
 
     return {
         'success': True,
@@ -277,7 +411,7 @@ def _collect_with_batching(collector, storage, config, posts_per_subreddit, comm
         'start_time': collection_state['start_time'],
         'end_time': collection_state['end_time'],
         'batch_results': collection_state['batch_results'],
-        'api_metrics': collector.client.get_metrics(),
+        'api_metrics': metrics,
         'deduplication_stats': dedup_stats,
         'efficiency_stats': efficiency_stats,
         'database_summary': summary,
@@ -289,84 +423,90 @@ def _collect_traditional_way(collector, storage, config, posts_per_subreddit, co
     """
     Handle traditional collection (original behavior) for backward compatibility.
     """
-    from datetime import datetime
-    
-    # Collect data using original method
-    results = collector.collect_all_data(
+    # Stream collected items straight into storage in batches, counting
+    # posts/comments per subreddit as they pass through
+    post_counts = Counter()
+    comment_counts = Counter()
+
+    def counted(items):
+        for kind, item in items:
+            (post_counts if kind == CONTENT_TYPE_POST else comment_counts)[item.subreddit] += 1
+            yield kind, item
+
+    stored = storage.store_stream(counted(collector.iter_all_data(
         posts_per_subreddit=posts_per_subreddit,
         comments_per_post=comments_per_post
-    )
-    
-    # Store data in single batch
-    posts_stored = storage.store_posts(results['posts'])
-    comments_stored = storage.store_comments(results['comments'])
-    storage.store_metrics(results['metrics'])
+    )))
+    collection_time = datetime.now()
+    metrics = collector.client.get_metrics()
+    storage.store_metrics(metrics)
     
     # Update collection metadata for efficiency tracking
-    collection_time = datetime.now()
-    for subreddit in config.target_subreddits:
-        # Count posts/comments collected per subreddit
-        subreddit_posts = sum(1 for p in results['posts'] if p.subreddit == subreddit)
-        subreddit_comments = sum(1 for c in results['comments'] if c.subreddit == subreddit)
-        storage.update_collection_metadata(subreddit, collection_time, subreddit_posts, subreddit_comments)
+    storage.update_collection_metadata_batch([
+        (subreddit, collection_time, post_counts[subreddit], comment_counts[subreddit])
+        for subreddit in config.target_subreddits
+    ])
     
     # Run deduplication cleanup after data collection
     logger.info("🧹 Running post-collection database deduplication...")
     dedup_stats = storage.deduplicate_database()
     
     # Get updated summary and efficiency stats after deduplication
-    summary = storage.get_data_summary()
-    efficiency_stats = storage.get_collection_efficiency_stats(days_back=7)
+    summary, efficiency_stats, _ = _run_summary_queries(storage)
     
     return {
         'success': True,
         'collection_mode': 'traditional',
-        'posts_collected': len(results['posts']),
-        'comments_collected': len(results['comments']),
-        'posts_stored': posts_stored,
-        'comments_stored': comments_stored,
-        'collection_time': results['collection_time'],
-        'api_metrics': results['metrics'],
+        'posts_collected': sum(post_counts.values()),
+        'comments_collected': sum(comment_counts.values()),
+        'posts_stored': stored['posts_stored'],
+        'comments_stored': stored['comments_stored'],
+        'collection_time': collection_time.isoformat(),
+        'api_metrics': metrics,
         'deduplication_stats': dedup_stats,
         'efficiency_stats': efficiency_stats,
         'database_summary': summary
     }
 
 
-def quick_test(config: RedditConfig, test_subreddit: str = 'test') -> bool:
+def quick_test(config: RedditConfig, test_subreddit: str = 'test',
+               reddit: Optional['praw.Reddit'] = None) -> bool:
     """
     Perform a quick test to verify data collection works.
     
     Args:
         config: Reddit configuration
         test_subreddit: Subreddit to test with
+        reddit: Optional shared PRAW instance (see create_reddit_client)
         
     Returns:
         True if test successful
     """
-    print(f"🧪 Quick test: Collecting 1 post from r/{test_subreddit}...")
+    out = [f"🧪 Quick test: Collecting 1 post from r/{test_subreddit}..."]
     
     try:
-        collector = RedditDataCollector(config)
+        collector = RedditDataCollector(config, reddit=reddit)
         test_posts = collector.collect_subreddit_posts(test_subreddit, limit=1)
         
         if test_posts:
-            print(f"✅ SUCCESS! Retrieved {len(test_posts)} post(s)")
+            out.append(f"✅ SUCCESS! Retrieved {len(test_posts)} post(s)")
             for post in test_posts:
-                print(f"   📰 {post.title[:60]}...")
-                print(f"   👆 {post.upvotes} upvotes | 💬 {post.num_comments} comments")
+                out.append(f"   📰 {post.title[:60]}...")
+                out.append(f"   👆 {post.upvotes} upvotes | 💬 {post.num_comments} comments")
         else:
-            print(f"⚠️ No posts found in r/{test_subreddit}, but authentication worked!")
+            out.append(f"⚠️ No posts found in r/{test_subreddit}, but authentication worked!")
         
-        print("\\n🎉 Authentication and data collection are working!")
+        out.append("\n🎉 Authentication and data collection are working!")
+        _emit(out)
         return True
         
     except Exception as e:
-        print(f"❌ Test failed: {e}")
+        out.append(f"❌ Test failed: {e}")
         if "invalid_grant" in str(e):
-            print("💡 Still getting invalid_grant - check your configuration")
+            out.append("💡 Still getting invalid_grant - check your configuration")
         else:
-            print("💡 Check your Reddit credentials and network connection")
+            out.append("💡 Check your Reddit credentials and network connection")
+        _emit(out)
         return False
 
 
@@ -374,105 +514,126 @@ def main():
     """
     Main function demonstrating Reddit data collection.
     """
-    print("🚀 Reddit API Data Collection")
-    print("=" * 40)
+    # Logging is configured here rather than at import so library users and
+    # scripts keep control of their own logging setup
+    _configure_logging()
+    
+    # Console output is buffered and written at each checkpoint
+    out = ["🚀 Reddit API Data Collection", "=" * 40]
     
     # Create configuration
     config = create_config_from_env()
     
-    print(f"Configuration loaded for subreddits: {config.target_subreddits}")
-    print(f"Target keywords: {config.target_keywords}")
+    out.append(f"Configuration loaded for subreddits: {config.target_subreddits}")
+    out.append(f"Target keywords: {config.target_keywords}")
+    _emit(out)
+    
+    # One PRAW instance, and so one pooled HTTP session, for the whole run
+    reddit = create_reddit_client(config)
     
     # Test authentication
-    if not test_reddit_connection(config):
-        print("\\n🛑 Authentication failed. Please fix credentials before continuing.")
+    connected, sample_posts = _check_reddit_connection(config, reddit=reddit)
+    if not connected:
+        out.append("\n🛑 Authentication failed. Please fix credentials before continuing.")
+        _emit(out)
         return
     
-    # Quick test
-    if not quick_test(config):
-        print("\\n🛑 Quick test failed. Check your configuration.")
+    # Quick test; skipped when the connection check already read a post,
+    # unless REDDIT_RUN_QUICK_TEST=1 asks for it explicitly
+    run_quick_test = not sample_posts or os.getenv('REDDIT_RUN_QUICK_TEST') == '1'
+    if run_quick_test and not quick_test(config, reddit=reddit):
+        out.append("\n🛑 Quick test failed. Check your configuration.")
+        _emit(out)
         return
     
     # Full data collection with batching enabled (recommended)
-    print("\\n🚀 Starting full data collection with mini-batch storage...")
-    print("   💡 Using batched mode for fault tolerance - data saved after each subreddit")
+    out.append("\n🚀 Starting full data collection with mini-batch storage...")
+    out.append("   💡 Using batched mode for fault tolerance - data saved after each subreddit")
+    _emit(out)
     results = collect_reddit_data(
         config=config,
         posts_per_subreddit=3,
         comments_per_post=5,
         db_path='reddit_data.db',
         enable_batching=True,      # Enable fault-tolerant batch storage
-        enable_resume=False        # Set to True to resume interrupted collections
+        enable_resume=False,       # Set to True to resume interrupted collections
+        reddit=reddit
     )
     
     if results['success']:
-        print("\\n📈 Collection Results:")
+        out.append("\n📈 Collection Results:")
         
         # Handle different result formats based on collection mode
         if results.get('collection_mode') == 'batched':
-            print(f"  Collection mode: ✨ Batched (fault-tolerant)")
-            print(f"  Completed subreddits: {len(results['completed_subreddits'])}")
+            out.append("  Collection mode: ✨ Batched (fault-tolerant)")
+            out.append(f"  Completed subreddits: {len(results['completed_subreddits'])}")
             if results['failed_subreddits']:
-                print(f"  Failed subreddits: {len(results['failed_subreddits'])}")
+                out.append(f"  Failed subreddits: {len(results['failed_subreddits'])}")
                 for failure in results['failed_subreddits']:
-                    print(f"    - r/{failure['subreddit']}: {failure['error_type']}")
-            print(f"  Success rate: {results['success_rate']:.1f}%")
-            print(f"  Total posts collected: {results['total_posts_collected']}")
-            print(f"  Total comments collected: {results['total_comments_collected']}")
+                    out.append(f"    - r/{failure['subreddit']}: {failure['error_type']}")
+            out.append(f"  Success rate: {results['success_rate']:.1f}%")
+            out.append(f"  Total posts collected: {results['total_posts_collected']}")
+            out.append(f"  Total comments collected: {results['total_comments_collected']}")
             
             # Show batch performance details
             if results.get('batch_results'):
-                print("\\n⚡ Batch Performance:")
-                total_time = 0
+                out.append("\n⚡ Batch Performance:")
+                total_time = sum(batch['batch_metrics'].get('processing_time_seconds', 0)
+                                 for batch in results['batch_results'])
                 for batch in results['batch_results']:
                     metrics = batch['batch_metrics']
-                    total_time += metrics.get('processing_time_seconds', 0)
-                    print(f"  r/{batch['subreddit']}: {metrics['posts_count']}P, "
-                          f"{metrics['comments_count']}C ({metrics.get('processing_time_seconds', 0):.2f}s)")
-                print(f"  Total processing time: {total_time:.2f}s")
+                    out.append(f"  r/{batch['subreddit']}: {metrics['posts_count']}P, "
+                               f"{metrics['comments_count']}C ({metrics.get('processing_time_seconds', 0):.2f}s)")
+                out.append(f"  Total processing time: {total_time:.2f}s")
         else:
             # Traditional mode display
-            print(f"  Collection mode: 📦 Traditional")
-            print(f"  Posts collected: {results.get('posts_collected', 0)}")
-            print(f"  Comments collected: {results.get('comments_collected', 0)}")
-            print(f"  Posts stored: {results.get('posts_stored', 0)}")
-            print(f"  Comments stored: {results.get('comments_stored', 0)}")
+            out.append("  Collection mode: 📦 Traditional")
+            out.append(f"  Posts collected: {results.get('posts_collected', 0)}")
+            out.append(f"  Comments collected: {results.get('comments_collected', 0)}")
+            out.append(f"  Posts stored: {results.get('posts_stored', 0)}")
+            out.append(f"  Comments stored: {results.get('comments_stored', 0)}")
         
         # Display deduplication results
         if 'deduplication_stats' in results:
             dedup = results['deduplication_stats']
-            print("\\n🧹 Deduplication Results:")
-            print(f"  Posts removed: {dedup['posts_removed_total']}")
-            print(f"    - By ID: {dedup['posts_removed_by_id']}")
-            print(f"    - By content: {dedup['posts_removed_by_content']}")
-            print(f"  Comments removed: {dedup['comments_removed_total']}")
-            print(f"    - By ID: {dedup['comments_removed_by_id']}")
-            print(f"    - By content: {dedup['comments_removed_by_content']}")
-            print(f"    - Orphaned: {dedup['orphaned_comments_removed']}")
+            out.extend([
+                "\n🧹 Deduplication Results:",
+                f"  Posts removed: {dedup['posts_removed_total']}",
+                f"    - By ID: {dedup['posts_removed_by_id']}",
+                f"    - By content: {dedup['posts_removed_by_content']}",
+                f"  Comments removed: {dedup['comments_removed_total']}",
+                f"    - By ID: {dedup['comments_removed_by_id']}",
+                f"    - By content: {dedup['comments_removed_by_content']}",
+                f"    - Orphaned: {dedup['orphaned_comments_removed']}",
+            ])
         
         # Display efficiency statistics
         if 'efficiency_stats' in results:
             eff = results['efficiency_stats']
-            print("\\n⚡ Collection Efficiency (last 7 days):")
-            print(f"  Total collections: {eff['total_collections']}")
-            print(f"  Average posts per run: {eff['avg_posts_per_run']:.1f}")
-            print(f"  Average comments per run: {eff['avg_comments_per_run']:.1f}")
-            print(f"  Total posts collected: {eff['total_posts_collected']}")
-            print(f"  Total comments collected: {eff['total_comments_collected']}")
+            out.extend([
+                "\n⚡ Collection Efficiency (last 7 days):",
+                f"  Total collections: {eff['total_collections']}",
+                f"  Average posts per run: {eff['avg_posts_per_run']:.1f}",
+                f"  Average comments per run: {eff['avg_comments_per_run']:.1f}",
+                f"  Total posts collected: {eff['total_posts_collected']}",
+                f"  Total comments collected: {eff['total_comments_collected']}",
+            ])
         
-        print("\\n📊 Database Summary (after cleanup):")
+        out.append("\n📊 Database Summary (after cleanup):")
         summary = results['database_summary']
         for key, value in summary.items():
-            if 'size' in key:
-                print(f"  {key}: {value:.2f}")
+            if key in SIZE_KEYS:
+                out.append(f"  {key}: {value:.2f}")
             else:
-                print(f"  {key}: {value}")
+                out.append(f"  {key}: {value}")
         
-        print("\\n🎉 Data collection completed successfully!")
-        print("Ready for sentiment analysis integration.")
+        out.append("\n🎉 Data collection completed successfully!")
+        out.append("Ready for sentiment analysis integration.")
         
     else:
-        print(f"\\n❌ Collection failed: {results['error']}")
+        out.append(f"\n❌ Collection failed: {results['error']}")
+    
+    _emit(out)
 
 
 if __name__ == "__main__":
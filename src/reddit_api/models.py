@@ -4,19 +4,38 @@ Reddit API Data Models
 Defines data structures for Reddit posts, comments, and configuration.
 """
 
-from dataclasses import dataclass, asdict
+import json
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _to_json_bytes(item) -> bytes:
+    """Serialize a post or comment to compact UTF-8 JSON, matching its to_dict()."""
+    if orjson is not None:
+        # orjson serializes dataclasses and datetimes natively, in C
+        return orjson.dumps(item)
+    return json.dumps(item.to_dict(), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+# Plain-string content types, for comparisons that don't need the Enum
+CONTENT_TYPE_POST = "post"
+CONTENT_TYPE_COMMENT = "comment"
 
 
 class ContentType(Enum):
     """Enumeration for content types"""
-    POST = "post"
-    COMMENT = "comment"
+    POST = CONTENT_TYPE_POST
+    COMMENT = CONTENT_TYPE_COMMENT
 
 
-@dataclass
+@dataclass(slots=True)
 class RedditConfig:
     """Configuration for Reddit API access and data collection"""
     client_id: str
@@ -45,7 +64,7 @@ class RedditConfig:
             self.target_keywords = ['AI', 'LLM', 'machine learning', 'artificial intelligence', 'ChatGPT', 'Claude', 'GPT', 'neural network']
 
 
-@dataclass
+@dataclass(slots=True)
 class RedditPost:
     """Data model for Reddit posts"""
     id: str
@@ -58,16 +77,30 @@ class RedditPost:
     author_karma: int
     url: str
     num_comments: int
-    content_type: str = ContentType.POST.value
+    content_type: str = CONTENT_TYPE_POST
     
     def to_dict(self) -> Dict:
         """Convert to dictionary with serialized datetime"""
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        return data
+        return {
+            'id': self.id,
+            'title': self.title,
+            'content': self.content,
+            'upvotes': self.upvotes,
+            'timestamp': self.timestamp.isoformat(),
+            'subreddit': self.subreddit,
+            'author': self.author,
+            'author_karma': self.author_karma,
+            'url': self.url,
+            'num_comments': self.num_comments,
+            'content_type': self.content_type
+        }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact JSON bytes (uses orjson when installed)"""
+        return _to_json_bytes(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class RedditComment:
     """Data model for Reddit comments"""
     id: str
@@ -79,16 +112,29 @@ class RedditComment:
     author: str
     author_karma: int
     post_id: str
-    content_type: str = ContentType.COMMENT.value
+    content_type: str = CONTENT_TYPE_COMMENT
     
     def to_dict(self) -> Dict:
         """Convert to dictionary with serialized datetime"""
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        return data
+        return {
+            'id': self.id,
+            'parent_id': self.parent_id,
+            'content': self.content,
+            'upvotes': self.upvotes,
+            'timestamp': self.timestamp.isoformat(),
+            'subreddit': self.subreddit,
+            'author': self.author,
+            'author_karma': self.author_karma,
+            'post_id': self.post_id,
+            'content_type': self.content_type
+        }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact JSON bytes (uses orjson when installed)"""
+        return _to_json_bytes(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class APIUsageMetrics:
     """Metrics for API usage tracking"""
     requests_made: int = 0
@@ -98,10 +144,25 @@ class APIUsageMetrics:
     last_request_time: Optional[datetime] = None
     window_start: Optional[datetime] = None
     
+    # Field name -> (datetime, isoformat string) from the last serialization
+    _iso_cache: Dict[str, Tuple[datetime, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
     def reset_window(self):
         """Reset the tracking window"""
         self.requests_made = 0
         self.window_start = datetime.now()
+    
+    def _isoformat(self, name: str) -> Optional[str]:
+        """Return the ISO string for a datetime field, reformatting only when it changed"""
+        value = getattr(self, name)
+        if value is None:
+            return None
+        cached = self._iso_cache.get(name)
+        if cached is None or cached[0] is not value:
+            cached = self._iso_cache[name] = (value, value.isoformat())
+        return cached[1]
         
     def to_dict(self) -> Dict:
         """Convert to dictionary with serialized datetimes"""
@@ -110,6 +171,6 @@ class APIUsageMetrics:
             'requests_failed': self.requests_failed,
             'rate_limit_hits': self.rate_limit_hits,
             'circuit_breaker_trips': self.circuit_breaker_trips,
-            'last_request_time': self.last_request_time.isoformat() if self.last_request_time else None,
-            'window_start': self.window_start.isoformat() if self.window_start else None
+            'last_request_time': self._isoformat('last_request_time'),
+            'window_start': self._isoformat('window_start')
         }
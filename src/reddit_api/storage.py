@@ -8,15 +8,23 @@ posts, comments, and metadata.
 import json
 import logging
 import os
+import queue
 import sqlite3
+import threading
+import time
+from copy import deepcopy
+from dataclasses import fields
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from functools import wraps
+from operator import attrgetter
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import pandas as pd
 
-from src.db.connection import get_write_connection, is_postgres_connection
+from src.db.connection import get_write_connection
 
-from .models import RedditPost, RedditComment
+from .models import RedditPost, RedditComment, CONTENT_TYPE_POST
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +35,152 @@ except ImportError:  # pragma: no cover
     psycopg2 = None
     DictCursor = None
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Driver errors that mark a rejected row rather than a bug in the caller
+_DB_ERRORS = (sqlite3.Error,) + ((psycopg2.Error,) if psycopg2 is not None else ())
+
+
+def _upsert_sql(table: str, columns: Tuple[str, ...], compare: Tuple[str, ...]) -> str:
+    """
+    Build an INSERT ... ON CONFLICT (id) DO UPDATE for table.
+
+    An existing row is updated in place (no delete + reinsert, unlike INSERT
+    OR REPLACE) and only when one of the compare columns changed. IS NOT is
+    SQLite's null-safe comparison; _CompatCursor maps it for PostgreSQL.
+    """
+    assignments = ',\n        '.join(f'{col} = excluded.{col}' for col in columns if col != 'id')
+    changed = '\n        OR '.join(f'{table}.{col} IS NOT excluded.{col}' for col in compare)
+    return f'''
+    INSERT INTO {table}
+    ({', '.join(columns)})
+    VALUES ({', '.join('?' * len(columns))})
+    ON CONFLICT (id) DO UPDATE SET
+        {assignments}
+    WHERE {changed}
+'''
+
+
+def _dedupe_sql(table: str, key: str, keep: str) -> str:
+    """
+    Build a DELETE removing rows that repeat key in table.
+
+    ROW_NUMBER numbers each key group in one sorted pass, so only the rowids
+    being removed are collected; keep='DESC' keeps the newest row of each
+    group and keep='ASC' the oldest.
+    """
+    return f'''
+    DELETE FROM {table}
+    WHERE rowid IN (
+        SELECT rowid FROM (
+            SELECT rowid, ROW_NUMBER() OVER (PARTITION BY {key} ORDER BY rowid {keep}) AS rn
+            FROM {table}
+        )
+        WHERE rn > 1
+    )
+'''
+
+
+# Table columns match the dataclass fields, in order, so rows are built with
+# a single C-level attrgetter call per item
+_POST_COLUMNS = tuple(f.name for f in fields(RedditPost))
+_COMMENT_COLUMNS = tuple(f.name for f in fields(RedditComment))
+
+_POST_UPSERT_SQL = _upsert_sql(
+    'posts', _POST_COLUMNS, ('upvotes', 'num_comments', 'title', 'content', 'author_karma')
+)
+_COMMENT_UPSERT_SQL = _upsert_sql(
+    'comments', _COMMENT_COLUMNS, ('upvotes', 'content', 'author_karma')
+)
+
+_post_row = attrgetter(*_POST_COLUMNS)
+_comment_row = attrgetter(*_COMMENT_COLUMNS)
+
+
+# Connection-level SQLite settings, applied once when the shared connection
+# is opened; journal_mode=WAL is persistent and is set in init_database.
+_SQLITE_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+)
+
+
+# Row positions of the NOT NULL columns checked before a batch insert, so a
+# bad row is skipped up front rather than failing the executemany
+_REQUIRED_COLUMNS = {
+    'post': tuple(_POST_COLUMNS.index(col) for col in ('id', 'title')),
+    'comment': tuple(_COMMENT_COLUMNS.index(col) for col in ('id', 'content')),
+}
+
+
+# Secondary indexes on posts; bulk_store_posts drops and rebuilds them around
+# inserts larger than _BULK_INSERT_THRESHOLD rows that also outnumber the
+# posts already stored
+_POST_INDEXES = {
+    'idx_posts_timestamp': 'CREATE INDEX IF NOT EXISTS idx_posts_timestamp ON posts(timestamp)',
+    # Trailing id makes the duplicate-check ID lookups covering
+    'idx_posts_sub_ts_id': 'CREATE INDEX IF NOT EXISTS idx_posts_sub_ts_id ON posts(subreddit, timestamp DESC, id)',
+}
+
+# Indexes superseded by the (subreddit|post_id, timestamp, id) ones
+_SUPERSEDED_INDEXES = (
+    'idx_posts_subreddit', 'idx_comments_post_id', 'idx_posts_sub_ts', 'idx_comments_post_ts'
+)
+
+_BULK_INSERT_THRESHOLD = 50_000
+
+# Longest IN (?, ...) list built inline; SQLite builds before 3.32 cap bound
+# parameters at 999
+_MAX_INLINE_PARAMS = 500
+
+# Full-text index over post titles and bodies for keyword search. The trigram
+# tokenizer indexes every three-character substring, so it can narrow a
+# LIKE '%keyword%' search without changing which posts match. It keeps its
+# own copy of the text (rather than external content) so deleting by rowid
+# is idempotent.
+#
+# Index rows are keyed on posts.rowid. posts has a TEXT primary key, so a full
+# VACUUM may renumber its rowids and leave the index pointing at the wrong
+# posts; run rebuild_search_index() after one (incremental_vacuum only moves
+# pages and keeps rowids).
+_POSTS_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(title, content, tokenize='trigram')",
+    # Earlier schema; a BEFORE INSERT trigger also fires for upserts that end
+    # up updating nothing, which would drop the row from the index
+    "DROP TRIGGER IF EXISTS posts_fts_bi",
+    '''CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts (rowid, title, content) VALUES (new.rowid, new.title, new.content);
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN
+        DELETE FROM posts_fts WHERE rowid = old.rowid;
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE ON posts BEGIN
+        DELETE FROM posts_fts WHERE rowid = old.rowid;
+        INSERT INTO posts_fts (rowid, title, content) VALUES (new.rowid, new.title, new.content);
+    END''',
+)
+
+# The 'rebuild' command only exists for external-content tables, so the index
+# is refilled from posts instead
+_POSTS_FTS_REBUILD_SQL = (
+    'DELETE FROM posts_fts',
+    'INSERT INTO posts_fts (rowid, title, content) SELECT rowid, title, content FROM posts',
+)
+
+
+# Shortest keyword the trigram index can look up
+_FTS_MIN_KEYWORD = 3
+
+
+def _fts_match_query(keywords: List[str]) -> str:
+    """FTS5 MATCH expression for any of keywords, each as a quoted substring phrase."""
+    return ' OR '.join('"{}"'.format(keyword.replace('"', '""')) for keyword in keywords)
+
 
 class _CompatCursor:
     def __init__(self, cursor):
@@ -41,50 +195,37 @@ class _CompatCursor:
         self._cursor.execute(sql, tuple(params or ()))
         return self
 
+    def executemany(self, sql, seq_of_params):
+        sql = self._translate(sql)
+        self._cursor.executemany(sql, [tuple(params) for params in seq_of_params])
+        return self
+
     def fetchone(self):
         return self._cursor.fetchone()
 
     def fetchall(self):
         return self._cursor.fetchall()
 
+    def fetchmany(self, size):
+        return self._cursor.fetchmany(size)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    @property
+    def description(self):
+        return self._cursor.description
+
     def _translate(self, sql: str) -> str:
         normalized = " ".join(sql.strip().split()).upper()
         translated = sql.replace("?", "%s")
+        translated = translated.replace(" IS NOT excluded.", " IS DISTINCT FROM excluded.")
         translated = translated.replace("INTEGER PRIMARY KEY AUTOINCREMENT", "BIGSERIAL PRIMARY KEY")
         translated = translated.replace("DATETIME DEFAULT CURRENT_TIMESTAMP", "TIMESTAMPTZ DEFAULT NOW()")
         translated = translated.replace("DATETIME", "TIMESTAMPTZ")
         translated = translated.replace("REAL DEFAULT 0", "DOUBLE PRECISION DEFAULT 0")
         translated = translated.replace("REAL", "DOUBLE PRECISION")
-        if normalized.startswith("INSERT OR REPLACE INTO POSTS"):
-            translated = translated.replace("INSERT OR REPLACE INTO posts", "INSERT INTO posts")
-            translated += """
-                ON CONFLICT (id) DO UPDATE SET
-                    title = EXCLUDED.title,
-                    content = EXCLUDED.content,
-                    upvotes = EXCLUDED.upvotes,
-                    timestamp = EXCLUDED.timestamp,
-                    subreddit = EXCLUDED.subreddit,
-                    author = EXCLUDED.author,
-                    author_karma = EXCLUDED.author_karma,
-                    url = EXCLUDED.url,
-                    num_comments = EXCLUDED.num_comments,
-                    content_type = EXCLUDED.content_type
-            """
-        elif normalized.startswith("INSERT OR REPLACE INTO COMMENTS"):
-            translated = translated.replace("INSERT OR REPLACE INTO comments", "INSERT INTO comments")
-            translated += """
-                ON CONFLICT (id) DO UPDATE SET
-                    parent_id = EXCLUDED.parent_id,
-                    content = EXCLUDED.content,
-                    upvotes = EXCLUDED.upvotes,
-                    timestamp = EXCLUDED.timestamp,
-                    subreddit = EXCLUDED.subreddit,
-                    author = EXCLUDED.author,
-                    author_karma = EXCLUDED.author_karma,
-                    post_id = EXCLUDED.post_id,
-                    content_type = EXCLUDED.content_type
-            """
-        elif normalized.startswith("INSERT OR REPLACE INTO BATCH_COLLECTIONS"):
+        if normalized.startswith("INSERT OR REPLACE INTO BATCH_COLLECTIONS"):
             translated = translated.replace("INSERT OR REPLACE INTO batch_collections", "INSERT INTO batch_collections")
             translated += """
                 ON CONFLICT (subreddit, collection_timestamp) DO UPDATE SET
@@ -94,6 +235,14 @@ class _CompatCursor:
                     batch_status = EXCLUDED.batch_status,
                     storage_timestamp = NOW()
             """
+        elif normalized.startswith("INSERT OR REPLACE INTO HISTORICAL_CHECKPOINTS"):
+            translated = translated.replace("INSERT OR REPLACE INTO historical_checkpoints", "INSERT INTO historical_checkpoints")
+            translated += """
+                ON CONFLICT (subreddit, chunk_start, chunk_end) DO UPDATE SET
+                    posts_collected = EXCLUDED.posts_collected,
+                    comments_collected = EXCLUDED.comments_collected,
+                    completed_at = NOW()
+            """
         return translated
 
 
@@ -116,6 +265,9 @@ class _CompatConnection:
     def commit(self):
         self._conn.commit()
 
+    def rollback(self):
+        self._conn.rollback()
+
     def close(self):
         self._conn.close()
 
@@ -124,6 +276,174 @@ class _CompatConnection:
         return self._conn
 
 
+def _dumps_record(record: Dict) -> str:
+    """Serialize one exported row (uses orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(record, default=str).decode('utf-8')
+    return json.dumps(record, default=str)
+
+
+_EXPORT_TABLES = (('posts', 'posts'), ('comments', 'comments'), ('metrics', 'api_metrics'))
+
+
+def _export_chunks(cursor, chunk_size: int = 1000) -> Iterator[Tuple[str, List[str], list]]:
+    """Yield (key, columns, rows) for each exported table, at least one chunk per table."""
+    for key, table in _EXPORT_TABLES:
+        cursor.execute(f'SELECT * FROM {table}')
+        columns = [col[0] for col in cursor.description]
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            yield key, columns, rows
+            if len(rows) < chunk_size:
+                break
+
+
+def _write_json_tables(f, chunks: Iterable[Tuple[str, List[str], list]]) -> None:
+    """Write _export_chunks output to f as '"key": [row objects]' members."""
+    current = None
+    wrote_any = False
+    for key, columns, rows in chunks:
+        if key != current:
+            if current is not None:
+                f.write('\n  ],' if wrote_any else '],')
+            f.write(f'\n  "{key}": [')
+            current, wrote_any = key, False
+        for row in rows:
+            f.write(',\n    ' if wrote_any else '\n    ')
+            f.write(_dumps_record(dict(zip(columns, row))))
+            wrote_any = True
+    if current is not None:
+        f.write('\n  ],' if wrote_any else '],')
+
+
+class _ProducerError:
+    __slots__ = ('error',)
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+def _iter_in_thread(produce: Callable[[], Iterable], maxsize: int = 4) -> Iterator:
+    """
+    Iterate over produce() on a background thread.
+
+    Items are handed over through a bounded queue, so producing the next
+    items overlaps with consuming the current ones while memory stays at
+    maxsize items. Producer exceptions are re-raised in the consumer.
+    """
+    items = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    done = object()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def run():
+        iterator = None
+        try:
+            iterator = iter(produce())
+            for item in iterator:
+                if not put(item):
+                    return
+            put(done)
+        except Exception as e:
+            put(_ProducerError(e))
+        finally:
+            # Close generators stopped early so their cleanup (e.g. closing
+            # a connection) runs on this thread
+            if hasattr(iterator, 'close'):
+                iterator.close()
+
+    thread = threading.Thread(target=run, name='storage-export', daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is done:
+                return
+            if isinstance(item, _ProducerError):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _cached_until_write(fn):
+    """
+    Cache a RedditDataStorage query, per argument set, for summary_cache_ttl seconds.
+
+    Entries are dropped as soon as this instance writes to the database and,
+    on SQLite, as soon as PRAGMA data_version shows a commit from another
+    process, so the TTL mainly bounds staleness on PostgreSQL.
+    """
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        external_version = self._external_data_version()
+        with self._cache_lock:
+            version = (self._data_version, external_version)
+            cached = self._cache.get(key)
+            if cached and cached[0] == version and now - cached[1] < self.summary_cache_ttl:
+                return deepcopy(cached[2])
+        value = fn(self, *args, **kwargs)
+        with self._cache_lock:
+            self._cache[key] = (version, now, deepcopy(value))
+        return value
+
+    return wrapper
+
+
+class _SharedSqliteConnection:
+    """
+    Long-lived SQLite connection reused by every RedditDataStorage call.
+
+    Entering it holds a re-entrant lock for the duration of the block and
+    commits or rolls back like sqlite3's own context manager, but leaves
+    the connection open for the next caller. With read_only the file is
+    opened with mode=ro.
+    """
+
+    def __init__(self, db_path: str, read_only: bool = False):
+        self._read_only = read_only
+        if read_only:
+            self._conn = sqlite3.connect(Path(db_path).resolve().as_uri() + '?mode=ro', uri=True,
+                                         check_same_thread=False, cached_statements=256)
+        else:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
+        for pragma in _SQLITE_PRAGMAS:
+            self._conn.execute(pragma)
+        self._lock = threading.RLock()
+
+    def __enter__(self):
+        self._lock.acquire()
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self._conn.__exit__(exc_type, exc, tb)
+        finally:
+            self._lock.release()
+
+    def close(self):
+        with self._lock:
+            if not self._read_only:
+                # Refresh planner statistics the session showed were stale;
+                # usually a no-op
+                try:
+                    self._conn.execute('PRAGMA optimize')
+                except sqlite3.Error as e:
+                    logger.debug(f"PRAGMA optimize skipped: {e}")
+            self._conn.close()
+
+
 class RedditDataStorage:
     """
     Manages persistent storage of Reddit data in SQLite database.
@@ -133,19 +453,43 @@ class RedditDataStorage:
     - Automatic table creation and indexing
     - Data export functionality
     - Summary statistics
-    - Duplicate handling with INSERT OR REPLACE
+    - Duplicate handling with upserts
     """
 
-    def __init__(self, db_path: str = 'reddit_data.db'):
+    def __init__(self, db_path: str = 'reddit_data.db', summary_cache_ttl: float = 60.0):
         """
         Initialize storage with database path.
 
         Args:
             db_path: Path to SQLite database file
+            summary_cache_ttl: Seconds to cache get_data_summary/get_subreddit_stats
+                results; any write through this instance invalidates them
         """
         self.db_path = db_path
+        self.summary_cache_ttl = summary_cache_ttl
+        self._sqlite: Optional[_SharedSqliteConnection] = None
+        self._sqlite_reader: Optional[_SharedSqliteConnection] = None
+        self._fts_enabled = False
+        self._page_size: Optional[int] = None
+        self._cache: Dict[str, Tuple[int, float, object]] = {}
+        self._cache_lock = threading.Lock()
+        self._data_version = 0
         self.init_database()
 
+    def _invalidate_cache(self):
+        with self._cache_lock:
+            self._data_version += 1
+            self._cache.clear()
+
+    def close(self):
+        """Close the shared SQLite connections, if they were opened."""
+        if self._sqlite is not None:
+            self._sqlite.close()
+            self._sqlite = None
+        if self._sqlite_reader is not None:
+            self._sqlite_reader.close()
+            self._sqlite_reader = None
+
     def _connect(self):
         if self.db_path.startswith(("postgres://", "postgresql://")):
             if psycopg2 is None:
@@ -153,18 +497,60 @@ class RedditDataStorage:
             return _CompatConnection(psycopg2.connect(self.db_path, cursor_factory=DictCursor))
         if os.environ.get("DATABASE_URL"):
             return _CompatConnection(get_write_connection())
-        return sqlite3.connect(self.db_path)
+        if self._sqlite is None:
+            self._sqlite = _SharedSqliteConnection(self.db_path)
+        return self._sqlite
+
+    def _read_connect(self):
+        """
+        Connection for read-only queries.
+
+        A SQLite file gets a second, read-only shared connection with its own
+        lock, so under WAL lookups run alongside a batch write instead of
+        queuing behind the writer's lock. Anything else uses _connect().
+        """
+        if self._using_postgres() or not os.path.exists(self.db_path):
+            return self._connect()
+        if self._sqlite_reader is None:
+            self._sqlite_reader = _SharedSqliteConnection(self.db_path, read_only=True)
+        return self._sqlite_reader
+
+    def _external_data_version(self) -> Optional[int]:
+        """
+        PRAGMA data_version of the read connection, or None off SQLite.
+
+        It changes whenever another connection commits, which includes other
+        processes writing to the same file.
+        """
+        if self._using_postgres() or not os.path.exists(self.db_path):
+            return None
+        with self._read_connect() as conn:
+            return conn.execute('PRAGMA data_version').fetchone()[0]
+
+    def _execute(self, query: str, params=None) -> Tuple[List[str], list]:
+        """Run a read query and return its column names and rows."""
+        with self._read_connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params or ())
+            return [col[0] for col in cursor.description], cursor.fetchall()
 
     def _read_sql(self, query: str, params=None) -> pd.DataFrame:
-        with self._connect() as conn:
-            raw_conn = conn.raw if isinstance(conn, _CompatConnection) else conn
-            sql = query.replace("?", "%s") if is_postgres_connection(raw_conn) else query
-            return pd.read_sql_query(sql, raw_conn, params=params)
+        columns, rows = self._execute(query, params)
+        return pd.DataFrame.from_records(rows, columns=columns)
 
-    def _database_size_mb(self) -> float:
-        if os.environ.get("DATABASE_URL") or self.db_path.startswith(("postgres://", "postgresql://")):
+    def _iter_dicts(self, query: str, params=None) -> Iterator[Dict]:
+        columns, rows = self._execute(query, params)
+        return (dict(zip(columns, row)) for row in rows)
+
+    def _database_size_mb(self, cursor) -> float:
+        """Database size from the pager, which unlike the file size includes WAL content."""
+        if self._using_postgres():
             return 0.0
-        return os.path.getsize(self.db_path) / 1024 / 1024 if os.path.exists(self.db_path) else 0.0
+        if self._page_size is None:
+            cursor.execute('PRAGMA page_size')
+            self._page_size = cursor.fetchone()[0]
+        cursor.execute('PRAGMA page_count')
+        return cursor.fetchone()[0] * self._page_size / 1024 / 1024
 
     def _using_postgres(self) -> bool:
         return bool(os.environ.get("DATABASE_URL") or self.db_path.startswith(("postgres://", "postgresql://")))
@@ -174,6 +560,18 @@ class RedditDataStorage:
         with self._connect() as conn:
             cursor = conn.cursor()
 
+            if not self._using_postgres():
+                # These two only take effect on a new database file, so they
+                # must run first. Larger pages keep long post/comment bodies
+                # out of overflow chains; incremental auto_vacuum lets
+                # deduplicate_database hand freed pages back without a full
+                # VACUUM
+                cursor.execute('PRAGMA page_size=8192')
+                cursor.execute('PRAGMA auto_vacuum=INCREMENTAL')
+                # WAL lets readers run alongside the collector's writes and,
+                # with synchronous=NORMAL, avoids an fsync on every commit
+                cursor.execute('PRAGMA journal_mode=WAL')
+
             # Posts table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS posts (
@@ -223,19 +621,70 @@ class RedditDataStorage:
             ''')
 
             # Create indexes for better query performance
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_posts_timestamp ON posts(timestamp)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_posts_subreddit ON posts(subreddit)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_comments_post_id ON comments(post_id)')
+            for ddl in _POST_INDEXES.values():
+                cursor.execute(ddl)
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_comments_post_ts_id ON comments(post_id, timestamp DESC, id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_comments_timestamp ON comments(timestamp)')
+            for name in _SUPERSEDED_INDEXES:
+                cursor.execute(f'DROP INDEX IF EXISTS {name}')
+
+            if not self._using_postgres():
+                self._fts_enabled = self._init_posts_fts(cursor)
 
             conn.commit()
 
         logger.info(f"Database initialized: {self.db_path}")
 
+    def _init_posts_fts(self, cursor) -> bool:
+        """Create the posts full-text index, backfilling it for existing databases."""
+        cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'posts_fts'")
+        row = cursor.fetchone()
+        exists = row is not None and 'trigram' in row[0]
+        try:
+            if row is not None and not exists:
+                # Earlier word-tokenized index, which can't answer substring searches
+                cursor.execute('DROP TABLE posts_fts')
+            for ddl in _POSTS_FTS_DDL:
+                cursor.execute(ddl)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, keyword search will use LIKE: {e}")
+            return False
+
+        if not exists:
+            for sql in _POSTS_FTS_REBUILD_SQL:
+                cursor.execute(sql)
+        return True
+
+    def rebuild_search_index(self) -> bool:
+        """
+        Refill the posts full-text index from the posts table.
+
+        Needed after a full VACUUM, which can renumber the rowids the index
+        is keyed on.
+
+        Returns:
+            True if the index was rebuilt, False if there is none to rebuild
+        """
+        if self._using_postgres() or not self._fts_enabled:
+            return False
+
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            for sql in _POSTS_FTS_REBUILD_SQL:
+                cursor.execute(sql)
+            conn.commit()
+        logger.info("Rebuilt posts full-text index")
+        return True
+
     def store_posts(self, posts: List[RedditPost]) -> int:
         """
         Store Reddit posts in the database.
 
+        All rows are written with a single executemany; if the database
+        rejects some of them, the failing rows are isolated and logged so one
+        bad post doesn't prevent the rest from being stored.
+
         Args:
             posts: List of RedditPost objects to store
 
@@ -245,35 +694,61 @@ class RedditDataStorage:
         if not posts:
             return 0
 
-        with self._connect() as conn:
-            cursor = conn.cursor()
-            stored_count = 0
+        if len(posts) > _BULK_INSERT_THRESHOLD and not self._using_postgres():
+            stored_count = self.bulk_store_posts(posts)
+        else:
+            stored_count = self._store_rows(_POST_UPSERT_SQL, posts, _post_row, 'post')
+        logger.info(f"Stored {stored_count} posts to database")
+        return stored_count
 
-            for post in posts:
-                try:
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO posts
-                        (id, title, content, upvotes, timestamp, subreddit, author,
-                         author_karma, url, num_comments, content_type)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        post.id, post.title, post.content, post.upvotes,
-                        post.timestamp, post.subreddit, post.author,
-                        post.author_karma, post.url, post.num_comments, post.content_type
-                    ))
-                    stored_count += 1
-                except Exception as e:
-                    logger.error(f"Error storing post {post.id}: {e}")
+    def bulk_store_posts(self, posts: List[RedditPost]) -> int:
+        """
+        Store a very large batch of posts with the posts indexes rebuilt once.
 
-            conn.commit()
+        When the batch outnumbers the posts already stored, the secondary
+        indexes are dropped, the rows inserted and the indexes recreated
+        inside one transaction, so SQLite builds each index in a single pass
+        instead of updating it per row. A rebuild covers the whole table, so
+        against a larger table the rows are inserted with the indexes in
+        place. Falls back to the regular batch insert if anything goes wrong.
 
-        logger.info(f"Stored {stored_count} posts to database")
-        return stored_count
+        Args:
+            posts: List of RedditPost objects to store
+
+        Returns:
+            Number of posts successfully stored
+        """
+        rows = self._valid_rows(map(_post_row, posts), 'post')
+        if not rows:
+            return 0
+
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute('BEGIN IMMEDIATE')
+                cursor.execute('SELECT COUNT(*) FROM posts')
+                rebuild = len(rows) > cursor.fetchone()[0]
+                if rebuild:
+                    for name in _POST_INDEXES:
+                        cursor.execute(f'DROP INDEX IF EXISTS {name}')
+                cursor.executemany(_POST_UPSERT_SQL, rows)
+                if rebuild:
+                    for ddl in _POST_INDEXES.values():
+                        cursor.execute(ddl)
+                conn.commit()
+            self._invalidate_cache()
+        except sqlite3.Error as e:
+            logger.warning(f"Bulk post insert failed, retrying as a regular batch: {e}")
+            return self._store_rows(_POST_UPSERT_SQL, posts, _post_row, 'post')
+
+        return len(rows)
 
     def store_comments(self, comments: List[RedditComment]) -> int:
         """
         Store Reddit comments in the database.
 
+        Uses the same batch insert and bad-row isolation as store_posts.
+
         Args:
             comments: List of RedditComment objects to store
 
@@ -283,31 +758,145 @@ class RedditDataStorage:
         if not comments:
             return 0
 
-        with self._connect() as conn:
-            cursor = conn.cursor()
-            stored_count = 0
+        stored_count = self._store_rows(_COMMENT_UPSERT_SQL, comments, _comment_row, 'comment')
+        logger.info(f"Stored {stored_count} comments to database")
+        return stored_count
 
-            for comment in comments:
-                try:
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO comments
-                        (id, parent_id, content, upvotes, timestamp, subreddit,
-                         author, author_karma, post_id, content_type)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        comment.id, comment.parent_id, comment.content, comment.upvotes,
-                        comment.timestamp, comment.subreddit, comment.author,
-                        comment.author_karma, comment.post_id, comment.content_type
-                    ))
-                    stored_count += 1
-                except Exception as e:
-                    logger.error(f"Error storing comment {comment.id}: {e}")
+    def store_posts_df(self, df: pd.DataFrame) -> int:
+        """
+        Store posts from a DataFrame, e.g. one returned by query_posts.
+
+        Rows go straight from the frame into executemany without building
+        RedditPost objects. Columns beyond the posts table's (such as
+        created_at) are ignored; missing values are stored as NULL.
+
+        Args:
+            df: DataFrame with at least the posts table columns
+
+        Returns:
+            Number of posts successfully stored
+
+        Raises:
+            ValueError: If a posts column is missing from the frame
+        """
+        missing = [col for col in _POST_COLUMNS if col not in df.columns]
+        if missing:
+            raise ValueError(f"DataFrame is missing post columns: {missing}")
+        if df.empty:
+            return 0
+
+        frame = df[list(_POST_COLUMNS)].astype(object)
+        frame = frame.where(frame.notna(), None)
+        rows = self._valid_rows(frame.itertuples(index=False, name=None), 'post')
+
+        stored_count = self._write_rows(_POST_UPSERT_SQL, rows, 'post')
+        logger.info(f"Stored {stored_count} posts to database")
+        return stored_count
+
+    @staticmethod
+    def _valid_rows(rows: Iterable[tuple], label: str) -> List[tuple]:
+        """
+        Skip (and log) insert rows missing NOT NULL columns.
+
+        Rows repeated within the batch collapse to their last occurrence.
+        """
+        required = _REQUIRED_COLUMNS[label]
+        valid = []
+        skipped = []
+        for row in rows:
+            if all(row[i] is not None for i in required):
+                valid.append(row)
+            else:
+                skipped.append(row[0])
+        if skipped:
+            logger.warning(f"Skipping {len(skipped)} {label}s missing required fields: {skipped}")
+        return list({row[0]: row for row in valid}.values())
+
+    def _store_rows(self, sql: str, items: List, to_row, label: str) -> int:
+        """Write items in one transaction, isolating any rows the database rejects."""
+        return self._write_rows(sql, self._valid_rows(map(to_row, items), label), label)
+
+    def _write_rows(self, sql: str, rows: List[tuple], label: str) -> int:
+        if not rows:
+            return 0
 
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            if not self._using_postgres():
+                # Take the write lock up front so the whole batch is one transaction
+                cursor.execute('BEGIN IMMEDIATE')
+            stored_count = self._insert_rows(cursor, sql, rows, label)
             conn.commit()
 
-        logger.info(f"Stored {stored_count} comments to database")
+        self._invalidate_cache()
         return stored_count
 
+    def _insert_rows(self, cursor, sql: str, rows: List[tuple], label: str) -> int:
+        """
+        executemany rows inside a savepoint.
+
+        If the batch fails it is rolled back to the savepoint and split in
+        half recursively, so the clean path is a single call and k bad rows
+        cost O(k log n) retries instead of a row-by-row pass.
+        """
+        cursor.execute('SAVEPOINT store_rows')
+        try:
+            cursor.executemany(sql, rows)
+        except _DB_ERRORS as e:
+            cursor.execute('ROLLBACK TO SAVEPOINT store_rows')
+            cursor.execute('RELEASE SAVEPOINT store_rows')
+            if len(rows) == 1:
+                logger.error(f"Error storing {label} {rows[0][0]}: {e}")
+                return 0
+            middle = len(rows) // 2
+            return (self._insert_rows(cursor, sql, rows[:middle], label)
+                    + self._insert_rows(cursor, sql, rows[middle:], label))
+        cursor.execute('RELEASE SAVEPOINT store_rows')
+        return len(rows)
+
+    def store_stream(self, items: Iterable[Tuple[str, object]],
+                     batch_size: int = 500) -> Dict[str, int]:
+        """
+        Store a stream of collected posts and comments in fixed-size batches.
+
+        Items are buffered per table, so memory stays bounded however long
+        the stream is, and the shared connection is only held while a full
+        buffer is written. Each buffer goes through the same path as
+        store_posts/store_comments: invalid rows are skipped and rows the
+        database rejects are isolated.
+
+        Args:
+            items: Iterable of ('post', RedditPost) / ('comment', RedditComment) tuples
+            batch_size: Number of rows per write transaction
+
+        Returns:
+            Dictionary with posts_stored and comments_stored counts
+        """
+        buffers = {'post': [], 'comment': []}
+        writers = {
+            'post': (_POST_UPSERT_SQL, _post_row, 'posts_stored'),
+            'comment': (_COMMENT_UPSERT_SQL, _comment_row, 'comments_stored'),
+        }
+        counts = {'posts_stored': 0, 'comments_stored': 0}
+
+        def flush(label):
+            sql, to_row, key = writers[label]
+            counts[key] += self._store_rows(sql, buffers[label], to_row, label)
+            buffers[label].clear()
+
+        for kind, item in items:
+            label = 'post' if kind == CONTENT_TYPE_POST else 'comment'
+            buffers[label].append(item)
+            if len(buffers[label]) >= batch_size:
+                flush(label)
+
+        flush('post')
+        flush('comment')
+
+        logger.info(f"Stored {counts['posts_stored']} posts and "
+                    f"{counts['comments_stored']} comments to database")
+        return counts
+
     def store_metrics(self, metrics: Dict):
         """
         Store API usage metrics.
@@ -329,6 +918,7 @@ class RedditDataStorage:
             ))
             conn.commit()
 
+    @_cached_until_write
     def get_data_summary(self) -> Dict:
         """
         Get summary statistics of stored data.
@@ -336,36 +926,57 @@ class RedditDataStorage:
         Returns:
             Dictionary containing data summary
         """
-        with self._connect() as conn:
-            cursor = conn.cursor()
+        with self._read_connect() as conn:
+            return self._data_summary(conn.cursor())
 
-            # Posts summary
-            cursor.execute('SELECT COUNT(*) FROM posts')
-            total_posts = cursor.fetchone()[0]
+    def _data_summary(self, cursor) -> Dict:
+        """Compute the data summary using an existing cursor."""
+        # Each aggregate is its own subquery so MIN/MAX stay index lookups
+        cursor.execute('''
+            SELECT
+                (SELECT COUNT(*) FROM posts),
+                (SELECT COUNT(DISTINCT subreddit) FROM posts),
+                (SELECT COUNT(*) FROM comments),
+                (SELECT MAX(timestamp) FROM posts),
+                (SELECT MIN(timestamp) FROM posts)
+        ''')
+        total_posts, unique_subreddits, total_comments, latest_post, earliest_post = cursor.fetchone()
 
-            cursor.execute('SELECT COUNT(DISTINCT subreddit) FROM posts')
-            unique_subreddits = cursor.fetchone()[0]
+        db_size_mb = self._database_size_mb(cursor)
 
-            # Comments summary
-            cursor.execute('SELECT COUNT(*) FROM comments')
-            total_comments = cursor.fetchone()[0]
+        return {
+            'total_posts': total_posts,
+            'total_comments': total_comments,
+            'unique_subreddits': unique_subreddits,
+            'latest_post': latest_post,
+            'earliest_post': earliest_post,
+            'database_size_mb': db_size_mb
+        }
 
-            # Recent data
-            cursor.execute('SELECT MAX(timestamp) FROM posts')
-            latest_post = cursor.fetchone()[0]
+    def get_post_collection_report(self, days_back: int = 7, batch_limit: int = 5,
+                                   include_batch_history: bool = True) -> Dict:
+        """
+        Get the post-collection summary, efficiency stats and batch history together.
 
-            cursor.execute('SELECT MIN(timestamp) FROM posts')
-            earliest_post = cursor.fetchone()[0]
+        All queries run on one connection and cursor instead of one connection
+        per report section.
 
-            db_size_mb = self._database_size_mb()
+        Args:
+            days_back: Period for the collection efficiency stats
+            batch_limit: Number of recent batch records to include
+            include_batch_history: Whether to query the batch history at all
 
+        Returns:
+            Dictionary with summary, efficiency_stats and batch_history (None
+            when not requested)
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
             return {
-                'total_posts': total_posts,
-                'total_comments': total_comments,
-                'unique_subreddits': unique_subreddits,
-                'latest_post': latest_post,
-                'earliest_post': earliest_post,
-                'database_size_mb': db_size_mb
+                'summary': self._data_summary(cursor),
+                'efficiency_stats': self._collection_efficiency_stats(cursor, None, days_back),
+                'batch_history': (self._batch_collection_history(cursor, None, batch_limit)
+                                  if include_batch_history else None)
             }
 
     def query_posts(self, subreddit: str = None, limit: int = 100,
@@ -376,11 +987,24 @@ class RedditDataStorage:
         Args:
             subreddit: Filter by specific subreddit
             limit: Maximum number of posts to return
-            keywords: Filter by keywords in title or content
+            keywords: Filter by keywords in title or content; a post matches
+                if any keyword appears as a case-insensitive substring (LIKE).
+                On SQLite, keywords of three or more characters are first
+                narrowed through the trigram full-text index, which doesn't
+                change the result
 
         Returns:
             DataFrame containing matching posts
         """
+        return self._read_sql(*self._posts_query(subreddit, limit, keywords))
+
+    def query_posts_iter(self, subreddit: str = None, limit: int = 100,
+                         keywords: List[str] = None) -> Iterator[Dict]:
+        """Same as query_posts, but yields one dict per post without building a DataFrame."""
+        return self._iter_dicts(*self._posts_query(subreddit, limit, keywords))
+
+    def _posts_query(self, subreddit: Optional[str], limit: int,
+                     keywords: Optional[List[str]]) -> Tuple[str, list]:
         query = 'SELECT * FROM posts'
         params = []
         conditions = []
@@ -389,21 +1013,25 @@ class RedditDataStorage:
             conditions.append('subreddit = ?')
             params.append(subreddit)
 
+        keywords = [keyword for keyword in keywords or [] if keyword.strip()]
         if keywords:
+            if self._fts_enabled and all(len(keyword) >= _FTS_MIN_KEYWORD for keyword in keywords):
+                # The trigram index narrows the candidates; LIKE below still
+                # decides what matches
+                conditions.append('rowid IN (SELECT rowid FROM posts_fts WHERE posts_fts MATCH ?)')
+                params.append(_fts_match_query(keywords))
             keyword_conditions = []
             for keyword in keywords:
                 keyword_conditions.append('(title LIKE ? OR content LIKE ?)')
                 params.extend([f'%{keyword}%', f'%{keyword}%'])
-            if keyword_conditions:
-                conditions.append(f"({' OR '.join(keyword_conditions)})")
+            conditions.append(f"({' OR '.join(keyword_conditions)})")
 
         if conditions:
             query += ' WHERE ' + ' AND '.join(conditions)
 
         query += ' ORDER BY timestamp DESC LIMIT ?'
         params.append(limit)
-
-        return self._read_sql(query, params=params)
+        return query, params
 
     def query_comments(self, post_id: str = None, limit: int = 100) -> pd.DataFrame:
         """
@@ -416,6 +1044,14 @@ class RedditDataStorage:
         Returns:
             DataFrame containing matching comments
         """
+        return self._read_sql(*self._comments_query(post_id, limit))
+
+    def query_comments_iter(self, post_id: str = None, limit: int = 100) -> Iterator[Dict]:
+        """Same as query_comments, but yields one dict per comment without building a DataFrame."""
+        return self._iter_dicts(*self._comments_query(post_id, limit))
+
+    @staticmethod
+    def _comments_query(post_id: Optional[str], limit: int) -> Tuple[str, list]:
         query = 'SELECT * FROM comments'
         params = []
 
@@ -425,13 +1061,17 @@ class RedditDataStorage:
 
         query += ' ORDER BY timestamp DESC LIMIT ?'
         params.append(limit)
-
-        return self._read_sql(query, params=params)
+        return query, params
 
     def export_to_json(self, filename: str = None) -> str:
         """
         Export all data to JSON file.
 
+        Rows are streamed from the database cursors straight into the file,
+        so memory use doesn't grow with the size of the tables. For SQLite
+        files the rows are read on a background thread over a read-only
+        connection, overlapping the database reads with JSON encoding.
+
         Args:
             filename: Optional filename for export
 
@@ -441,26 +1081,29 @@ class RedditDataStorage:
         if not filename:
             filename = f"reddit_data_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
-        with self._connect() as conn:
-            raw_conn = conn.raw if isinstance(conn, _CompatConnection) else conn
-            posts_df = pd.read_sql_query('SELECT * FROM posts', raw_conn)
-            comments_df = pd.read_sql_query('SELECT * FROM comments', raw_conn)
-            metrics_df = pd.read_sql_query('SELECT * FROM api_metrics', raw_conn)
-
-            export_data = {
-                'posts': posts_df.to_dict('records'),
-                'comments': comments_df.to_dict('records'),
-                'metrics': metrics_df.to_dict('records'),
-                'export_timestamp': datetime.now().isoformat(),
-                'summary': self.get_data_summary()
-            }
-
-            with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
-
-            logger.info(f"Data exported to {filename}")
-            return filename
-
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write('{')
+            if not self._using_postgres() and os.path.exists(self.db_path):
+                _write_json_tables(f, _iter_in_thread(self._read_only_export_chunks))
+            else:
+                with self._connect() as conn:
+                    _write_json_tables(f, _export_chunks(conn.cursor()))
+            f.write(f'\n  "export_timestamp": {json.dumps(datetime.now().isoformat())},')
+            f.write(f'\n  "summary": {json.dumps(self.get_data_summary(), default=str)}\n}}\n')
+
+        logger.info(f"Data exported to {filename}")
+        return filename
+
+    def _read_only_export_chunks(self) -> Iterator[Tuple[str, List[str], list]]:
+        """_export_chunks over a private read-only connection, in one read snapshot."""
+        conn = sqlite3.connect(Path(self.db_path).resolve().as_uri() + '?mode=ro', uri=True)
+        try:
+            conn.execute('BEGIN')
+            yield from _export_chunks(conn.cursor())
+        finally:
+            conn.close()
+
+    @_cached_until_write
     def get_subreddit_stats(self) -> pd.DataFrame:
         """
         Get statistics by subreddit.
@@ -481,35 +1124,52 @@ class RedditDataStorage:
         '''
         return self._read_sql(query)
 
-    def cleanup_old_data(self, days_to_keep: int = 30) -> int:
+    def cleanup_old_data(self, days_to_keep: int = 30, chunk_size: int = 10_000) -> int:
         """
         Remove data older than specified days.
 
+        Rows are deleted in chunks of chunk_size, each in its own transaction,
+        so a large cleanup doesn't hold the write lock or grow the WAL for the
+        whole run.
+
         Args:
             days_to_keep: Number of days of data to retain
+            chunk_size: Maximum rows deleted per transaction
 
         Returns:
             Number of records deleted
         """
         cutoff_date = datetime.now() - timedelta(days=days_to_keep)
 
-        with self._connect() as conn:
-            cursor = conn.cursor()
-
-            # Delete old posts
-            cursor.execute('DELETE FROM posts WHERE timestamp < ?', (cutoff_date,))
-            posts_deleted = cursor.rowcount
+        posts_deleted = self._delete_in_chunks('posts', cutoff_date, chunk_size)
+        comments_deleted = self._delete_in_chunks('comments', cutoff_date, chunk_size)
 
-            # Delete old comments
-            cursor.execute('DELETE FROM comments WHERE timestamp < ?', (cutoff_date,))
-            comments_deleted = cursor.rowcount
-
-            conn.commit()
+        if not self._using_postgres():
+            with self._connect() as conn:
+                conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
 
+        self._invalidate_cache()
         total_deleted = posts_deleted + comments_deleted
         logger.info(f"Cleaned up {total_deleted} records older than {days_to_keep} days")
         return total_deleted
 
+    def _delete_in_chunks(self, table: str, cutoff_date: datetime, chunk_size: int) -> int:
+        """Delete rows of table older than cutoff_date, committing every chunk_size rows."""
+        deleted = 0
+        while True:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f'DELETE FROM {table} WHERE id IN '
+                    f'(SELECT id FROM {table} WHERE timestamp < ? LIMIT ?)',
+                    (cutoff_date, chunk_size)
+                )
+                count = cursor.rowcount
+                conn.commit()
+            deleted += count
+            if count < chunk_size:
+                return deleted
+
     def deduplicate_database(self) -> Dict[str, int]:
         """
         Remove duplicate records from the database based on multiple criteria.
@@ -537,70 +1197,55 @@ class RedditDataStorage:
 
         with self._connect() as conn:
             cursor = conn.cursor()
+            # Run every pass in one write transaction
+            cursor.execute('BEGIN IMMEDIATE')
 
             # Track removal counts
             posts_removed = 0
             comments_removed = 0
 
             # 1. Remove duplicate posts by ID (keep latest created_at)
-            # Note: This handles cases where INSERT OR REPLACE didn't catch duplicates
-            cursor.execute('''
-                DELETE FROM posts
-                WHERE rowid NOT IN (
-                    SELECT MAX(rowid)
-                    FROM posts
-                    GROUP BY id
-                )
-            ''')
+            # Note: This handles cases where the upsert didn't catch duplicates
+            cursor.execute(_dedupe_sql('posts', 'id', 'DESC'))
             posts_id_removed = cursor.rowcount
             posts_removed += posts_id_removed
 
             # 2. Remove posts with same title + subreddit + author (potential content duplicates)
-            cursor.execute('''
-                DELETE FROM posts
-                WHERE rowid NOT IN (
-                    SELECT MIN(rowid)
-                    FROM posts
-                    GROUP BY title, subreddit, author
-                )
-            ''')
+            cursor.execute(_dedupe_sql('posts', 'title, subreddit, author', 'ASC'))
             posts_content_removed = cursor.rowcount
             posts_removed += posts_content_removed
 
             # 3. Remove duplicate comments by ID (keep latest created_at)
-            # Note: This handles cases where INSERT OR REPLACE didn't catch duplicates
-            cursor.execute('''
-                DELETE FROM comments
-                WHERE rowid NOT IN (
-                    SELECT MAX(rowid)
-                    FROM comments
-                    GROUP BY id
-                )
-            ''')
+            # Note: This handles cases where the upsert didn't catch duplicates
+            cursor.execute(_dedupe_sql('comments', 'id', 'DESC'))
             comments_id_removed = cursor.rowcount
             comments_removed += comments_id_removed
 
             # 4. Remove comments with same content + post_id + author (exact duplicates)
-            cursor.execute('''
-                DELETE FROM comments
-                WHERE rowid NOT IN (
-                    SELECT MIN(rowid)
-                    FROM comments
-                    GROUP BY content, post_id, author
-                )
-            ''')
+            cursor.execute(_dedupe_sql('comments', 'content, post_id, author', 'ASC'))
             comments_content_removed = cursor.rowcount
             comments_removed += comments_content_removed
 
             # 5. Remove orphaned comments (comments whose posts no longer exist)
             cursor.execute('''
                 DELETE FROM comments
-                WHERE post_id NOT IN (SELECT id FROM posts)
+                WHERE post_id IS NOT NULL
+                  AND NOT EXISTS (SELECT 1 FROM posts WHERE posts.id = comments.post_id)
             ''')
             orphaned_comments = cursor.rowcount
             comments_removed += orphaned_comments
 
             conn.commit()
+            self._invalidate_cache()
+
+            if posts_removed or comments_removed:
+                # Refresh planner statistics and release freed pages.
+                # incremental_vacuum frees one page per step, so it goes
+                # through executescript to run to completion; it is a no-op
+                # unless auto_vacuum is on
+                cursor.execute('ANALYZE posts')
+                cursor.execute('ANALYZE comments')
+                conn.executescript('PRAGMA incremental_vacuum')
 
             # Log detailed results
             logger.info("Deduplication completed:")
@@ -647,10 +1292,16 @@ class RedditDataStorage:
             ''')
             duplicate_posts_by_id = cursor.fetchone()[0]
 
-            # Count duplicate posts by content
+            # Count duplicate posts by content; grouping on the columns (as
+            # deduplicate_database does) avoids building a concatenated key per row
             cursor.execute('''
-                SELECT COUNT(*) - COUNT(DISTINCT title || subreddit || author)
-                FROM posts
+                SELECT COALESCE(SUM(cnt - 1), 0)
+                FROM (
+                    SELECT COUNT(*) AS cnt
+                    FROM posts
+                    GROUP BY title, subreddit, author
+                    HAVING cnt > 1
+                )
             ''')
             duplicate_posts_by_content = cursor.fetchone()[0]
 
@@ -663,8 +1314,13 @@ class RedditDataStorage:
 
             # Count duplicate comments by content
             cursor.execute('''
-                SELECT COUNT(*) - COUNT(DISTINCT content || post_id || author)
-                FROM comments
+                SELECT COALESCE(SUM(cnt - 1), 0)
+                FROM (
+                    SELECT COUNT(*) AS cnt
+                    FROM comments
+                    GROUP BY content, post_id, author
+                    HAVING cnt > 1
+                )
             ''')
             duplicate_comments_by_content = cursor.fetchone()[0]
 
@@ -672,7 +1328,8 @@ class RedditDataStorage:
             cursor.execute('''
                 SELECT COUNT(*)
                 FROM comments
-                WHERE post_id NOT IN (SELECT id FROM posts)
+                WHERE post_id IS NOT NULL
+                  AND NOT EXISTS (SELECT 1 FROM posts WHERE posts.id = comments.post_id)
             ''')
             orphaned_comments = cursor.fetchone()[0]
 
@@ -695,7 +1352,7 @@ class RedditDataStorage:
         Returns:
             Set of post IDs that already exist in database
         """
-        with self._connect() as conn:
+        with self._read_connect() as conn:
             cursor = conn.cursor()
             
             cutoff_date = datetime.now() - timedelta(days=days_back)
@@ -711,7 +1368,30 @@ class RedditDataStorage:
                     WHERE timestamp > ?
                 ''', (cutoff_date,))
             
-            return {row[0] for row in cursor.fetchall()}
+            return {row[0] for row in cursor}
+    
+    def load_recent_post_ids(self, limit: int = 100_000) -> set:
+        """
+        Load the IDs of the most recently posted posts across all subreddits.
+
+        Intended to be called once per run and handed to the collector, so
+        duplicates are skipped at fetch time instead of per-subreddit queries.
+
+        Args:
+            limit: Maximum number of IDs to load (newest first)
+
+        Returns:
+            Set of post IDs
+        """
+        with self._read_connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT id FROM posts
+                ORDER BY timestamp DESC
+                LIMIT ?
+            ''', (limit,))
+
+            return {row[0] for row in cursor}
     
     def get_existing_post_ids_in_timeframe(self, subreddit: str, start_date: datetime, end_date: datetime) -> set:
         """
@@ -725,7 +1405,7 @@ class RedditDataStorage:
         Returns:
             Set of post IDs that already exist in the timeframe
         """
-        with self._connect() as conn:
+        with self._read_connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -733,7 +1413,7 @@ class RedditDataStorage:
                 WHERE subreddit = ? AND timestamp BETWEEN ? AND ?
             ''', (subreddit, start_date, end_date))
             
-            return {row[0] for row in cursor.fetchall()}
+            return {row[0] for row in cursor}
     
     def get_existing_comment_ids(self, post_ids: List[str] = None, days_back: int = 7) -> set:
         """
@@ -746,10 +1426,12 @@ class RedditDataStorage:
         Returns:
             Set of comment IDs that already exist in database
         """
-        with self._connect() as conn:
+        with self._read_connect() as conn:
             cursor = conn.cursor()
             
-            if post_ids:
+            if post_ids and len(post_ids) > _MAX_INLINE_PARAMS:
+                return self._comment_ids_for_many_posts(cursor, post_ids)
+            elif post_ids:
                 # Use IN clause for specific posts
                 placeholders = ','.join('?' for _ in post_ids)
                 cursor.execute(f'''
@@ -764,8 +1446,36 @@ class RedditDataStorage:
                     WHERE timestamp > ?
                 ''', (cutoff_date,))
             
-            return {row[0] for row in cursor.fetchall()}
+            return {row[0] for row in cursor}
     
+    def _comment_ids_for_many_posts(self, cursor, post_ids: List[str]) -> set:
+        """
+        Comment IDs for more post IDs than fit in one IN list.
+
+        SQLite joins against a temporary table of the IDs; PostgreSQL runs
+        the IN query in chunks.
+        """
+        if self._using_postgres():
+            comment_ids = set()
+            for start in range(0, len(post_ids), _MAX_INLINE_PARAMS):
+                chunk = post_ids[start:start + _MAX_INLINE_PARAMS]
+                placeholders = ','.join('?' for _ in chunk)
+                cursor.execute(f'SELECT id FROM comments WHERE post_id IN ({placeholders})', chunk)
+                comment_ids.update(row[0] for row in cursor)
+            return comment_ids
+
+        cursor.execute('CREATE TEMP TABLE IF NOT EXISTS _lookup_post_ids (id TEXT PRIMARY KEY)')
+        try:
+            cursor.executemany('INSERT OR IGNORE INTO _lookup_post_ids VALUES (?)',
+                               [(post_id,) for post_id in post_ids])
+            cursor.execute('''
+                SELECT c.id FROM comments c
+                JOIN _lookup_post_ids p ON c.post_id = p.id
+            ''')
+            return {row[0] for row in cursor}
+        finally:
+            cursor.execute('DROP TABLE _lookup_post_ids')
+
     def get_last_collection_timestamp(self, subreddit: str) -> Optional[datetime]:
         """
         Get the timestamp of the most recent post collected for a subreddit.
@@ -798,6 +1508,20 @@ class RedditDataStorage:
             posts_collected: Number of posts collected
             comments_collected: Number of comments collected
         """
+        self.update_collection_metadata_batch(
+            [(subreddit, collection_time, posts_collected, comments_collected)]
+        )
+    
+    def update_collection_metadata_batch(self, rows: List[Tuple[str, datetime, int, int]]):
+        """
+        Store metadata for several collection runs in one transaction.
+        
+        Args:
+            rows: (subreddit, collection_time, posts_collected, comments_collected) tuples
+        """
+        if not rows:
+            return
+        
         with self._connect() as conn:
             cursor = conn.cursor()
             
@@ -814,14 +1538,16 @@ class RedditDataStorage:
             ''')
             
             # Insert collection metadata
-            cursor.execute('''
+            cursor.executemany('''
                 INSERT INTO collection_metadata 
                 (subreddit, collection_timestamp, posts_collected, comments_collected)
                 VALUES (?, ?, ?, ?)
-            ''', (subreddit, collection_time, posts_collected, comments_collected))
+            ''', rows)
             
             conn.commit()
+        self._invalidate_cache()
     
+    @_cached_until_write
     def get_collection_efficiency_stats(self, subreddit: str = None, days_back: int = 30) -> Dict:
         """
         Get efficiency statistics for recent collections.
@@ -834,44 +1560,46 @@ class RedditDataStorage:
             Dictionary with efficiency metrics
         """
         with self._connect() as conn:
-            cursor = conn.cursor()
-            
-            cutoff_date = datetime.now() - timedelta(days=days_back)
-            
-            # Get basic collection stats
-            if subreddit:
-                cursor.execute('''
-                    SELECT 
-                        COUNT(*) as collections,
-                        SUM(posts_collected) as total_posts,
-                        SUM(comments_collected) as total_comments,
-                        AVG(posts_collected) as avg_posts_per_run,
-                        AVG(comments_collected) as avg_comments_per_run
-                    FROM collection_metadata 
-                    WHERE subreddit = ? AND collection_timestamp > ?
-                ''', (subreddit, cutoff_date))
-            else:
-                cursor.execute('''
-                    SELECT 
-                        COUNT(*) as collections,
-                        SUM(posts_collected) as total_posts,
-                        SUM(comments_collected) as total_comments,
-                        AVG(posts_collected) as avg_posts_per_run,
-                        AVG(comments_collected) as avg_comments_per_run
-                    FROM collection_metadata 
-                    WHERE collection_timestamp > ?
-                ''', (cutoff_date,))
-            
-            result = cursor.fetchone()
-            
-            return {
-                'total_collections': result[0] or 0,
-                'total_posts_collected': result[1] or 0,
-                'total_comments_collected': result[2] or 0,
-                'avg_posts_per_run': result[3] or 0,
-                'avg_comments_per_run': result[4] or 0,
-                'analysis_period_days': days_back
-            }
+            return self._collection_efficiency_stats(conn.cursor(), subreddit, days_back)
+
+    def _collection_efficiency_stats(self, cursor, subreddit: Optional[str], days_back: int) -> Dict:
+        """Compute collection efficiency stats using an existing cursor."""
+        cutoff_date = datetime.now() - timedelta(days=days_back)
+        
+        # Get basic collection stats
+        if subreddit:
+            cursor.execute('''
+                SELECT 
+                    COUNT(*) as collections,
+                    SUM(posts_collected) as total_posts,
+                    SUM(comments_collected) as total_comments,
+                    AVG(posts_collected) as avg_posts_per_run,
+                    AVG(comments_collected) as avg_comments_per_run
+                FROM collection_metadata 
+                WHERE subreddit = ? AND collection_timestamp > ?
+            ''', (subreddit, cutoff_date))
+        else:
+            cursor.execute('''
+                SELECT 
+                    COUNT(*) as collections,
+                    SUM(posts_collected) as total_posts,
+                    SUM(comments_collected) as total_comments,
+                    AVG(posts_collected) as avg_posts_per_run,
+                    AVG(comments_collected) as avg_comments_per_run
+                FROM collection_metadata 
+                WHERE collection_timestamp > ?
+            ''', (cutoff_date,))
+        
+        result = cursor.fetchone()
+        
+        return {
+            'total_collections': result[0] or 0,
+            'total_posts_collected': result[1] or 0,
+            'total_comments_collected': result[2] or 0,
+            'avg_posts_per_run': result[3] or 0,
+            'avg_comments_per_run': result[4] or 0,
+            'analysis_period_days': days_back
+        }
 
     def store_batch(self, batch_result: Dict) -> Dict:
         """
@@ -902,8 +1630,9 @@ class RedditDataStorage:
             cursor = conn.cursor()
             
             try:
-                # Begin explicit transaction for atomic storage
-                cursor.execute('BEGIN TRANSACTION')
+                # Begin explicit transaction for atomic storage, taking the
+                # SQLite write lock up front
+                cursor.execute('BEGIN TRANSACTION' if self._using_postgres() else 'BEGIN IMMEDIATE')
                 
                 # Store posts with transaction cursor
                 posts_stored = 0
@@ -956,6 +1685,9 @@ class RedditDataStorage:
     def _store_posts_transaction(self, cursor, posts: List[RedditPost]) -> int:
         """
         Store posts within an existing transaction.
+
+        Rows are filtered and written like store_posts: one executemany, with
+        any rows the database rejects isolated by savepoint.
         
         Args:
             cursor: Database cursor within active transaction
@@ -967,29 +1699,16 @@ class RedditDataStorage:
         if not posts:
             return 0
 
-        stored_count = 0
-        for post in posts:
-            try:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO posts
-                    (id, title, content, upvotes, timestamp, subreddit, author,
-                     author_karma, url, num_comments, content_type)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    post.id, post.title, post.content, post.upvotes,
-                    post.timestamp, post.subreddit, post.author,
-                    post.author_karma, post.url, post.num_comments, post.content_type
-                ))
-                stored_count += 1
-            except Exception as e:
-                logger.error(f"Error storing post {post.id} in transaction: {e}")
-                # Don't raise here - let transaction-level error handling manage it
-                
-        return stored_count
+        self._invalidate_cache()
+        rows = self._valid_rows(map(_post_row, posts), 'post')
+        return self._insert_rows(cursor, _POST_UPSERT_SQL, rows, 'post') if rows else 0
 
     def _store_comments_transaction(self, cursor, comments: List[RedditComment]) -> int:
         """
         Store comments within an existing transaction.
+
+        Rows are filtered and written like store_comments: one executemany,
+        with any rows the database rejects isolated by savepoint.
         
         Args:
             cursor: Database cursor within active transaction  
@@ -1001,25 +1720,9 @@ class RedditDataStorage:
         if not comments:
             return 0
 
-        stored_count = 0
-        for comment in comments:
-            try:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO comments
-                    (id, parent_id, content, upvotes, timestamp, subreddit,
-                     author, author_karma, post_id, content_type)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    comment.id, comment.parent_id, comment.content, comment.upvotes,
-                    comment.timestamp, comment.subreddit, comment.author,
-                    comment.author_karma, comment.post_id, comment.content_type
-                ))
-                stored_count += 1
-            except Exception as e:
-                logger.error(f"Error storing comment {comment.id} in transaction: {e}")
-                # Don't raise here - let transaction-level error handling manage it
-                
-        return stored_count
+        self._invalidate_cache()
+        rows = self._valid_rows(map(_comment_row, comments), 'comment')
+        return self._insert_rows(cursor, _COMMENT_UPSERT_SQL, rows, 'comment') if rows else 0
 
     def _update_batch_metadata(self, cursor, subreddit: str, collection_time: datetime, 
                              posts_stored: int, comments_stored: int, processing_time: float):
@@ -1069,6 +1772,123 @@ class RedditDataStorage:
         ''', (subreddit, collection_time, posts_stored, comments_stored, 
               processing_time, 'completed'))
 
+    def store_historical_chunk(self, posts: List[RedditPost], comments: List[RedditComment],
+                               subreddits: Dict[str, Tuple[int, int]], chunk_start: datetime,
+                               chunk_end: datetime) -> Dict[str, int]:
+        """
+        Store one historical chunk and checkpoint it in a single transaction.
+
+        Posts, comments and the completed (subreddit, chunk) markers commit
+        together, so a resumed run never skips a chunk whose data was lost.
+
+        Args:
+            posts: Posts collected for the chunk
+            comments: Comments collected for the chunk
+            subreddits: Subreddits that finished collecting for the chunk, mapped
+                to the (posts, comments) counts collected from each
+            chunk_start: Chunk start date
+            chunk_end: Chunk end date
+
+        Returns:
+            Dictionary with posts_stored and comments_stored counts
+
+        Raises:
+            StorageError: If storage operation fails after rollback
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+
+            try:
+                cursor.execute('BEGIN TRANSACTION' if self._using_postgres() else 'BEGIN IMMEDIATE')
+
+                posts_stored = self._store_posts_transaction(cursor, posts)
+                comments_stored = self._store_comments_transaction(cursor, comments)
+                for subreddit, (posts_collected, comments_collected) in subreddits.items():
+                    self._mark_chunk_done_transaction(cursor, subreddit, chunk_start, chunk_end,
+                                                      posts_collected, comments_collected)
+
+                cursor.execute('COMMIT')
+
+                return {
+                    'posts_stored': posts_stored,
+                    'comments_stored': comments_stored
+                }
+
+            except Exception as e:
+                cursor.execute('ROLLBACK')
+                error_msg = (f"Historical chunk storage failed for "
+                             f"{chunk_start.isoformat()} to {chunk_end.isoformat()}: {e}")
+                logger.error(error_msg)
+
+                from .exceptions import StorageError
+                raise StorageError(error_msg) from e
+
+    def mark_chunk_done(self, subreddit: str, chunk_start: datetime, chunk_end: datetime,
+                        posts_collected: int = 0, comments_collected: int = 0):
+        """
+        Record a historical collection chunk as completed for a subreddit.
+
+        Args:
+            subreddit: Subreddit that was collected
+            chunk_start: Chunk start date
+            chunk_end: Chunk end date
+            posts_collected: Number of posts collected in the chunk
+            comments_collected: Number of comments collected in the chunk
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            self._mark_chunk_done_transaction(cursor, subreddit, chunk_start, chunk_end,
+                                              posts_collected, comments_collected)
+            conn.commit()
+
+    def completed_chunks(self) -> set:
+        """
+        Get historical collection chunks that have already been completed.
+
+        Returns:
+            Set of (subreddit, chunk_start, chunk_end) tuples
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            self._ensure_checkpoint_table(cursor)
+
+            cursor.execute('''
+                SELECT subreddit, chunk_start, chunk_end FROM historical_checkpoints
+            ''')
+
+            return {
+                (row[0], datetime.fromisoformat(row[1]), datetime.fromisoformat(row[2]))
+                for row in cursor.fetchall()
+            }
+
+    def _mark_chunk_done_transaction(self, cursor, subreddit: str, chunk_start: datetime,
+                                     chunk_end: datetime, posts_collected: int,
+                                     comments_collected: int):
+        """Record a completed historical chunk within an existing transaction."""
+        self._ensure_checkpoint_table(cursor)
+
+        cursor.execute('''
+            INSERT OR REPLACE INTO historical_checkpoints
+            (subreddit, chunk_start, chunk_end, posts_collected, comments_collected)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (subreddit, chunk_start.isoformat(), chunk_end.isoformat(),
+              posts_collected, comments_collected))
+
+    def _ensure_checkpoint_table(self, cursor):
+        """Create the historical checkpoint table if it doesn't exist."""
+        # Chunk bounds are kept as ISO text so lookups match exactly on both backends
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS historical_checkpoints (
+                subreddit TEXT NOT NULL,
+                chunk_start TEXT NOT NULL,
+                chunk_end TEXT NOT NULL,
+                posts_collected INTEGER DEFAULT 0,
+                comments_collected INTEGER DEFAULT 0,
+                completed_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (subreddit, chunk_start, chunk_end)
+            )
+        ''')
+
     def get_collection_resume_state(self, subreddit_list: List[str], hours_back: int = 24) -> Dict:
         """
         Check which subreddits have been recently collected for resume functionality.
@@ -1165,38 +1985,40 @@ class RedditDataStorage:
             List of batch collection records with details
         """
         with self._connect() as conn:
-            cursor = conn.cursor()
-            
-            query = '''
-                SELECT subreddit, collection_timestamp, posts_collected, 
-                       comments_collected, processing_time_seconds, batch_status,
-                       storage_timestamp
-                FROM batch_collections
-            '''
-            params = []
-            
-            if subreddit:
-                query += ' WHERE subreddit = ?'
-                params.append(subreddit)
-            
-            query += ' ORDER BY collection_timestamp DESC LIMIT ?'
-            params.append(limit)
-            
-            cursor.execute(query, params)
-            
-            history = []
-            for row in cursor.fetchall():
-                history.append({
-                    'subreddit': row[0],
-                    'collection_timestamp': row[1],
-                    'posts_collected': row[2],
-                    'comments_collected': row[3],
-                    'processing_time_seconds': row[4],
-                    'batch_status': row[5],
-                    'storage_timestamp': row[6]
-                })
-            
-            return history
+            return self._batch_collection_history(conn.cursor(), subreddit, limit)
+
+    def _batch_collection_history(self, cursor, subreddit: Optional[str], limit: int) -> List[Dict]:
+        """Fetch batch collection history using an existing cursor."""
+        query = '''
+            SELECT subreddit, collection_timestamp, posts_collected, 
+                   comments_collected, processing_time_seconds, batch_status,
+                   storage_timestamp
+            FROM batch_collections
+        '''
+        params = []
+        
+        if subreddit:
+            query += ' WHERE subreddit = ?'
+            params.append(subreddit)
+        
+        query += ' ORDER BY collection_timestamp DESC LIMIT ?'
+        params.append(limit)
+        
+        cursor.execute(query, params)
+        
+        history = []
+        for row in cursor.fetchall():
+            history.append({
+                'subreddit': row[0],
+                'collection_timestamp': row[1],
+                'posts_collected': row[2],
+                'comments_collected': row[3],
+                'processing_time_seconds': row[4],
+                'batch_status': row[5],
+                'storage_timestamp': row[6]
+            })
+        
+        return history
 
     def get_failed_subreddits(self, hours_back: int = 24) -> List[Dict]:
         """
@@ -0,0 +1,74 @@
+"""
+Tests for the Reddit data collector's fetch-time filtering.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.reddit_api.collector import RedditDataCollector
+from src.reddit_api.models import RedditConfig
+
+
+@pytest.fixture
+def test_config():
+    """Create test configuration."""
+    return RedditConfig(
+        client_id='test_client',
+        client_secret='test_secret',
+        user_agent='test_agent',
+        target_subreddits=['test1'],
+        target_keywords=[]
+    )
+
+
+def make_submission(post_id):
+    return SimpleNamespace(id=post_id, fullname=f't3_{post_id}')
+
+
+def extract(submission):
+    return SimpleNamespace(id=submission.id, title='title', content='')
+
+
+class TestSeenIds:
+    """Test skipping of already-stored posts via a preloaded ID set."""
+
+    def test_seen_ids_replace_per_subreddit_query(self, test_config):
+        storage = MagicMock()
+        seen_ids = {'old'}
+        collector = RedditDataCollector(test_config, storage, seen_ids=seen_ids)
+        submissions = [make_submission('old'), make_submission('new')]
+
+        with patch.object(collector.client, 'make_request', return_value=submissions), \
+             patch.object(collector, '_extract_post_data', side_effect=extract):
+            posts = collector.collect_subreddit_posts('test1', limit=5)
+
+        assert [p.id for p in posts] == ['new']
+        storage.get_existing_post_ids.assert_not_called()
+        assert seen_ids == {'old', 'new'}
+
+    def test_iter_subreddit_posts_skips_seen_ids(self, test_config):
+        collector = RedditDataCollector(test_config, seen_ids={'a'})
+        pages = [[make_submission('a'), make_submission('b')], []]
+
+        with patch.object(collector.client, 'make_request', side_effect=pages), \
+             patch.object(collector, '_extract_post_data', side_effect=extract):
+            posts = list(collector.iter_subreddit_posts('test1', page_size=2))
+
+        assert [p.id for p in posts] == ['b']
+
+    def test_storage_query_used_without_seen_ids(self, test_config):
+        storage = MagicMock()
+        storage.get_existing_post_ids.return_value = {'old'}
+        collector = RedditDataCollector(test_config, storage)
+
+        with patch.object(collector.client, 'make_request', return_value=[make_submission('old')]), \
+             patch.object(collector, '_extract_post_data', side_effect=extract):
+            assert collector.collect_subreddit_posts('test1', limit=5) == []
+
+        storage.get_existing_post_ids.assert_called_once_with('test1', days_back=7)
@@ -0,0 +1,416 @@
+"""
+Tests for Historical Reddit Data Collection
+
+Covers chunked collection, time-window filtering and storage batching.
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.reddit_api.historical import (
+    ChunkResult, HistoricalCollectionProgress, HistoricalRedditCollector, TimeFrame, _parse_iso
+)
+from src.reddit_api.models import RedditConfig, RedditPost, RedditComment
+from src.reddit_api.storage import RedditDataStorage
+
+
+@pytest.fixture
+def temp_db():
+    """Create temporary database for testing."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    yield path
+    os.unlink(path)
+
+
+@pytest.fixture
+def test_config():
+    """Create test configuration."""
+    return RedditConfig(
+        client_id='test_client',
+        client_secret='test_secret',
+        user_agent='test_agent',
+        target_subreddits=['test1', 'test2'],
+        target_keywords=['inflation']
+    )
+
+
+@pytest.fixture
+def historical(temp_db, test_config):
+    """Historical collector with request delays disabled."""
+    collector = HistoricalRedditCollector(test_config, RedditDataStorage(temp_db))
+    with patch.object(collector, '_apply_request_delay'), \
+         patch.object(collector, '_handle_request_error'):
+        yield collector
+
+
+def make_post(post_id, subreddit, timestamp, title='Inflation is rising'):
+    return RedditPost(
+        id=post_id,
+        title=title,
+        content='',
+        upvotes=10,
+        timestamp=timestamp,
+        subreddit=subreddit,
+        author='author',
+        author_karma=100,
+        url='https://reddit.com/test',
+        num_comments=1
+    )
+
+
+def make_comment(comment_id, post_id, subreddit, timestamp):
+    return RedditComment(
+        id=comment_id,
+        parent_id=post_id,
+        content='inflation comment',
+        upvotes=1,
+        timestamp=timestamp,
+        subreddit=subreddit,
+        author='commenter',
+        author_karma=10,
+        post_id=post_id
+    )
+
+
+def utc_as_local(*args):
+    """Naive local time for a UTC wall-clock time."""
+    return datetime(*args, tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+
+
+@pytest.fixture
+def chunk():
+    end = datetime.now() - timedelta(hours=1)
+    return TimeFrame(end - timedelta(days=7), end)
+
+
+class TestTimeFrame:
+    """Test time frame parsing."""
+
+    def test_from_strings_parses_dates(self):
+        frame = TimeFrame.from_strings('2024-01-01', '2024-01-08T12:30:00')
+
+        assert frame.start_date == datetime(2024, 1, 1)
+        assert frame.end_date == datetime(2024, 1, 8, 12, 30)
+
+    def test_parse_iso_accepts_utc_suffix(self):
+        parsed = _parse_iso('2024-01-01T00:00:00Z')
+
+        assert parsed.utcoffset() == timedelta(0)
+
+    def test_aware_bounds_become_naive_local_time(self):
+        frame = TimeFrame.from_strings('2024-01-01T00:00:00Z', '2024-01-08T00:00:00Z')
+
+        assert frame.start_date == utc_as_local(2024, 1, 1)
+        assert frame.end_date.tzinfo is None
+
+    def test_from_strings_rejects_invalid_dates(self):
+        with pytest.raises(ValueError, match='Invalid date format'):
+            TimeFrame.from_strings('yesterday', '2024-01-02')
+
+
+class TestProgress:
+    """Test progress tracking and ETA estimation."""
+
+    def test_eta_uses_monotonic_elapsed(self):
+        progress = HistoricalCollectionProgress(total_chunks=4)
+        assert progress.get_eta_minutes() is None
+
+        progress.update_progress(chunk_complete=True)
+        with patch('src.reddit_api.historical.time.monotonic',
+                   return_value=progress._start_monotonic + 60):
+            assert progress.get_eta_minutes() == pytest.approx(3.0)
+
+
+    def test_update_progress_uses_supplied_time(self):
+        progress = HistoricalCollectionProgress(total_chunks=2)
+        now = datetime(2024, 1, 1, 12, 0)
+
+        progress.update_progress(chunk_complete=True, posts=3, now=now)
+
+        assert progress.last_update == now
+        assert progress.posts_collected == 3
+
+
+class TestTimeFilteredPosts:
+    """Test time-window and keyword filtering."""
+
+    def test_filters_by_window_and_keywords(self, historical, chunk):
+        inside = chunk.end_date - timedelta(days=1)
+        posts = [
+            make_post('too_new', 'test1', chunk.end_date + timedelta(minutes=30)),
+            make_post('in_match', 'test1', inside),
+            make_post('in_no_match', 'test1', inside, title='Unrelated'),
+            make_post('too_old', 'test1', chunk.start_date - timedelta(days=1)),
+        ]
+        with patch.object(historical.collector, 'iter_subreddit_posts', return_value=iter(posts)):
+            filtered = historical._collect_time_filtered_posts('test1', chunk, 10, ['inflation'])
+
+        assert [p.id for p in filtered] == ['in_match']
+
+    def test_aware_frame_filters_naive_post_timestamps(self, historical):
+        frame = TimeFrame.from_strings('2024-01-01T00:00:00Z', '2024-01-08T00:00:00Z')
+        # Posts carry naive local timestamps, as built by the collector
+        posts = [
+            make_post('too_new', 'test1', utc_as_local(2024, 1, 9)),
+            make_post('inside', 'test1', utc_as_local(2024, 1, 4)),
+            make_post('too_old', 'test1', utc_as_local(2023, 12, 30)),
+        ]
+
+        with patch.object(historical.collector, 'iter_subreddit_posts', return_value=iter(posts)), \
+             patch.object(historical.collector, 'collect_post_comments', return_value=[]):
+            results = historical._collect_chunk(frame, ['test1'], [], 10, 5)
+
+        assert results.errors == []
+        assert results.posts_collected == 1
+        assert historical.storage.get_existing_post_ids_in_timeframe(
+            'test1', frame.start_date, frame.end_date
+        ) == {'inside'}
+
+    def test_stops_consuming_once_below_window(self, historical, chunk):
+        consumed = []
+
+        def newest_first(*args, **kwargs):
+            for offset in range(1, 20):
+                post = make_post(f'post_{offset}', 'test1', chunk.end_date - timedelta(days=offset))
+                consumed.append(post.id)
+                yield post
+
+        with patch.object(historical.collector, 'iter_subreddit_posts', side_effect=newest_first):
+            filtered = historical._collect_time_filtered_posts('test1', chunk, 100, [])
+
+        # Offsets 1..7 fall inside the inclusive window; offset 8 ends iteration
+        assert len(filtered) == 7
+        assert len(consumed) == 8
+
+
+class TestContainsKeywords:
+    """Test case-insensitive keyword matching."""
+
+    def test_accepts_keywords_in_any_case(self, historical):
+        assert historical._contains_keywords('Learning python with ai', ['Python'])
+        assert historical._contains_keywords('Die STRASSE', ['Straße'])
+        assert not historical._contains_keywords('Sports', ['AI'])
+        assert historical._contains_keywords('Anything', [])
+
+
+class TestIterSubredditPosts:
+    """Test lazy listing pagination in the collector."""
+
+    def test_requests_pages_only_as_consumed(self, historical):
+        collector = historical.collector
+        now = datetime.now()
+        pages = [
+            [SimpleNamespace(id=f'{prefix}{i}', fullname=f't3_{prefix}{i}') for i in range(2)]
+            for prefix in ('a', 'b')
+        ]
+        calls = []
+
+        def make_request(request_func, page_limit, after):
+            calls.append(after)
+            return pages[len(calls) - 1] if len(calls) <= len(pages) else []
+
+        with patch.object(collector.client, 'make_request', side_effect=make_request), \
+             patch.object(collector, '_extract_post_data',
+                          side_effect=lambda submission: make_post(submission.id, 'test1', now)):
+            posts = collector.iter_subreddit_posts('test1', page_size=2, max_posts=10, skip_ids={'a1'})
+            assert next(posts).id == 'a0'
+            assert calls == [None]
+            assert [p.id for p in posts] == ['b0', 'b1']
+
+        assert calls == [None, 't3_a1', 't3_b1']
+
+
+class TestCollectHistoricalData:
+    """Test run-level argument handling."""
+
+    def test_keywords_folded_and_subreddits_deduplicated(self, historical, chunk):
+        with patch.object(historical, '_collect_chunk', return_value=ChunkResult()) as collect_chunk:
+            historical.collect_historical_data(
+                chunk, subreddits=['test1', 'test2', 'test1'], keywords=['INFLATION', 'Straße'],
+                chunk_days=7, resume_from_checkpoint=False
+            )
+
+        args = collect_chunk.call_args.args
+        assert list(args[1]) == ['test1', 'test2']
+        assert args[2] == ('inflation', 'strasse')
+
+
+class TestCollectChunk:
+    """Test per-chunk collection and storage."""
+
+    def test_stores_once_per_chunk(self, historical, chunk):
+        inside = chunk.end_date - timedelta(days=1)
+
+        def posts_for(subreddit, time_frame, limit, keywords):
+            return [make_post(f'post_{subreddit}', subreddit, inside)]
+
+        def comments_for(post_id, limit):
+            return [make_comment(f'comment_{post_id}', post_id, 'test1', inside)]
+
+        with patch.object(historical, '_collect_time_filtered_posts', side_effect=posts_for), \
+             patch.object(historical.collector, 'collect_post_comments', side_effect=comments_for), \
+             patch.object(historical.storage, 'store_historical_chunk',
+                          wraps=historical.storage.store_historical_chunk) as store_chunk:
+            results = historical._collect_chunk(chunk, ['test1', 'test2'], ['inflation'], 10, 5)
+
+        assert store_chunk.call_count == 1
+        assert results.posts_collected == 2
+        assert results.comments_collected == 2
+        assert results.errors == []
+
+    def test_checkpoints_record_per_subreddit_counts(self, historical, chunk):
+        inside = chunk.end_date - timedelta(days=1)
+
+        def posts_for(subreddit, time_frame, limit, keywords):
+            count = 2 if subreddit == 'test1' else 1
+            return [make_post(f'{subreddit}_{i}', subreddit, inside) for i in range(count)]
+
+        with patch.object(historical, '_collect_time_filtered_posts', side_effect=posts_for), \
+             patch.object(historical.collector, 'collect_post_comments', return_value=[]):
+            historical._collect_chunk(chunk, ['test1', 'test2'], [], 10, 5)
+
+        with historical.storage._connect() as conn:
+            rows = conn.execute(
+                'SELECT subreddit, posts_collected FROM historical_checkpoints ORDER BY subreddit'
+            ).fetchall()
+        assert rows == [('test1', 2), ('test2', 1)]
+
+
+class TestCheckpointing:
+    """Test persistent chunk checkpoints and resumption."""
+
+    def test_chunk_checkpoint_is_recorded(self, historical, chunk):
+        with patch.object(historical, '_collect_time_filtered_posts', return_value=[]):
+            historical._collect_chunk(chunk, ['test1', 'test2'], [], 10, 5)
+
+        assert historical.storage.completed_chunks() == {
+            ('test1', chunk.start_date, chunk.end_date),
+            ('test2', chunk.start_date, chunk.end_date),
+        }
+
+    def test_failed_subreddit_is_not_checkpointed(self, historical, chunk):
+        def posts_for(subreddit, time_frame, limit, keywords):
+            if subreddit == 'test2':
+                raise RuntimeError('boom')
+            return []
+
+        with patch.object(historical, '_collect_time_filtered_posts', side_effect=posts_for):
+            historical._collect_chunk(chunk, ['test1', 'test2'], [], 10, 5)
+
+        assert historical.storage.completed_chunks() == {
+            ('test1', chunk.start_date, chunk.end_date)
+        }
+
+    def test_resume_skips_completed_chunks(self, historical, chunk):
+        for subreddit in ('test1', 'test2'):
+            historical.storage.mark_chunk_done(subreddit, chunk.start_date, chunk.end_date)
+
+        with patch.object(historical, '_collect_chunk') as collect_chunk:
+            results = historical.collect_historical_data(
+                chunk, subreddits=['test1', 'test2'], chunk_days=7
+            )
+
+        collect_chunk.assert_not_called()
+        assert results['chunks_skipped'] == 1
+        assert 'error' not in results
+        assert historical.progress.completed_chunks == 1
+
+
+class TestSparseSubredditSkipping:
+    """Test skipping of subreddits that keep returning empty chunks."""
+
+    def test_skips_old_windows_after_empty_streak(self, historical):
+        now = datetime.now()
+        old_chunks = TimeFrame(now - timedelta(days=60), now - timedelta(days=32)).split_into_chunks(7)
+        calls = []
+
+        def posts_for(subreddit, time_frame, limit, keywords):
+            calls.append(subreddit)
+            return []
+
+        with patch.object(historical, '_collect_time_filtered_posts', side_effect=posts_for):
+            for old_chunk in old_chunks:
+                historical._collect_chunk(old_chunk, ['test1'], [], 10, 5, now=now)
+            recent = TimeFrame(now - timedelta(days=7), now - timedelta(hours=1))
+            historical._collect_chunk(recent, ['test1'], [], 10, 5, now=now)
+
+        # Two empty old chunks, then skipped until the recent window
+        assert calls == ['test1', 'test1', 'test1']
+
+    def test_hit_resets_empty_streak(self, historical, chunk):
+        historical._empty_streak['test1'] = 1
+        inside = chunk.end_date - timedelta(days=1)
+
+        with patch.object(historical, '_collect_time_filtered_posts',
+                          return_value=[make_post('post_1', 'test1', inside)]), \
+             patch.object(historical.collector, 'collect_post_comments', return_value=[]):
+            historical._collect_chunk(chunk, ['test1'], [], 10, 5)
+
+        assert historical._empty_streak['test1'] == 0
+
+
+class TestRequestBackoff:
+    """Test error backoff and request delay interaction."""
+
+    @pytest.fixture
+    def backoff_collector(self, temp_db, test_config):
+        return HistoricalRedditCollector(test_config, RedditDataStorage(temp_db))
+
+    def test_delay_skipped_right_after_backoff(self, backoff_collector):
+        with patch('src.reddit_api.historical.time.sleep') as sleep:
+            backoff_collector._handle_request_error(RuntimeError('boom'))
+            backoff_collector._apply_request_delay()
+            backoff_collector._apply_request_delay()
+
+        assert [c.args[0] for c in sleep.call_args_list] == [4.0, 4.0]
+
+    def test_request_after_backoff_is_still_paced(self, backoff_collector):
+        now = datetime.now()
+        posts = [make_post(f'post_{i}', 'test1', now) for i in range(4)]
+
+        def comments_for(post_id, limit):
+            if post_id == 'post_1':
+                raise RuntimeError('boom')
+            return []
+
+        with patch.object(backoff_collector, '_collect_time_filtered_posts', return_value=posts), \
+             patch.object(backoff_collector.collector, 'collect_post_comments', side_effect=comments_for), \
+             patch('src.reddit_api.historical.time.sleep') as sleep:
+            backoff_collector._collect_subreddit_window('test1', None, [], 10, 5)
+
+        # post_0 paced, post_1 backs off, post_2 and post_3 are each paced
+        assert [c.args[0] for c in sleep.call_args_list] == [2.0, 4.0, 4.0, 3.6]
+
+    def test_delay_skipped_when_backoff_ends_window(self, backoff_collector):
+        posts = [make_post('post_0', 'test1', datetime.now())]
+
+        with patch.object(backoff_collector, '_collect_time_filtered_posts', return_value=posts), \
+             patch.object(backoff_collector.collector, 'collect_post_comments',
+                          side_effect=RuntimeError('boom')), \
+             patch('src.reddit_api.historical.time.sleep') as sleep:
+            backoff_collector._collect_subreddit_window('test1', None, [], 10, 5)
+            backoff_collector._apply_request_delay()
+
+        assert [c.args[0] for c in sleep.call_args_list] == [4.0]
+
+    def test_retry_after_header_is_honoured(self, backoff_collector):
+        class FakeResponse:
+            headers = {'Retry-After': '30'}
+
+        error = RuntimeError('429')
+        error.response = FakeResponse()
+
+        with patch('src.reddit_api.historical.time.sleep') as sleep:
+            backoff_collector._handle_request_error(error)
+
+        sleep.assert_called_once_with(30.0)
+        assert backoff_collector.current_delay == 30.0
@@ -0,0 +1,96 @@
+"""
+Tests for Reddit API data models.
+"""
+
+import json
+import os
+import sys
+from dataclasses import asdict
+from datetime import datetime
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.reddit_api import models as models_module
+from src.reddit_api.models import (
+    CONTENT_TYPE_COMMENT, CONTENT_TYPE_POST, APIUsageMetrics, ContentType, RedditComment, RedditPost
+)
+
+
+def test_post_to_dict_matches_fields():
+    post = RedditPost(
+        id='p1', title='Title', content='Body', upvotes=3,
+        timestamp=datetime(2024, 1, 2, 3, 4, 5), subreddit='test', author='author',
+        author_karma=10, url='https://reddit.com/p1', num_comments=2
+    )
+
+    expected = asdict(post)
+    expected['timestamp'] = '2024-01-02T03:04:05'
+    assert post.to_dict() == expected
+
+
+def test_comment_to_dict_matches_fields():
+    comment = RedditComment(
+        id='c1', parent_id='t3_p1', content='Reply', upvotes=1,
+        timestamp=datetime(2024, 1, 2, 3, 4, 5), subreddit='test', author='commenter',
+        author_karma=5, post_id='p1'
+    )
+
+    expected = asdict(comment)
+    expected['timestamp'] = '2024-01-02T03:04:05'
+    assert comment.to_dict() == expected
+
+
+def test_metrics_to_dict_reuses_iso_strings():
+    metrics = APIUsageMetrics(last_request_time=datetime(2024, 1, 2, 3, 4, 5))
+
+    first = metrics.to_dict()
+    assert first['last_request_time'] == '2024-01-02T03:04:05'
+    assert first['window_start'] is None
+    assert metrics.to_dict()['last_request_time'] is first['last_request_time']
+
+    metrics.last_request_time = datetime(2024, 1, 3)
+    metrics.reset_window()
+    second = metrics.to_dict()
+    assert second['last_request_time'] == '2024-01-03T00:00:00'
+    assert second['window_start'] == metrics.window_start.isoformat()
+
+
+def test_metrics_equality_ignores_iso_cache():
+    serialized = APIUsageMetrics(requests_made=1)
+    serialized.to_dict()
+
+    assert serialized == APIUsageMetrics(requests_made=1)
+
+
+def test_to_json_bytes_matches_to_dict():
+    post = RedditPost(
+        id='p1', title='Café ☕', content='', upvotes=3,
+        timestamp=datetime(2024, 1, 2, 3, 4, 5, 123456), subreddit='test', author='author',
+        author_karma=10, url='https://reddit.com/p1', num_comments=2
+    )
+    comment = RedditComment(
+        id='c1', parent_id='t3_p1', content='Reply', upvotes=1,
+        timestamp=datetime(2024, 1, 2, 3, 4, 5), subreddit='test', author='commenter',
+        author_karma=5, post_id='p1'
+    )
+
+    for item in (post, comment):
+        data = item.to_json_bytes()
+        assert isinstance(data, bytes)
+        assert json.loads(data) == item.to_dict()
+
+
+def test_to_json_bytes_without_orjson(monkeypatch):
+    monkeypatch.setattr(models_module, 'orjson', None)
+    post = RedditPost(
+        id='p1', title='Café', content='', upvotes=3,
+        timestamp=datetime(2024, 1, 2), subreddit='test', author='author',
+        author_karma=10, url='https://reddit.com/p1', num_comments=2
+    )
+
+    assert json.loads(post.to_json_bytes()) == post.to_dict()
+
+
+def test_content_type_constants_match_enum():
+    assert ContentType.POST.value == CONTENT_TYPE_POST == 'post'
+    assert ContentType.COMMENT.value == CONTENT_TYPE_COMMENT == 'comment'
@@ -0,0 +1,78 @@
+"""
+Tests for the rate-limited Reddit client's HTTP session setup.
+"""
+
+import os
+import sys
+
+import pytest
+import requests
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.reddit_api import client as client_module
+from src.reddit_api.client import RateLimitedRedditClient, create_reddit_client
+from src.reddit_api.collector import RedditDataCollector
+from src.reddit_api.models import RedditConfig
+
+
+@pytest.fixture
+def test_config():
+    """Create test configuration."""
+    return RedditConfig(
+        client_id='test_client',
+        client_secret='test_secret',
+        user_agent='test_agent'
+    )
+
+
+def test_praw_uses_client_session(test_config):
+    client = RateLimitedRedditClient(test_config)
+
+    http = client.reddit._core.requestor._http
+    assert isinstance(http, requests.Session)
+
+
+def test_session_pools_connections_and_retries_connects_only():
+    session = client_module._build_requests_session()
+    adapter = session.get_adapter('https://oauth.reddit.com')
+
+    assert adapter._pool_maxsize == 50
+    assert adapter.max_retries.total == 5
+    assert adapter.max_retries.status == 0
+    assert adapter.max_retries.read == 0
+
+
+def test_shared_reddit_instance_is_reused(test_config):
+    reddit = create_reddit_client(test_config)
+
+    first = RedditDataCollector(test_config, reddit=reddit)
+    second = RedditDataCollector(test_config, reddit=reddit)
+
+    assert first.client.reddit is reddit
+    assert second.client.reddit is reddit
+
+
+def test_orjson_hook_decodes_response():
+    pytest.importorskip('orjson')
+
+    session = client_module._build_requests_session()
+    assert client_module._orjson_response_hook in session.hooks['response']
+
+    response = requests.Response()
+    response._content = b'{"kind": "Listing", "data": {"children": []}}'
+    client_module._orjson_response_hook(response)
+
+    assert response.json() == {'kind': 'Listing', 'data': {'children': []}}
+
+
+def test_orjson_hook_raises_value_error_on_bad_json():
+    pytest.importorskip('orjson')
+
+    response = requests.Response()
+    response._content = b'<html>'
+    client_module._orjson_response_hook(response)
+
+    # prawcore maps ValueError from response.json() to BadJSON
+    with pytest.raises(ValueError):
+        response.json()
@@ -0,0 +1,358 @@
+"""
+Tests for the Reddit API main module helpers.
+"""
+
+import os
+import subprocess
+import sys
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.reddit_api import main as main_module
+from src.reddit_api.main import (
+    _collect_traditional_way, _collect_with_batching, _run_summary_queries, collect_reddit_data,
+    create_config_from_env,
+    test_reddit_connection as check_reddit_connection
+)
+from src.reddit_api.models import RedditConfig
+
+
+@pytest.fixture
+def reddit_env(monkeypatch):
+    """Set Reddit environment variables."""
+    monkeypatch.setenv('REDDIT_CLIENT_ID', 'env_client')
+    monkeypatch.setenv('REDDIT_CLIENT_SECRET', 'env_secret')
+    monkeypatch.setenv('TARGET_SUBREDDITS', 'python, datascience ,MachineLearning')
+    monkeypatch.setenv('TARGET_KEYWORDS', 'AI,LLM')
+    monkeypatch.setenv('MAX_RETRIES', '3')
+
+
+class TestCreateConfigFromEnv:
+    """Test environment-driven configuration."""
+
+    def test_parses_environment(self, reddit_env):
+        config = create_config_from_env()
+
+        assert config.client_id == 'env_client'
+        assert config.target_subreddits == ['python', 'datascience', 'MachineLearning']
+        assert config.target_keywords == ['AI', 'LLM']
+        assert config.max_retries == 3
+        assert config.base_delay == 1.0
+        assert config.max_requests_per_window == 600
+
+    def test_reads_current_environment(self, reddit_env, monkeypatch):
+        assert create_config_from_env().max_retries == 3
+
+        monkeypatch.setenv('MAX_RETRIES', '9')
+
+        assert create_config_from_env().max_retries == 9
+
+    def test_dotenv_loaded_once_on_first_config(self, reddit_env):
+        main_module._ensure_dotenv.cache_clear()
+        with patch.object(main_module, 'load_dotenv') as load_dotenv:
+            create_config_from_env()
+            create_config_from_env()
+
+        load_dotenv.assert_called_once()
+
+    def test_returns_independent_configs(self, reddit_env):
+        first = create_config_from_env()
+        first.target_subreddits.append('extra')
+
+        second = create_config_from_env()
+
+        assert first is not second
+        assert 'extra' not in second.target_subreddits
+
+
+class TestTraditionalCollection:
+    """Test the non-batched collection path."""
+
+    def test_metadata_counts_per_subreddit(self):
+        config = RedditConfig(
+            client_id='test_client',
+            client_secret='test_secret',
+            user_agent='test_agent',
+            target_subreddits=['a', 'b', 'c']
+        )
+        items = [('post', SimpleNamespace(subreddit=s)) for s in ('a', 'a', 'b')]
+        items += [('comment', SimpleNamespace(subreddit=s)) for s in ('a', 'b', 'b', 'b')]
+        collector = MagicMock()
+        collector.iter_all_data.return_value = iter(items)
+        collector.client.get_metrics.return_value = {}
+        storage = MagicMock()
+        storage.store_stream.side_effect = lambda stream: {
+            'posts_stored': sum(kind == 'post' for kind, _ in stream),
+            'comments_stored': 4
+        }
+        storage.deduplicate_database.return_value = {}
+
+        result = _collect_traditional_way(collector, storage, config, 5, 5)
+
+        assert result['posts_collected'] == 3
+        assert result['posts_stored'] == 3
+        assert result['comments_collected'] == 4
+        storage.update_collection_metadata_batch.assert_called_once()
+        rows = storage.update_collection_metadata_batch.call_args.args[0]
+        counts = {row[0]: row[2:] for row in rows}
+        assert counts == {'a': (2, 1), 'b': (1, 3), 'c': (0, 0)}
+
+
+class TestBatchedCollectionResult:
+    """Test the batched collection path's result assembly."""
+
+    def test_metrics_read_once_and_stored(self):
+        collector = MagicMock()
+        collector.collect_all_data_with_batching.return_value = {
+            'completed_subreddits': ['a'], 'failed_subreddits': [], 'total_posts': 1,
+            'total_comments': 2, 'success_rate': 100.0, 'start_time': None,
+            'end_time': None, 'batch_results': []
+        }
+        collector.client.get_metrics.return_value = {'requests_made': 3}
+        storage = MagicMock()
+
+        result = _collect_with_batching(collector, storage, MagicMock(), 5, 5, False)
+
+        collector.client.get_metrics.assert_called_once()
+        storage.store_metrics.assert_called_once_with({'requests_made': 3})
+        assert result['api_metrics'] == {'requests_made': 3}
+
+class TestCollectRedditData:
+    """Test collect_reddit_data argument handling."""
+
+    def test_no_subreddits_fails_before_storage_setup(self):
+        config = RedditConfig(client_id='id', client_secret='secret', user_agent='agent',
+                              target_subreddits=[])
+
+        with patch.object(main_module, 'RedditDataStorage') as storage_cls:
+            result = collect_reddit_data(config)
+
+        assert result['success'] is False
+        assert result['error'] == 'no target subreddits configured'
+        storage_cls.assert_not_called()
+
+    def test_resume_keeps_other_config_fields(self):
+        config = RedditConfig(client_id='id', client_secret='secret', user_agent='agent',
+                              target_subreddits=['a', 'b'], window_duration_minutes=3)
+        storage = MagicMock()
+        storage.get_collection_resume_state.return_value = {
+            'resume_available': True,
+            'pending_subreddits': ['b'],
+            'completed_subreddits': ['a'],
+        }
+
+        with patch.object(main_module, 'RedditDataStorage', return_value=storage), \
+             patch.object(main_module, 'RedditDataCollector') as collector_cls, \
+             patch.object(main_module, '_collect_with_batching', return_value={'success': True}):
+            collect_reddit_data(config, enable_resume=True)
+
+        working_config = collector_cls.call_args.args[0]
+        assert working_config.target_subreddits == ['b']
+        assert working_config.window_duration_minutes == 3
+        assert config.target_subreddits == ['a', 'b']
+
+class TestSummaryQueries:
+    """Test the post-collection summary queries."""
+
+    def test_returns_report_sections_in_order(self):
+        storage = MagicMock()
+        storage.get_post_collection_report.return_value = {
+            'summary': {'total_posts': 1},
+            'efficiency_stats': {'total_collections': 2},
+            'batch_history': [{'subreddit': 'a'}],
+        }
+
+        summary, efficiency, history = _run_summary_queries(storage, include_batch_history=True)
+
+        assert summary == {'total_posts': 1}
+        assert efficiency == {'total_collections': 2}
+        assert history == [{'subreddit': 'a'}]
+        storage.get_post_collection_report.assert_called_once_with(
+            days_back=7, batch_limit=5, include_batch_history=True
+        )
+
+    def test_batch_history_optional(self):
+        storage = MagicMock()
+
+        _run_summary_queries(storage)
+
+        assert storage.get_post_collection_report.call_args.kwargs['include_batch_history'] is False
+
+
+class TestConnectionCheck:
+    """Test the credential and connection check output."""
+
+    @pytest.fixture(autouse=True)
+    def interactive_stdout(self, monkeypatch):
+        monkeypatch.setattr(main_module, '_IS_TTY', True)
+
+    def test_default_credentials_rejected_in_one_write(self, capsys):
+        config = RedditConfig(
+            client_id='your_client_id',
+            client_secret='your_client_secret',
+            user_agent='SentimentAnalyzer:v1.0 (by /u/your_username)'
+        )
+
+        with patch.object(sys.stdout, 'write', wraps=sys.stdout.write) as mock_write:
+            assert check_reddit_connection(config) is False
+
+        assert mock_write.call_count == 1
+        output = capsys.readouterr().out
+        assert 'CRITICAL: Default credentials detected!' in output
+        assert '\\n' not in output
+
+    def test_empty_credential_reported_without_connecting(self, capsys):
+        config = RedditConfig(client_id='real_id', client_secret='', user_agent='agent')
+
+        with patch.object(main_module, 'create_reddit_client') as create_client:
+            assert check_reddit_connection(config) is False
+
+        create_client.assert_not_called()
+        output = capsys.readouterr().out
+        assert 'Client ID: ✅ Present' in output
+        assert 'Client Secret: ❌ Missing/Default' in output
+
+    @pytest.mark.parametrize('message, expected, unexpected', [
+        ('received 403 after 401 HTTP response', '401 Error Analysis', '403 Error Analysis'),
+        ('invalid_grant error processing request (401)', 'invalid_grant Error Analysis',
+         '401 Error Analysis'),
+        ('received 403 HTTP response', '403 Error Analysis', '401 Error Analysis'),
+    ])
+    def test_auth_error_hint_follows_priority(self, capsys, message, expected, unexpected):
+        config = RedditConfig(client_id='real_id', client_secret='real_secret', user_agent='agent')
+        reddit = MagicMock()
+        reddit.subreddit.side_effect = RuntimeError(message)
+
+        assert check_reddit_connection(config, reddit=reddit) is False
+
+        output = capsys.readouterr().out
+        assert expected in output
+        assert unexpected not in output
+
+
+class TestEmit:
+    """Test console output routing."""
+
+    def test_prints_plain_text_when_not_a_tty(self, monkeypatch, capsys):
+        monkeypatch.setattr(main_module, '_IS_TTY', False)
+        lines = ['🔍 first', '⚠️  second', '  - café']
+
+        main_module._emit(lines)
+
+        assert capsys.readouterr().out == 'first\n second\n  - café\n'
+        assert lines == []
+
+    def test_prints_on_a_tty(self, monkeypatch, capsys):
+        monkeypatch.setattr(main_module, '_IS_TTY', True)
+
+        main_module._emit(['first', 'second'])
+
+        assert capsys.readouterr().out == 'first\nsecond\n'
+
+
+class TestMainQuickTest:
+    """Test when main() runs the extra quick collection test."""
+
+    @pytest.fixture
+    def main_mocks(self, monkeypatch):
+        monkeypatch.delenv('REDDIT_RUN_QUICK_TEST', raising=False)
+        config = RedditConfig(client_id='id', client_secret='secret', user_agent='agent')
+        with patch.object(main_module, 'create_config_from_env', return_value=config), \
+             patch.object(main_module, 'create_reddit_client'), \
+             patch.object(main_module, '_check_reddit_connection') as check, \
+             patch.object(main_module, 'quick_test', return_value=True) as quick, \
+             patch.object(main_module, 'collect_reddit_data',
+                          return_value={'success': False, 'error': 'stopped'}):
+            yield check, quick
+
+    def test_skipped_when_connection_check_read_a_post(self, main_mocks):
+        check, quick = main_mocks
+        check.return_value = (True, [SimpleNamespace(title='post')])
+
+        main_module.main()
+
+        quick.assert_not_called()
+
+    def test_runs_without_sample_post(self, main_mocks):
+        check, quick = main_mocks
+        check.return_value = (True, [])
+
+        main_module.main()
+
+        quick.assert_called_once()
+
+    def test_runs_when_requested(self, main_mocks, monkeypatch):
+        check, quick = main_mocks
+        check.return_value = (True, [SimpleNamespace(title='post')])
+        monkeypatch.setenv('REDDIT_RUN_QUICK_TEST', '1')
+
+        main_module.main()
+
+        quick.assert_called_once()
+
+
+def test_importing_main_does_not_import_praw():
+    repo_root = os.path.join(os.path.dirname(__file__), '..')
+    code = (
+        "import sys; import src.reddit_api.main; "
+        "sys.exit(1 if 'praw' in sys.modules else 0)"
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=repo_root)
+
+    assert result.returncode == 0
+
+
+def test_importing_main_does_not_read_dotenv(tmp_path):
+    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    (tmp_path / '.env').write_text('REDDIT_DOTENV_PROBE=1\n')
+    code = (
+        "import os, sys; sys.path.insert(0, sys.argv[1]); import src.reddit_api.main as m; "
+        "loaded_on_import = 'REDDIT_DOTENV_PROBE' in os.environ; "
+        "m.create_config_from_env(); "
+        "sys.exit(0 if not loaded_on_import and os.environ.get('REDDIT_DOTENV_PROBE') == '1' else 1)"
+    )
+    env = {k: v for k, v in os.environ.items() if k != 'REDDIT_DOTENV_PROBE'}
+    result = subprocess.run([sys.executable, '-c', code, repo_root], cwd=tmp_path, env=env)
+
+    assert result.returncode == 0
+
+
+def test_main_reports_total_batch_time(monkeypatch, capsys):
+    monkeypatch.setattr(main_module, '_IS_TTY', True)
+    config = RedditConfig(client_id='id', client_secret='secret', user_agent='agent')
+    results = {
+        'success': True, 'collection_mode': 'batched', 'completed_subreddits': ['a', 'b'],
+        'failed_subreddits': [], 'success_rate': 100.0, 'total_posts_collected': 3,
+        'total_comments_collected': 4, 'database_summary': {},
+        'batch_results': [
+            {'subreddit': 'a', 'batch_metrics': {'posts_count': 1, 'comments_count': 2,
+                                                 'processing_time_seconds': 1.25}},
+            {'subreddit': 'b', 'batch_metrics': {'posts_count': 2, 'comments_count': 2}},
+        ]
+    }
+    with patch.object(main_module, 'create_config_from_env', return_value=config), \
+         patch.object(main_module, 'create_reddit_client'), \
+         patch.object(main_module, '_check_reddit_connection', return_value=(True, ['post'])), \
+         patch.object(main_module, 'collect_reddit_data', return_value=results):
+        main_module.main()
+
+    output = capsys.readouterr().out
+    assert 'r/a: 1P, 2C (1.25s)' in output
+    assert 'r/b: 2P, 2C (0.00s)' in output
+    assert 'Total processing time: 1.25s' in output
+
+
+def test_importing_main_leaves_logging_unconfigured():
+    repo_root = os.path.join(os.path.dirname(__file__), '..')
+    code = (
+        "import logging, sys; import src.reddit_api.main; "
+        "sys.exit(1 if logging.getLogger().handlers else 0)"
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=repo_root)
+
+    assert result.returncode == 0
@@ -0,0 +1,806 @@
+"""
+Tests for Reddit Data Storage
+
+Covers the SQLite storage paths used by the collectors and dashboards.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.reddit_api.models import RedditPost, RedditComment
+from src.reddit_api import storage as storage_module
+from src.reddit_api.storage import RedditDataStorage
+
+
+@pytest.fixture
+def temp_db():
+    """Create temporary database for testing."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    yield path
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.unlink(path + suffix)
+
+
+@pytest.fixture
+def storage(temp_db, monkeypatch):
+    """SQLite-backed storage, regardless of any DATABASE_URL in the environment."""
+    monkeypatch.delenv('DATABASE_URL', raising=False)
+    return RedditDataStorage(temp_db)
+
+
+def make_post(post_id, subreddit='test', timestamp=None, title='Test post', content=''):
+    return RedditPost(
+        id=post_id,
+        title=title,
+        content=content,
+        upvotes=10,
+        timestamp=timestamp or datetime.now(),
+        subreddit=subreddit,
+        author='author',
+        author_karma=100,
+        url='https://reddit.com/test',
+        num_comments=1
+    )
+
+
+def make_comment(comment_id, post_id, subreddit='test', timestamp=None, content='Test comment'):
+    return RedditComment(
+        id=comment_id,
+        parent_id=post_id,
+        content=content,
+        upvotes=1,
+        timestamp=timestamp or datetime.now(),
+        subreddit=subreddit,
+        author='commenter',
+        author_karma=10,
+        post_id=post_id
+    )
+
+
+class TestCollectionMetadata:
+    """Test collection metadata bookkeeping."""
+
+    def test_batch_metadata_feeds_efficiency_stats(self, storage):
+        now = datetime.now()
+        storage.update_collection_metadata_batch([
+            ('a', now, 4, 10),
+            ('b', now, 2, 0),
+        ])
+        storage.update_collection_metadata('a', now, 6, 2)
+
+        stats = storage.get_collection_efficiency_stats(days_back=1)
+        assert stats['total_collections'] == 3
+        assert stats['total_posts_collected'] == 12
+        assert stats['total_comments_collected'] == 12
+
+        stats_a = storage.get_collection_efficiency_stats(subreddit='a', days_back=1)
+        assert stats_a['total_collections'] == 2
+
+    def test_empty_batch_is_a_no_op(self, storage):
+        storage.update_collection_metadata_batch([])
+
+
+class TestStoreStream:
+    """Test batched storage of streamed collection output."""
+
+    def test_stores_posts_and_comments_in_batches(self, storage):
+        items = []
+        for i in range(5):
+            items.append(('post', make_post(f'post_{i}')))
+            items.append(('comment', make_comment(f'comment_{i}', f'post_{i}')))
+
+        counts = storage.store_stream(iter(items), batch_size=2)
+
+        assert counts == {'posts_stored': 5, 'comments_stored': 5}
+        summary = storage.get_data_summary()
+        assert summary['total_posts'] == 5
+        assert summary['total_comments'] == 5
+
+    def test_empty_stream(self, storage):
+        assert storage.store_stream(iter([])) == {'posts_stored': 0, 'comments_stored': 0}
+
+    def test_invalid_rows_are_skipped(self, storage):
+        bad = make_post('bad')
+        bad.title = None
+        items = [('post', make_post('ok')), ('post', bad), ('post', make_post('ok'))]
+
+        counts = storage.store_stream(iter(items))
+
+        assert counts == {'posts_stored': 1, 'comments_stored': 0}
+        assert storage.load_recent_post_ids() == {'ok'}
+
+    def test_connection_not_held_while_consuming(self, storage):
+        def items():
+            # Another thread must be able to write while the stream waits
+            writer = threading.Thread(target=storage.store_posts, args=([make_post('other')],))
+            writer.start()
+            writer.join(timeout=5)
+            assert not writer.is_alive()
+            yield 'post', make_post('streamed')
+
+        storage.store_stream(items())
+
+        assert storage.load_recent_post_ids() == {'other', 'streamed'}
+
+
+class TestTransactionalStores:
+    """Test the batch and historical-chunk store paths."""
+
+    def bad_post(self):
+        post = make_post('bad')
+        post.title = None
+        return post
+
+    def test_store_batch_skips_invalid_and_repeated_rows(self, storage):
+        statements = []
+        with storage._connect() as conn:
+            conn.set_trace_callback(statements.append)
+
+        result = storage.store_batch({
+            'subreddit': 'test',
+            'posts': [make_post('p1'), self.bad_post(), make_post('p1'), make_post('p2')],
+            'comments': [make_comment('c1', 'p1'), make_comment('c1', 'p1')],
+            'collection_time': datetime.now().isoformat(),
+        })
+
+        with storage._connect() as conn:
+            conn.set_trace_callback(None)
+        assert (result['posts_stored'], result['comments_stored']) == (2, 1)
+        assert storage.load_recent_post_ids() == {'p1', 'p2'}
+        assert 'BEGIN IMMEDIATE' in statements
+
+    def test_store_historical_chunk_isolates_rejected_rows(self, storage):
+        now = datetime.now()
+        # Rejected by the database rather than the NOT NULL prefilter
+        with storage._connect() as conn:
+            conn.execute('''CREATE TRIGGER reject_p2 BEFORE INSERT ON posts
+                            WHEN new.id = 'p2' BEGIN SELECT RAISE(ABORT, 'rejected'); END''')
+
+        stored = storage.store_historical_chunk(
+            [make_post(f'p{i}') for i in range(4)], [], {'test': (4, 0)}, now - timedelta(days=1), now
+        )
+
+        assert stored == {'posts_stored': 3, 'comments_stored': 0}
+        assert storage.load_recent_post_ids() == {'p0', 'p1', 'p3'}
+        assert len(storage.completed_chunks()) == 1
+
+
+class TestRecentPostIds:
+    """Test loading recent post IDs for fetch-time deduplication."""
+
+    def test_returns_newest_ids_up_to_limit(self, storage):
+        now = datetime.now()
+        storage.store_posts([
+            make_post(f'post_{i}', timestamp=now - timedelta(hours=i)) for i in range(5)
+        ])
+
+        assert storage.load_recent_post_ids(limit=2) == {'post_0', 'post_1'}
+        assert len(storage.load_recent_post_ids()) == 5
+
+
+class TestPostCollectionReport:
+    """Test the combined post-collection report."""
+
+    def test_matches_individual_queries(self, storage):
+        now = datetime.now()
+        storage.store_posts([make_post('post_1'), make_post('post_2', subreddit='other')])
+        storage.update_collection_metadata_batch([('test', now, 2, 0)])
+        storage.store_batch({
+            'subreddit': 'test', 'posts': [make_post('post_3')], 'comments': [],
+            'collection_time': now.isoformat()
+        })
+
+        report = storage.get_post_collection_report(days_back=7, batch_limit=5)
+
+        assert report['summary'] == storage.get_data_summary()
+        assert report['efficiency_stats'] == storage.get_collection_efficiency_stats(days_back=7)
+        assert report['batch_history'] == storage.get_batch_collection_history(limit=5)
+        assert len(report['batch_history']) == 1
+
+    def test_batch_history_optional(self, storage):
+        storage.update_collection_metadata_batch([('test', datetime.now(), 1, 0)])
+
+        report = storage.get_post_collection_report(include_batch_history=False)
+
+        assert report['batch_history'] is None
+
+
+class TestStorePosts:
+    """Test batched post/comment inserts and the per-row fallback."""
+
+    def test_batch_insert_returns_row_count(self, storage):
+        assert storage.store_posts([make_post(f'post_{i}') for i in range(3)]) == 3
+        assert storage.store_comments([make_comment('comment_1', 'post_0')]) == 1
+
+        summary = storage.get_data_summary()
+        assert summary['total_posts'] == 3
+        assert summary['total_comments'] == 1
+
+    def test_rows_missing_required_fields_are_skipped(self, storage):
+        posts = [make_post('post_1'), make_post('post_2', title=None), make_post('post_3')]
+
+        assert storage.store_posts(posts) == 2
+        assert storage.load_recent_post_ids() == {'post_1', 'post_3'}
+
+    def test_failed_batch_falls_back_to_per_row_inserts(self, storage):
+        bad = make_post('post_2')
+        bad.upvotes = ['not', 'bindable']
+
+        assert storage.store_posts([make_post('post_1'), bad, make_post('post_3')]) == 2
+        assert storage.load_recent_post_ids() == {'post_1', 'post_3'}
+
+    def test_bad_rows_are_isolated_without_row_by_row_pass(self, storage):
+        posts = [make_post(f'post_{i}') for i in range(16)]
+        posts[5].upvotes = ['not', 'bindable']
+
+        with patch.object(storage, '_insert_rows', wraps=storage._insert_rows) as insert_rows:
+            assert storage.store_posts(posts) == 15
+
+        # 1 full batch + 2 calls per level of the bisection down to the bad row
+        assert insert_rows.call_count == 9
+        assert len(storage.load_recent_post_ids()) == 15
+
+class TestSqlitePragmas:
+    """Test SQLite journal and connection settings."""
+
+    def test_database_uses_wal(self, storage):
+        with storage._connect() as conn:
+            assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+            assert conn.execute('PRAGMA synchronous').fetchone()[0] == 1
+
+    def test_new_database_uses_larger_pages(self, storage):
+        with storage._connect() as conn:
+            assert conn.execute('PRAGMA page_size').fetchone()[0] == 8192
+            assert conn.execute('PRAGMA mmap_size').fetchone()[0] == 268435456
+
+
+class TestSharedConnection:
+    """Test reuse of a single SQLite connection across calls."""
+
+    def test_calls_reuse_one_connection(self, storage):
+        with storage._connect() as first:
+            pass
+        storage.store_posts([make_post('post_1')])
+        with storage._connect() as second:
+            assert second is first
+
+    def test_close_reopens_on_next_use(self, storage):
+        storage.store_posts([make_post('post_1')])
+        storage.close()
+
+        assert storage._sqlite is None
+        assert storage.get_data_summary()['total_posts'] == 1
+
+    def test_close_runs_optimize(self, storage):
+        statements = []
+        with storage._connect() as conn:
+            conn.set_trace_callback(statements.append)
+
+        storage.close()
+
+        assert 'PRAGMA optimize' in statements
+
+    def test_reads_do_not_wait_for_open_write(self, storage):
+        storage.store_posts([make_post('post_1')])
+        result = {}
+
+        with storage._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute("UPDATE posts SET title = 'pending' WHERE id = 'post_1'")
+            reader = threading.Thread(
+                target=lambda: result.update(ids=storage.load_recent_post_ids(),
+                                             posts=storage.query_posts())
+            )
+            reader.start()
+            reader.join(timeout=5)
+
+            # The reader sees the last committed state while the write is open
+            assert not reader.is_alive()
+            assert result['ids'] == {'post_1'}
+            assert list(result['posts']['title']) == ['Test post']
+
+
+class TestBulkStorePosts:
+    """Test the drop-and-rebuild-indexes bulk insert path."""
+
+    def index_names(self, storage):
+        with storage._connect() as conn:
+            rows = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'posts'"
+                " AND name LIKE 'idx_%'"
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def test_indexes_are_recreated(self, storage):
+        before = self.index_names(storage)
+
+        assert storage.bulk_store_posts([make_post(f'post_{i}') for i in range(10)]) == 10
+
+        assert self.index_names(storage) == before
+        assert storage.get_data_summary()['total_posts'] == 10
+
+    def test_indexes_kept_when_table_is_larger(self, storage):
+        storage.store_posts([make_post(f'old_{i}') for i in range(10)])
+        statements = []
+        with storage._connect() as conn:
+            conn.set_trace_callback(statements.append)
+
+        assert storage.bulk_store_posts([make_post(f'post_{i}') for i in range(5)]) == 5
+
+        with storage._connect() as conn:
+            conn.set_trace_callback(None)
+        assert not any(sql.startswith('DROP INDEX') for sql in statements)
+        assert storage.get_data_summary()['total_posts'] == 15
+
+    def test_store_posts_uses_bulk_path_above_threshold(self, storage, monkeypatch):
+        monkeypatch.setattr(storage_module, '_BULK_INSERT_THRESHOLD', 2)
+
+        with patch.object(storage, 'bulk_store_posts', wraps=storage.bulk_store_posts) as bulk:
+            storage.store_posts([make_post(f'post_{i}') for i in range(3)])
+            storage.store_posts([make_post('post_9')])
+
+        assert bulk.call_count == 1
+
+
+class TestExportToJson:
+    """Test the streaming JSON export."""
+
+    def test_export_round_trips(self, storage, tmp_path):
+        storage.store_posts([make_post('post_1'), make_post('post_2')])
+        storage.store_comments([make_comment('comment_1', 'post_1')])
+
+        path = storage.export_to_json(str(tmp_path / 'export.json'))
+
+        with open(path) as f:
+            data = json.load(f)
+        assert sorted(p['id'] for p in data['posts']) == ['post_1', 'post_2']
+        assert data['comments'][0]['post_id'] == 'post_1'
+        assert data['metrics'] == []
+        assert data['summary']['total_posts'] == 2
+        assert 'export_timestamp' in data
+
+    def test_export_reads_on_background_thread(self, storage, tmp_path):
+        storage.store_posts([make_post(f'post_{i}') for i in range(2500)])
+
+        with patch.object(storage_module, '_iter_in_thread',
+                          wraps=storage_module._iter_in_thread) as in_thread:
+            path = storage.export_to_json(str(tmp_path / 'export.json'))
+
+        in_thread.assert_called_once()
+        with open(path) as f:
+            assert len(json.load(f)['posts']) == 2500
+
+    def test_export_without_orjson_matches(self, storage, tmp_path, monkeypatch):
+        storage.store_posts([make_post('post_1', title='Café "quoted"')])
+        with_orjson = storage.export_to_json(str(tmp_path / 'a.json'))
+        monkeypatch.setattr(storage_module, 'orjson', None)
+        without_orjson = storage.export_to_json(str(tmp_path / 'b.json'))
+
+        with open(with_orjson, encoding='utf-8') as a, open(without_orjson, encoding='utf-8') as b:
+            assert json.load(a)['posts'] == json.load(b)['posts']
+
+
+class TestQueries:
+    """Test the DataFrame and row-iterator query paths."""
+
+    def test_query_posts_filters_and_orders(self, storage):
+        now = datetime.now()
+        storage.store_posts([
+            make_post('old', timestamp=now - timedelta(hours=2), title='Inflation news'),
+            make_post('new', timestamp=now, title='Inflation today'),
+            make_post('other', subreddit='other', title='Inflation elsewhere'),
+            make_post('unrelated', title='Sports'),
+        ])
+
+        df = storage.query_posts(subreddit='test', keywords=['inflation'])
+        rows = list(storage.query_posts_iter(subreddit='test', keywords=['inflation']))
+
+        assert list(df['id']) == ['new', 'old']
+        assert [row['id'] for row in rows] == ['new', 'old']
+        assert rows[0]['title'] == 'Inflation today'
+
+    def test_query_comments_by_post(self, storage):
+        storage.store_comments([make_comment('c1', 'p1'), make_comment('c2', 'p2')])
+
+        assert list(storage.query_comments(post_id='p1')['id']) == ['c1']
+        assert [row['id'] for row in storage.query_comments_iter(post_id='p2')] == ['c2']
+
+    def test_empty_result_keeps_columns(self, storage):
+        df = storage.query_posts()
+
+        assert df.empty
+        assert 'title' in df.columns
+
+    def test_subreddit_query_is_served_in_index_order(self, storage):
+        query, params = storage._posts_query('test', 10, None)
+        with storage._connect() as conn:
+            plan = ' '.join(row[3] for row in conn.execute(f'EXPLAIN QUERY PLAN {query}', params))
+
+        assert 'idx_posts_sub_ts_id' in plan
+        assert 'TEMP B-TREE' not in plan
+
+    def test_id_lookups_use_covering_indexes(self, storage):
+        with storage._connect() as conn:
+            post_plan = conn.execute(
+                'EXPLAIN QUERY PLAN SELECT id FROM posts WHERE subreddit = ? AND timestamp > ?', ('a', 'b')
+            ).fetchone()[3]
+            comment_plan = conn.execute(
+                'EXPLAIN QUERY PLAN SELECT id FROM comments WHERE post_id IN (?, ?)', ('a', 'b')
+            ).fetchone()[3]
+
+        assert 'COVERING INDEX idx_posts_sub_ts_id' in post_plan
+        assert 'COVERING INDEX idx_comments_post_ts_id' in comment_plan
+
+    def test_subreddit_stats(self, storage):
+        storage.store_posts([make_post('p1'), make_post('p2'), make_post('p3', subreddit='other')])
+
+        stats = storage.get_subreddit_stats()
+
+        assert list(stats['subreddit']) == ['test', 'other']
+        assert list(stats['post_count']) == [2, 1]
+
+
+class TestKeywordSearch:
+    """Test full-text keyword search over posts."""
+
+    def test_matches_substrings_in_title_or_content(self, storage):
+        storage.store_posts([
+            make_post('p1', title='Inflationary pressure'),
+            make_post('p2', title='Markets', content='Rates and INFLATION'),
+            make_post('p3', title='Sports'),
+        ])
+
+        df = storage.query_posts(keywords=['inflation'])
+
+        assert sorted(df['id']) == ['p1', 'p2']
+
+    def test_index_follows_replaced_and_deleted_posts(self, storage):
+        storage.store_posts([make_post('p1', title='Inflation talk')])
+        storage.store_posts([make_post('p1', title='Sports talk')])
+
+        assert storage.query_posts(keywords=['inflation']).empty
+        assert list(storage.query_posts(keywords=['sports'])['id']) == ['p1']
+
+        storage.cleanup_old_data(days_to_keep=-1)
+        assert storage.query_posts(keywords=['sports']).empty
+
+    def test_existing_posts_are_backfilled(self, temp_db, monkeypatch):
+        monkeypatch.delenv('DATABASE_URL', raising=False)
+        storage = RedditDataStorage(temp_db)
+        storage.store_posts([make_post('p1', title='Inflation talk')])
+        with storage._connect() as conn:
+            conn.execute('DROP TABLE posts_fts')
+        storage.close()
+
+        reopened = RedditDataStorage(temp_db)
+
+        assert list(reopened.query_posts(keywords=['inflation'])['id']) == ['p1']
+
+    def test_rebuild_restores_index_out_of_step_with_posts(self, storage):
+        storage.store_posts([make_post('p1', title='Inflation talk')])
+        # Stand-in for a VACUUM that renumbered posts rowids under the index
+        with storage._connect() as conn:
+            conn.execute('UPDATE posts_fts SET rowid = rowid + 1000')
+        assert storage.query_posts(keywords=['inflation']).empty
+
+        assert storage.rebuild_search_index()
+
+        assert list(storage.query_posts(keywords=['inflation'])['id']) == ['p1']
+
+    def test_matches_mid_word_keywords(self, storage):
+        storage.store_posts([
+            make_post('p1', title='OpenAI releases a model'),
+            make_post('p2', title='Trying ChatGPT today'),
+            make_post('p3', title='Sports'),
+        ])
+
+        # 'AI' is shorter than a trigram, so it is answered by LIKE alone
+        assert sorted(storage.query_posts(keywords=['AI'])['id']) == ['p1']
+        assert sorted(storage.query_posts(keywords=['gpt'])['id']) == ['p2']
+
+    def test_punctuated_keywords_match_literally(self, storage):
+        storage.store_posts([
+            make_post('p1', title='Learning C++ templates'),
+            make_post('p2', title='Cats and coffee'),
+            make_post('p3', title='U.S. inflation data'),
+        ])
+
+        assert list(storage.query_posts(keywords=['C++'])['id']) == ['p1']
+        assert list(storage.query_posts(keywords=['U.S.'])['id']) == ['p3']
+
+    def test_word_tokenized_index_is_rebuilt(self, temp_db, monkeypatch):
+        monkeypatch.delenv('DATABASE_URL', raising=False)
+        storage = RedditDataStorage(temp_db)
+        storage.store_posts([make_post('p1', title='OpenAI news')])
+        with storage._connect() as conn:
+            conn.execute('DROP TABLE posts_fts')
+            conn.execute('CREATE VIRTUAL TABLE posts_fts USING fts5(title, content)')
+        storage.close()
+
+        reopened = RedditDataStorage(temp_db)
+
+        assert list(reopened.query_posts(keywords=['penAI'])['id']) == ['p1']
+
+    def test_quotes_in_keywords_are_escaped(self, storage):
+        storage.store_posts([make_post('p1', title='Fed says "pause"')])
+
+        assert list(storage.query_posts(keywords=['"pause'])['id']) == ['p1']
+
+
+class TestSummaryCache:
+    """Test caching of the summary queries."""
+
+    def test_repeat_calls_are_cached(self, storage):
+        storage.store_posts([make_post('p1')])
+        first = storage.get_data_summary()
+
+        with patch.object(storage, '_data_summary') as data_summary:
+            assert storage.get_data_summary() == first
+            data_summary.assert_not_called()
+
+    def test_writes_invalidate_cache(self, storage):
+        assert storage.get_data_summary()['total_posts'] == 0
+        assert storage.get_subreddit_stats().empty
+
+        storage.store_posts([make_post('p1')])
+
+        assert storage.get_data_summary()['total_posts'] == 1
+        assert list(storage.get_subreddit_stats()['post_count']) == [1]
+
+    def test_cached_results_are_copies(self, storage):
+        storage.get_data_summary()['total_posts'] = 99
+
+        assert storage.get_data_summary()['total_posts'] == 0
+
+    def test_commit_from_other_connection_invalidates_cache(self, storage):
+        assert storage.get_data_summary()['total_posts'] == 0
+
+        other = RedditDataStorage(storage.db_path)
+        other.store_posts([make_post('p1')])
+        other.close()
+
+        assert storage.get_data_summary()['total_posts'] == 1
+
+    def test_efficiency_stats_cached_per_arguments(self, storage):
+        now = datetime.now()
+        storage.update_collection_metadata_batch([('test', now, 5, 2), ('other', now, 1, 0)])
+
+        assert storage.get_collection_efficiency_stats('test')['total_posts_collected'] == 5
+        assert storage.get_collection_efficiency_stats()['total_posts_collected'] == 6
+
+        storage.update_collection_metadata_batch([('test', now, 3, 0)])
+
+        assert storage.get_collection_efficiency_stats('test')['total_posts_collected'] == 8
+
+    def test_zero_ttl_disables_cache(self, temp_db, monkeypatch):
+        monkeypatch.delenv('DATABASE_URL', raising=False)
+        storage = RedditDataStorage(temp_db, summary_cache_ttl=0)
+        storage.get_data_summary()
+
+        with patch.object(storage, '_data_summary', return_value={}) as data_summary:
+            storage.get_data_summary()
+            data_summary.assert_called_once()
+
+
+class TestCleanupOldData:
+    """Test chunked deletion of old posts and comments."""
+
+    def test_deletes_only_old_rows_across_chunks(self, storage):
+        old = datetime.now() - timedelta(days=60)
+        storage.store_posts([make_post(f'old_{i}', timestamp=old) for i in range(5)] + [make_post('new')])
+        storage.store_comments([make_comment(f'c_{i}', 'old_0', timestamp=old) for i in range(3)])
+
+        assert storage.cleanup_old_data(days_to_keep=30, chunk_size=2) == 8
+        assert storage.load_recent_post_ids() == {'new'}
+        assert storage.get_data_summary()['total_comments'] == 0
+
+
+class TestUpserts:
+    """Test duplicate handling on insert."""
+
+    def test_duplicates_within_batch_keep_last(self, storage):
+        first = make_post('p1', title='First')
+        second = make_post('p1', title='Second')
+
+        assert storage.store_posts([first, second]) == 1
+        assert list(storage.query_posts()['title']) == ['Second']
+
+    def test_changed_rows_are_updated_in_place(self, storage):
+        storage.store_posts([make_post('p1')])
+        with storage._connect() as conn:
+            rowid = conn.execute("SELECT rowid FROM posts WHERE id = 'p1'").fetchone()[0]
+
+        updated = make_post('p1')
+        updated.upvotes = 500
+        storage.store_posts([updated])
+
+        with storage._connect() as conn:
+            row = conn.execute("SELECT rowid, upvotes FROM posts WHERE id = 'p1'").fetchone()
+        assert tuple(row) == (rowid, 500)
+
+    def test_unchanged_rows_are_not_rewritten(self, storage):
+        post = make_post('p1', title='Inflation talk')
+        storage.store_posts([post])
+        with storage._connect() as conn:
+            before = conn.total_changes
+
+        storage.store_posts([post])
+
+        with storage._connect() as conn:
+            assert conn.total_changes == before
+        assert list(storage.query_posts(keywords=['inflation'])['id']) == ['p1']
+
+    def test_row_columns_match_table_schema(self, storage):
+        with storage._connect() as conn:
+            post_cols = [row[1] for row in conn.execute('PRAGMA table_info(posts)')]
+            comment_cols = [row[1] for row in conn.execute('PRAGMA table_info(comments)')]
+
+        assert post_cols[:-1] == list(storage_module._POST_COLUMNS)
+        assert comment_cols[:-1] == list(storage_module._COMMENT_COLUMNS)
+        assert storage_module._post_row(make_post('p1'))[0] == 'p1'
+
+    def test_postgres_translation_uses_distinct_from(self):
+        sql = storage_module._CompatCursor(None)._translate(storage_module._POST_UPSERT_SQL)
+
+        assert 'IS DISTINCT FROM excluded.upvotes' in sql
+        assert 'IS NOT excluded' not in sql
+        assert '%s' in sql and '?' not in sql
+
+
+class TestDataSummary:
+    """Test the stored-data summary."""
+
+    def test_summary_counts_and_size(self, storage):
+        now = datetime.now()
+        storage.store_posts([
+            make_post('p1', timestamp=now - timedelta(days=1)),
+            make_post('p2', subreddit='other', timestamp=now),
+        ])
+        storage.store_comments([make_comment('c1', 'p1')])
+
+        summary = storage.get_data_summary()
+
+        assert summary['total_posts'] == 2
+        assert summary['total_comments'] == 1
+        assert summary['unique_subreddits'] == 2
+        assert summary['earliest_post'] < summary['latest_post']
+        with storage._connect() as conn:
+            page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+            page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+        assert summary['database_size_mb'] == page_count * page_size / 1024 / 1024
+        assert summary['database_size_mb'] > 0
+
+
+class TestIterInThread:
+    """Test the background-thread iterator used by the export."""
+
+    def test_yields_items_in_order(self):
+        assert list(storage_module._iter_in_thread(lambda: iter(range(10)), maxsize=2)) == list(range(10))
+
+    def test_producer_errors_are_reraised(self):
+        def produce():
+            yield 1
+            raise ValueError('boom')
+
+        items = storage_module._iter_in_thread(produce)
+        assert next(items) == 1
+        with pytest.raises(ValueError, match='boom'):
+            next(items)
+
+    def test_stopping_early_closes_producer(self):
+        closed = []
+
+        def produce():
+            try:
+                for i in range(1000):
+                    yield i
+            finally:
+                closed.append(True)
+
+        items = storage_module._iter_in_thread(produce, maxsize=1)
+        assert next(items) == 0
+        items.close()
+
+        assert closed == [True]
+
+
+class TestOrphanedComments:
+    """Test detection and removal of comments whose post is missing."""
+
+    def test_orphans_counted_and_removed(self, storage):
+        storage.store_posts([make_post('p1')])
+        storage.store_comments([
+            make_comment('c1', 'p1'),
+            make_comment('c2', 'missing'),
+            make_comment('c3', None),
+        ])
+
+        assert storage.get_duplicate_stats()['orphaned_comments'] == 1
+
+        result = storage.deduplicate_database()
+
+        assert result['orphaned_comments_removed'] == 1
+        assert set(storage.query_comments()['id']) == {'c1', 'c3'}
+
+    def test_content_duplicates_grouped_by_column(self, storage):
+        storage.store_posts([
+            make_post('p1', title='Same'), make_post('p2', title='Same'), make_post('p3', title='Same'),
+            # Concatenated keys would collide: 'ab' + 'c' == 'a' + 'bc'
+            make_post('p4', title='ab', subreddit='c'), make_post('p5', title='a', subreddit='bc'),
+        ])
+
+        stats = storage.get_duplicate_stats()
+
+        assert stats['duplicate_posts_by_content'] == 2
+        assert stats['duplicate_comments_by_content'] == 0
+
+    def test_dedupe_releases_freed_pages(self, storage):
+        storage.store_posts([make_post(f'p{i}', content='x' * 2000) for i in range(200)])
+
+        result = storage.deduplicate_database()
+
+        assert result['posts_removed_by_content'] == 199
+        # The first stored row of each content group survives
+        assert list(storage.query_posts()['id']) == ['p0']
+        with storage._connect() as conn:
+            assert conn.execute('PRAGMA auto_vacuum').fetchone()[0] == 2
+            assert conn.execute('PRAGMA freelist_count').fetchone()[0] == 0
+
+
+class TestExistingCommentIds:
+    """Test comment ID lookups by post."""
+
+    def test_small_and_large_post_id_lists(self, storage):
+        storage.store_comments([make_comment(f'c{i}', f'p{i}') for i in range(1200)])
+
+        assert storage.get_existing_comment_ids(['p1', 'p2', 'nope']) == {'c1', 'c2'}
+
+        post_ids = [f'p{i}' for i in range(0, 1200, 2)] + ['nope', 'p0']
+        assert storage.get_existing_comment_ids(post_ids) == {f'c{i}' for i in range(0, 1200, 2)}
+
+        # The temporary table is dropped, so repeat lookups start clean
+        assert storage.get_existing_comment_ids([f'p{i}' for i in range(1, 1200, 2)]) == {
+            f'c{i}' for i in range(1, 1200, 2)
+        }
+
+
+class TestStorePostsDf:
+    """Test storing posts straight from a DataFrame."""
+
+    def test_round_trips_query_posts_output(self, storage, tmp_path):
+        storage.store_posts([make_post('p1', content=None), make_post('p2', subreddit='other')])
+        df = storage.query_posts()
+
+        copy = RedditDataStorage(str(tmp_path / 'copy.db'))
+        assert copy.store_posts_df(df) == 2
+
+        copied = copy.query_posts()
+        columns = list(storage_module._POST_COLUMNS)
+        assert copied[columns].equals(df[columns])
+        with copy._connect() as conn:
+            assert conn.execute("SELECT content FROM posts WHERE id = 'p1'").fetchone()[0] is None
+
+    def test_skips_rows_missing_title(self, storage):
+        df = pd.DataFrame([make_post('p1').to_dict(), make_post('p2').to_dict()])
+        df.loc[1, 'title'] = None
+
+        assert storage.store_posts_df(df) == 1
+        assert storage.load_recent_post_ids() == {'p1'}
+
+    def test_missing_columns_raise(self, storage):
+        df = pd.DataFrame([make_post('p1').to_dict()]).drop(columns=['url'])
+
+        with pytest.raises(ValueError, match='url'):
+            storage.store_posts_df(df)